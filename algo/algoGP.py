@@ -1,395 +1,1291 @@
-import sys
-import warnings
-import random
-import time
-import numpy as np
-
-from algo.chromosomeGP import ChromosomeGP
-from tools.configToolsGP import ConfigToolsGP
-from algo.geneGP import GeneGP
-
-warnings.filterwarnings("ignore")
-"""
-La classe AlgoGP implémente un algorithme génétique programmatique (AGP),:
-
-1. Attributs de la classe (__init__)
-config: Paramètres de configuration pour l'algorithme.
-population: Liste des individus de la population actuelle.
-new_population: Liste des nouveaux individus générés lors de chaque itération.
-inputs et outputs: Données d'entrée et résultats cibles de la fonction à optimiser.
-widget: Interface graphique associée pour le suivi de l'avancement.
-isRunning: Indicateur pour savoir si l'algorithme est en cours d'exécution.
-elapsed_time: Temps écoulé depuis le démarrage de l'algorithme.
-2. Méthodes principales
-- initialise(self, config, inputs, outputs, widget)
-Initialise les paramètres de l'algorithme, y compris les outils mathématiques, les données d'entrée/sortie, et l'interface graphique. Si un "seed" est spécifié, il est utilisé pour initialiser les générateurs aléatoires. Les tailles de l'échantillon et de la population sont également ajustées ici.
-
-- populate_generate(self)
-Crée une population initiale d'individus en utilisant des chromosomes générés de manière aléatoire. Pour chaque individu, l'algorithme calcule la "fitness" (qualité de la solution) en fonction des données d'entrée et de sortie. Si un individu a une "fitness" invalide, il est régénéré jusqu'à ce qu'un individu valide soit trouvé.
-
-- populate_read(self, fichier)
-Charge la population à partir d'un fichier, en lisant chaque ligne et en initialisant les chromosomes correspondants.
-
-- populate_write(self, fichier)
-Sauvegarde la population actuelle dans un fichier, chaque chromosome étant écrit au format approprié.
-
-- populate(self)
-Initialise la population soit par génération aléatoire, soit en la chargeant depuis un fichier, selon la configuration.
-
-- execute(self)
-Exécute l'algorithme génétique, en procédant par itérations. Chaque itération comprend une sélection des meilleurs individus, la reproduction (croisement) et la mutation pour générer la nouvelle population. L'algorithme s'arrête lorsqu'un critère d'arrêt est atteint (nombre maximal d'itérations, seuil de fitness, durée maximale, ou si l'algorithme est arrêté manuellement).
-
-- echantillon_range(self)
-Sélectionne un sous-ensemble d'individus de la population en effectuant un tirage au sort, puis trie ces individus en fonction de leur fitness.
-
-- iterate_generation(self, iteration)
-Gère une itération complète de l'algorithme, où les individus sont croisés pour produire une nouvelle génération. Les individus les plus "fit" sont sélectionnés, croisés et mutés, puis ajoutés à la nouvelle population.
-
-- insert_child(self, child, iteration)
-Insère un enfant dans la nouvelle population, en effectuant éventuellement une mutation et en calculant sa fitness. Si l'enfant est valide, il est ajouté à la population.
-
-- isStop(self)
-Renvoie un booléen indiquant si l'algorithme doit s'arrêter (basé sur l'attribut isRunning).
-
-- setAvancement(self, str_message, pos_value, max_value)
-Met à jour l'interface graphique avec l'état d'avancement de l'algorithme. Utilise le widget pour afficher le progrès sous forme de jauge.
-
-- affiche_resultats(self)
-Affiche les résultats de l'algorithme à l'aide du widget.
-
-- get_best(self)
-Récupère l'individu le plus "fit" de la population actuelle (celui avec la meilleure fitness).
-
-- get_best_iteration(self, iteration)
-Récupère le meilleur individu à une itération donnée parmi les résultats accumulés.
-
-"""
-class AlgoGP():
-
-
-    def __init__(self):
-        """
-        Initialise l'instance de l'algorithme génétique programmatique.
-        """
-        # Initialisation des attributs de l'algorithme
-        self.config=None                    # Paramètres de configuration de l'algorithme
-        self.population = []                # Liste des individus de la population
-        self.population_selection = []    # Liste des individus de l'selection
-        self.new_population=[]              # Liste pour la nouvelle population générée
-        self.inputs=[]                      # Données d'entrée pour l'évaluation de la fitness
-        self.outputs=[]                     # Valeurs cibles pour l'évaluation de la fitness
-        self.widget=None                    # Important : fait office de pointeur entre les calculs effectués et l'interface graphique
-        self.isRunning=False                # Indicateur de l'état de l'exécution de l'algorithme
-        self.elapsed_time=0                 # Temps écoulé depuis le démarrage
-        self.stop=False
-
-
-    def initialise(self,config,inputs,outputs,widget):
-        """
-        Configure les paramètres de l'algorithme.
-        Args:
-            config (obj): classe de configuration.
-            inputs (list): Données d'entrée.
-            outputs (list): Valeurs de la fonction pour les inputs.
-            widget (object): Interface graphique associée.
-        """
-        # Initialisation des attributs à partir des paramètres de configuration
-        self.population = []
-        self.inputs=inputs
-        self.outputs=outputs
-        self.widget=widget
-        self.config=config
-        self.stop=False
-
-        GeneGP.init_fonctions(config)
-        # Initialisation des générateurs aléatoires avec une graine si spécifiée
-        if self.config.seed!=0 :
-            random.seed(self.config.seed)
-            np.random.seed(self.config.seed)
-        # Ajustement de la taille de l'échantillon en fonction de la population
-        if self.config.size_echantillon>self.config.size_population:
-            self.config.size_echantillon=self.config.size_population
-
-
-
-
-    def execute(self):
-        """
-        Lance l'exécution de l'algorithme génétique, comprenant les étapes de sélection,
-        reproduction, mutation et remplacement des individus.
-        """
-        self.population   = []              # Réinitialisation de la population
-        self.best_results = []              # Liste pour stocker les meilleurs résultats à chaque itération
-
-        self.stop=False
-        self.isRunning=True                 # Indicateur que l'algorithme est en cours
-        start_time=time.time()              # Démarrage du chronomètre
-        self.elapsed_time=0
-
-        self.populate()                     # Initialisation de la population
-
-        curent_fitness=sys.float_info.max   # Valeur initiale très élevée pour la fitness
-        iteration=0  
-        # Boucle principale de l'algorithme avec critères d'arrêt
-        while( iteration<self.config.max_iterations   
-                and  curent_fitness>=self.config.seuil_fitness  
-                and self.elapsed_time<=self.config.duree_maximum  
-                and not self.isStop()):
-
-            self.setAvancement("itération",iteration,self.config.max_iterations) #pour la jauge
-
-            self.iterate(iteration)                      # Exécution d'une itération
-            best= self.get_best()                        # Récupération du meilleur individu
-            if best is not None:
-                curent_fitness= best.fitness                 # Mise à jour de la fitness
-                self.elapsed_time = time.time() - start_time # Mise à jour du temps écoulé
-                self.best_results.append(best)               # Sauvegarde des meilleurs résultats
-                self.affiche_chromosome(iteration,best)         #pour le graphe
-                if self.config.verbose :
-                    print(iteration,curent_fitness,best.generation,"[",best.formule,"]")
-            iteration+=1
-
-
-        self.affiche_resultats()                         # Affichage des résultats finaux
-        self.isRunning=False                             # L'algorithme s'est terminé
-
-
-    def populate(self):
-        """
-        Initialise la population 
-        """
-        if self.config.fichier_populate!="" :
-            self.populate_read(self.config.fichier_populate)
-        else:
-            self.populate_generate()
-
-    def iterate(self,iteration):
-        """
-        Gère l'évolution d'une génération : sélection, croisement et mutation.
-        """
-
-        self.new_population=[]                   # Liste pour la nouvelle génération
-
-        self.population_selection=self.selection()       # Sélection des individus pour cette génération
-        size=len(self.population_selection)
- 
-        i=0
-        while i <size//2:
-            mother,father=self.mariage(i, size)
-            # Croisement pour produire deux enfants
-            child1,child2  = self.croisement(mother, father)
-            child1=self.mutate(child1)   
-            if child1 is not None:
-                child1.generation=iteration
-                self.new_population.append(child1)              # Ajout à la nouvelle population
-            child2=self.mutate(child2)   
-            if child2 is not None:
-                child2.generation=iteration
-                self.new_population.append(child2)              # Ajout à la nouvelle population
-            i+=1
-        # Mise à jour de la population actuelle
-        self.remplacement()
-
-    def selection(self):
-        """
-        Sélectionne un sous-ensemble d'individus pour la reproduction.
-        """
-  
-        if  self.config.mode_selection==self.config.SELECTION_BEST:
-            self.population.sort(reverse=False,key=lambda x:x.fitness)                      # Tri de population par fitness croissante
-            selection=self.population[0:self.config.size_echantillon]              # Échantillonnage des best
-        elif  self.config.mode_selection==self.config.SELECTION_WORST:
-            self.population.sort(reverse=True,key=lambda x:x.fitness)                       # Tri de population par fitness decroissante
-            selection=self.population[0:self.config.size_echantillon]              # Échantillonnage des worst
-        else: #self.config.mode_selection==self.config.SELECTION_RANDOM:
-            selection=random.sample(self.population, self.config.size_echantillon) # Échantillonnage aléatoire
-
-        selection.sort(reverse=False,key=lambda x:x.fitness)                       # Tri des individus par fitness 
-        return selection
-
-    def mariage(self,pos, size):
-        """
-        sélection d'un couple de deux chromosomes.
-        """
- 
-        if  self.config.mode_mariage==self.config.MARIAGE_BEST:
-            mother = self.population_selection[2*pos]
-            father = self.population_selection[2*pos+1]
-        elif  self.config.mode_mariage==self.config.MARIAGE_EXTREME:
-            mother = self.population_selection[pos]
-            father = self.population_selection[size-pos-1]
-        else: # self.config.mode_mariage==self.config.MARIAGE_RAND:
-            mother = self.population_selection[np.random.randint(size)]
-            father = self.population_selection[np.random.randint(size)]
-        return mother,father
-
-    def croisement(self,mother, father):
-        """
-        croisement de deux chromosommes (mother, father).
-        """
-        # Créer de nouveaux enfanst en croisant les gènes des deux chromosomes (mère et père)
-        if  self.config.mode_croisement==self.config.CROISEMENT_MIDDLE:
-            return ChromosomeGP.croisement_middle(mother, father)
-        elif  self.config.mode_croisement==self.config.CROISEMENT_ABSORPTION_PARTIELLE :
-            return ChromosomeGP.croisement_absorption_partielle(mother, father)
-        else  :# self.config.mode_croisement==self.config.CROISEMENT_ABSORPTION_TOTALE :
-            return ChromosomeGP.croisement_absorption_totale(mother, father)
-  
-    def mutate(self,child):
-        """
-        Ajoute un enfant à la nouvelle population, avec éventuellement une mutation.
-        """
-        if child is None :
-            return None
-        tolerence=random.random()
-        depth=child.depth
-        # Vérification de la profondeur maximale
-        if depth > self.config.max_depth :
-            if tolerence < self.config.tolerance_gene_Length:
-                return None
-
-        if tolerence > self.config.tolerance_gene_Mutate:
-            if  self.config.mode_mutation==self.config.MUTATION_DEPLACE:
-                child.mutate_deplace () 
-            elif  self.config.mode_mutation==self.config.MUTATION_SWAP:
-                child.mutate_swap() 
-            else  :# self.config.mode_mutation==self.config.MUTATION_REPLACE :
-                child.mutate_remplace() 
-
-        child.calculate_fitness(self.inputs, self.outputs) # Calcul de la fitness
-        if not child.isFitnessValide():                    # Si l'enfant est non valide
-                return None
-        return  child      
-
-    def remplacement(self):
-        """
-        remplacement un sous-ensemble d'individus pour la reproduction.
-        """
-
-        if  self.config.mode_remplacement == self.config.REMPLACEMENT_CHILD_ONLY:
-            self.population=self.new_population.copy()                                      # remplacer la population par les enfants 
-        elif  self.config.mode_remplacement == self.config.REMPLACEMENT_CHILD_ADD:
-            self.population+=self.new_population                                            # ajouter les enfants  à la population 
-        elif  self.config.mode_remplacement == self.config.REMPLACEMENT_MIXT_RAND:
-            self.population+=self.new_population
-            self.population=random.sample(self.population, self.config.size_population)     # Limitation à la taille de la population
-        else:#  self.config.mode_remplacement == self.config.REMPLACEMENT_MIXT_BEST:
-            self.population+=self.new_population                                            # mixer parents et enfants
-            self.population.sort(reverse=False,key=lambda x:x.fitness)                      # Tri par fitness
-            self.population=self.population[0:self.config.size_population]                  # Limitation à la taille de la population
- 
-        self.config.size_population=len(self.population)
-        if self.config.size_echantillon>self.config.size_population:
-            self.config.size_echantillon=self.config.size_population
-
-
-#------------------------------------------------------------------------
-    def populate_generate(self):
-        """
-        Initialise la population en créant des individus jusqu'à atteindre la taille spécifiée.
-        """
-        for i in range(self.config.size_population):
-            if self.isStop():
-                break
-            newitem=ChromosomeGP(self.config,  'rand')
-            newitem.calculate_fitness(self.inputs, self.outputs)
-            # Regénération des individus jusqu'à obtenir une fitness valide
-            while not newitem.isFitnessValide() :
-                if self.isStop():
-                    break
-
-                newitem.initialise_Item("rand")
-                newitem.calculate_fitness(self.inputs, self.outputs) 
-                if(self.config.verbose):
-                    print(".",end='',flush=True)
-            # Ajout de l'individu à la population
-            self.population.append(newitem)
-            self.setAvancement("Création de populations",i,self.config.size_population) # Mise à jour de l'interface graphique
-            if self.config.verbose :
-                print(i,newitem.fitness)
-
-    def populate_read(self,fichier):
-        """
-        Initialise la population en chargeant des individus à partir d'un fichier.
-        """
-        self.population=[] # Vide la population existante
-        i=0
-        with open(fichier, 'r') as file:
-            line_list = file.readlines(); # Lecture du fichier 
-        for line in line_list:
-            line=line.strip()
-            if line=="" :continue
-            if self.config.verbose :
-                print(i,line)
-            newitem=ChromosomeGP(self.config, 'none')
-            newitem.read_gene(line)
-            newitem.calculate_fitness(self.inputs, self.outputs)
-            if newitem.isFitnessValide():
-                self.population.append(newitem) # Ajout des individus valides à la population
-            i+=1
-        # Ajustement de la taille de l'échantillon en fonction de la population
-        self.config.size_population=len(self.population)
-        if self.config.size_echantillon>self.config.size_population:
-            self.config.size_echantillon=self.config.size_population
-
-    def populate_write(self, fichier):
-        """
-        Écrire la population dans un fichier.
-        """
-        strOut=""
-        for item in self.population:
-            strOut+=item.write_gene()# Conversion des génomes en chaîne de caractères
-            strOut+="\n"
-        with open(fichier, 'w') as file:
-            file.write(strOut);                     # Écriture dans le fichier
-#------------------------------------------------------------------------
-
-    def isStop(self):
-        """
-        Vérifie si l'algorithme doit s'arrêter.
-        """
-        return  self.stop
-
-    def setStop(self):
-        """
-        Vérifie si l'algorithme doit s'arrêter.
-        """
-        self.stop=True
-
-    def setAvancement(self,str_message,pos_value,max_value):
-        """
-        Met à jour l'interface graphique avec l'état d'avancement.
-        """
-        if self.widget is not None:
-            self.widget.set_jauge_value(str_message,pos_value,max_value)
-
-    def affiche_resultats(self):
-        """
-        Affiche les résultats finaux de l'algorithme.
-        """
-        if self.widget is not None:
-            self.widget.affiche_resultats()
-
-    def affiche_chromosome(self,iteration,chromosome):
-        """
-        Met à jour l'interface graphique avec le  chromosome.
-        """
-        if self.widget is not None:
-            self.widget.affiche_chromosome(iteration,chromosome)
-
-    def get_best(self):
-        """
-        Récupère le meilleur individu de la population.
-        """
-        if len(self.population) ==0:
-            return None
-        self.population.sort(reverse=False,key=lambda x:x.fitness)
-        return self.population[0]
-
-    def get_best_iteration(self,iteration):
-        """
-        Récupère le meilleur individu d'une itération donnée.
-        """
-        if(len(self.best_results)<=iteration):
-            return None
-        return self.best_results[iteration]
+import sys
+import threading
+import warnings
+import random
+import time
+import numpy as np
+from collections import deque
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+from algo.chromosomeGP import ChromosomeGP
+from tools.configToolsGP import ConfigToolsGP
+from algo.geneGP import GeneGP
+from algo.datasetGP import DatasetGP
+from algo.populationCodecGP import PopulationCodecGP
+from algo.checkpointGP import CheckpointGP
+from algo.historiqueGP import HistoriqueGP
+from algo.constantesGP import ConstantesGP
+from algo.operateursGP import OperateursGP
+from algo.chronometreGP import ChronometreGP
+from algo.telemetrieGP import TelemetrieGP
+from algo.memoireGP import MemoireGP
+from tools.paretoToolsGP import ParetoToolsGP
+from tools.profilToolsGP import ProfilToolsGP
+
+warnings.filterwarnings("ignore")
+"""
+La classe AlgoGP implémente un algorithme génétique programmatique (AGP),:
+
+1. Attributs de la classe (__init__)
+config: Paramètres de configuration pour l'algorithme.
+population: Liste des individus de la population actuelle.
+fitness_population, longueurs_population et index_best: Index des fitness et des longueurs de génome (tableau NumPy aligné sur la population) et position du meilleur individu, tenus à jour à chaque modification de la population : la population n'est plus triée en place à chaque sélection ni à chaque appel de get_best.
+new_population: Liste des nouveaux individus générés lors de chaque itération.
+inputs et outputs: Données d'entrée et résultats cibles de la fonction à optimiser.
+historique: Historique compact et borné des meilleurs individus de chaque itération (HistoriqueGP).
+dataset: Jeu de données (DatasetGP) parcouru par blocs pour le calcul de la fitness, en mémoire ou projeté depuis un fichier (memmap).
+compteurs: Nombre d'enfants demandés au croisement et d'enfants rejetés (croisement impossible, profondeur, fitness invalide), et nombre de générations tronquées.
+nb_evaluations et nb_evaluations_points: Nombre d'évaluations de fitness et de points évalués (évaluations x taille du jeu de données) depuis le début de l'exécution, comptés dans calculate_fitness.
+operateurs_croisement, operateurs_mutation: Choix adaptatif des opérateurs (OperateursGP) lorsque le mode de croisement ou de mutation est "adaptatif", None sinon.
+stagnation, evenements, temple, tolerance_mutation: État de la détection de stagnation (meilleure fitness de référence et itération de la dernière amélioration), stagnations détectées (itération, stratégie), temple de la renommée conservé lors des redémarrages et tolérance de mutation courante.
+widget: Interface graphique associée pour le suivi de l'avancement.
+isRunning: Indicateur pour savoir si l'algorithme est en cours d'exécution.
+elapsed_time: Temps écoulé depuis le démarrage de l'algorithme.
+2. Méthodes principales
+- initialise(self, config, inputs, outputs, widget)
+Initialise les paramètres de l'algorithme, y compris les outils mathématiques, les données d'entrée/sortie, et l'interface graphique. Si un "seed" est spécifié, il est utilisé pour initialiser les générateurs aléatoires. Les tailles de l'échantillon et de la population sont également ajustées ici.
+
+- populate_generate(self, nombre=None)
+Crée une population initiale d'individus (ou ajoute `nombre` nouveaux individus) en utilisant des chromosomes générés de manière aléatoire.
+En mode ramped half-and-half (initialise_individu), les profondeurs parcourent [profondeur_min_initialisation, max_depth], la moitié des arbres de chaque profondeur étant créée par full et l'autre par grow ; un génome déjà présent dans la population est rejeté avant d'être évalué (au plus TENTATIVES_DOUBLON fois par individu). La diversité obtenue et le nombre d'évaluations économisées sont comptés (compteurs_initialisation). Pour chaque individu, l'algorithme calcule la "fitness" (qualité de la solution) en fonction des données d'entrée et de sortie. Si un individu a une "fitness" invalide, il est régénéré jusqu'à ce qu'un individu valide soit trouvé.
+
+- populate_read(self, fichier)
+Charge la population à partir d'un fichier, en lisant chaque ligne et en initialisant les chromosomes correspondants. Un fichier .npz est lu au format binaire (populate_read_npz) : les fitness mémorisées ne sont recalculées que si le jeu de données a changé.
+
+Le fichier texte est lu en flux par lots de lignes (populate_lots) ; chaque lot est analysé et évalué (populate_lot), en parallèle si plusieurs workers sont configurés. Les lignes vides ou mal formées sont ignorées et comptées (compteurs_lecture). La lecture peut s'arrêter dès que size_population individus valides sont acceptés (populate_limite).
+
+- populate_write(self, fichier)
+Sauvegarde la population actuelle dans un fichier, chaque chromosome étant écrit au format approprié (texte, ou binaire .npz avec fitness et empreinte du jeu de données).
+
+- populate(self)
+Initialise la population soit par génération aléatoire, soit en la chargeant depuis un fichier, selon la configuration.
+
+- lance(self)
+Exécute l'algorithme (execute), sous profilage cpu (cProfile) ou alloc (tracemalloc) si mode_profil est défini (cf ProfilToolsGP) : seule la fenêtre d'évolution est profilée.
+
+- execute(self)
+Exécute l'algorithme génétique, en procédant par itérations. Chaque itération comprend une sélection des meilleurs individus, la reproduction (croisement) et la mutation pour générer la nouvelle population. L'algorithme s'arrête lorsqu'un critère d'arrêt est atteint (nombre maximal d'itérations, seuil de fitness, durée maximale, budget d'évaluations ou de points évalués, ou si l'algorithme est arrêté manuellement).
+
+- budget_epuise(self) / generation_epuisee(self, debut)
+Budget d'évaluations (max_evaluations, max_evaluations_points) épuisé ; budget de temps de la génération (duree_generation) dépassé. La production des enfants d'une génération s'interrompt dès que l'un ou l'autre est atteint (génération tronquée).
+
+- index_population(self)
+Reconstruit l'index des fitness de la population et la position du meilleur individu (O(n)).
+
+- scores(self, fitness, longueurs)
+Clés de classement utilisées en sélection et en remplacement : la fitness, éventuellement pénalisée par la longueur du génome (parcimonie linéaire), ou départagée par la longueur à fitness égale (parcimonie lexicographique).
+
+- objectifs(self, population, fitness, longueurs) / front_pareto(self)
+Objectifs du remplacement pareto (erreur, et longueur du génome ou coût d'évaluation estimé) ; le remplacement pareto conserve les individus par fronts de non-domination puis par distance d'encombrement (NSGA-II, cf ParetoToolsGP). front_pareto renvoie le front de Pareto de la population, exporté en fin d'exécution avec le meilleur individu.
+
+- termine_generation(self, iteration) / get_phases(self)
+Avec chronometrage, le temps passé dans chaque phase (sélection, croisement, mutation, évaluation, remplacement, optimisation des constantes, interface graphique) et l'accroissement des compteurs (évaluations, rejets, régénérations de populate_generate) sont relevés à chaque génération (cf ChronometreGP). get_phases renvoie les mesures par génération et leurs totaux ; elles sont affichées en mode verbeux.
+Avec un fichier de télémétrie (fichier_telemetrie), chaque génération produit aussi un enregistrement JSON (cf enregistrement_telemetrie, TelemetrieGP) : meilleure fitness et fitness médiane, longueur moyenne, évaluations, temps par phase et taux de rejet. Le fichier est vidé au démarrage, sauf en reprise où il est complété. Le mode verbeux n'en dépend pas : il affiche une ligne par génération, et les temps par phase seulement avec chronometrage.
+
+- surveille_memoire(self, iteration)
+Toutes les memoire_periode générations, mesure la mémoire résidente, les allocations Python (tracemalloc) et estime les octets par gène et par chromosome (cf MemoireGP) ; à l'approche du plafond memoire_plafond une alerte est affichée, et au-delà l'exécution s'arrête si memoire_action vaut arret (la population grandit sans limite avec le remplacement child_add). Les mesures sont ajoutées à la télémétrie.
+
+- taux_rejet(self)
+Proportion des enfants rejetés (cf compteurs), affichée en fin d'exécution en mode verbeux.
+
+- longueur_moyenne(self)
+Longueur moyenne des génomes de la population, affichée à chaque itération en mode verbeux.
+
+- meilleurs(fitness, nombre)
+Renvoie les indices des plus petites fitness, triés, par sélection partielle (np.partition puis tri stable des seuls candidats) : O(n + k log k) au lieu d'un tri complet. Les égalités sont départagées par la position dans la population, comme avec le tri stable complet qu'elle remplace : avec le remplacement mixt_best, la population conservée est rangée par fitness croissante et les résultats à graine égale sont inchangés.
+
+- tournoi(self, nombre) / lexicase(self, nombre)
+Sélections par tournois (sur l'index des fitness) et epsilon-lexicase (sur la matrice des erreurs par cas, cf erreurs_population et DatasetGP.selectionne_cas).
+
+- detecte_stagnation(self, iteration, best) / traite_stagnation(self)
+Déclare une stagnation lorsque la meilleure fitness ne s'est pas améliorée de plus de stagnation_epsilon depuis stagnation_fenetre itérations, puis applique la stratégie configurée : réinjection de nouveaux individus à la place des moins bons, mutation plus fréquente jusqu'à la prochaine amélioration, ou redémarrage complet ne conservant que le temple de la renommée.
+
+- optimise_constantes(self)
+Optimise les constantes (feuilles constantes de l'arbre) des nb_elites_constantes meilleurs individus par Levenberg-Marquardt sur un sous-ensemble du jeu de données (cf ConstantesGP), dans la limite de duree_constantes secondes par itération. Les valeurs optimisées sont des gènes constants réels.
+
+- echantillon_range(self)
+Sélectionne un sous-ensemble d'individus de la population en effectuant un tirage au sort, puis trie ces individus en fonction de leur fitness.
+
+- iterate_generation(self, iteration)
+Gère une itération complète de l'algorithme, où les individus sont croisés pour produire une nouvelle génération. Les individus les plus "fit" sont sélectionnés, croisés et mutés, puis ajoutés à la nouvelle population.
+
+- croisement(self, mother, father) / mutate(self, child)
+Appliquent l'opérateur configuré, ou celui tiré par le choix adaptatif (cf OperateursGP) ; recompense(self, child, reference) crédite alors les opérateurs utilisés selon que l'enfant est valide et meilleur que le meilleur de ses parents. Les statistiques par opérateur sont affichées en fin d'exécution en mode verbeux.
+
+- iterate_stationnaire(self, iteration) / vainqueur(self, candidats, cles) / remplace_perdant(self, child, candidats, cles)
+Moteur stationnaire (steady-state, moteur="stationnaire") : chaque pas choisit deux parents par tournois, produit leurs enfants et remplace, pour chaque enfant valide, le perdant d'un tournoi inversé directement dans la population, sans reconstruire de génération. Les participants des tournois d'une itération sont tirés en une fois ; les tournois portent sur des clés de classement en listes Python (cles_tournoi), sans appel NumPy par enfant, et l'index des fitness est mis à jour en une fois en fin d'itération (index_remplacements). Une itération compte size_echantillon enfants, comme une génération : critères d'arrêt, suivi de l'avancement et historique restent inchangés.
+
+- insert_child(self, child, iteration)
+Insère un enfant dans la nouvelle population, en effectuant éventuellement une mutation et en calculant sa fitness. Si l'enfant est valide, il est ajouté à la population.
+
+- isStop(self)
+Renvoie un booléen indiquant si l'algorithme doit s'arrêter (basé sur l'attribut isRunning).
+
+- setAvancement(self, str_message, pos_value, max_value)
+Met à jour l'interface graphique avec l'état d'avancement de l'algorithme. Utilise le widget pour afficher le progrès sous forme de jauge.
+
+- affiche_resultats(self)
+Affiche les résultats de l'algorithme à l'aide du widget.
+
+- get_best(self)
+Récupère l'individu le plus "fit" de la population actuelle (celui avec la meilleure fitness), en O(1) grâce à l'index des fitness.
+
+- calculate_fitness(self, chromosome)
+Calcule la fitness d'un individu sur le jeu de données, bloc par bloc.
+
+- checkpoint_etat(self, iteration) / checkpoint_restaure(self, etat)
+Capture ou restaure l'état complet de l'exécution (population, meilleurs résultats, itération, temps écoulé, configuration, générateurs aléatoires) pour les points de reprise (cf CheckpointGP).
+
+- get_best_iteration(self, iteration)
+Récupère le meilleur individu à une itération donnée, reconstruit à partir de l'historique.
+
+"""
+class AlgoGP():
+
+    TENTATIVES_DOUBLON = 100    # Nombre maximal de doublons rejetés pour un même individu (initialisation ramped)
+
+    def __init__(self):
+        """
+        Initialise l'instance de l'algorithme génétique programmatique.
+        """
+        # Initialisation des attributs de l'algorithme
+        self.config=None                    # Paramètres de configuration de l'algorithme
+        self.population = []                # Liste des individus de la population
+        self.population_selection = []    # Liste des individus de l'selection
+        self.new_population=[]              # Liste pour la nouvelle population générée
+        self.fitness_population=np.empty(0) # Index des fitness, aligné sur la population
+        self.index_best=-1                  # Position du meilleur individu dans la population
+        self.longueurs_population=np.empty(0,dtype=np.int64) # Longueur du génome de chaque individu
+        self.compteurs={}                   # Compteurs des enfants produits et rejetés (cf iterate)
+        self.chronometre=ChronometreGP()    # Temps par phase et compteurs par génération (cf termine_generation)
+        self.telemetrie=None                # Écriture de la télémétrie (None : pas de fichier de télémétrie)
+        self.memoire=MemoireGP()            # Surveillance de l'empreinte mémoire (cf surveille_memoire)
+        self.nb_evaluations=0               # Nombre d'évaluations de fitness
+        self.nb_evaluations_points=0        # Nombre de points évalués (évaluations x taille du jeu de données)
+        self.verrou_evaluations=threading.Lock() # Compteurs d'évaluations partagés par les workers
+        self.tolerance_mutation=0.5         # Tolérance de mutation courante (abaissée pendant une stagnation)
+        self.stagnation={}                  # Fitness de référence et itération de la dernière amélioration (cf detecte_stagnation)
+        self.evenements=[]                  # Stagnations détectées : (itération, stratégie)
+        self.temple=[]                      # Temple de la renommée : meilleurs individus conservés lors des redémarrages
+        self.operateurs_croisement=None     # Choix adaptatif du croisement (None : mode_croisement fixe)
+        self.operateurs_mutation=None       # Choix adaptatif de la mutation (None : mode_mutation fixe)
+        self.croisement_choisi=None         # Dernier croisement appliqué
+        self.mutation_choisie=None          # Dernière mutation appliquée (None : pas de mutation)
+        self.echantillon_constantes=None    # Sous-ensemble du jeu de données pour l'optimisation des constantes
+        self.inputs=[]                      # Données d'entrée pour l'évaluation de la fitness
+        self.outputs=[]                     # Valeurs cibles pour l'évaluation de la fitness
+        self.dataset=None                   # Jeu de données (DatasetGP) parcouru par blocs
+        self.historique=HistoriqueGP()      # Historique des meilleurs individus
+        self.widget=None                    # Important : fait office de pointeur entre les calculs effectués et l'interface graphique
+        self.isRunning=False                # Indicateur de l'état de l'exécution de l'algorithme
+        self.elapsed_time=0                 # Temps écoulé depuis le démarrage
+        self.stop=False
+
+
+    def initialise(self,config,inputs,outputs,widget):
+        """
+        Configure les paramètres de l'algorithme.
+        Args:
+            config (obj): classe de configuration.
+            inputs (list|DatasetGP): Données d'entrée, ou jeu de données déjà construit.
+            outputs (list): Valeurs de la fonction pour les inputs (ignoré si inputs est un DatasetGP).
+            widget (object): Interface graphique associée.
+        """
+        # Initialisation des attributs à partir des paramètres de configuration
+        self.population = []
+        if isinstance(inputs,DatasetGP):
+            self.dataset=inputs
+        else:
+            self.dataset=DatasetGP.create(inputs,outputs,config.taille_bloc)
+        self.inputs=self.dataset.inputs
+        self.outputs=self.dataset.outputs
+        self.widget=widget
+        self.config=config
+        self.stop=False
+        self.tolerance_mutation=config.tolerance_gene_Mutate
+
+        GeneGP.init_fonctions(config)
+        # Initialisation des générateurs aléatoires avec une graine si spécifiée
+        if self.config.seed!=0 :
+            random.seed(self.config.seed)
+            np.random.seed(self.config.seed)
+        # Ajustement de la taille de l'échantillon en fonction de la population
+        if self.config.size_echantillon>self.config.size_population:
+            self.config.size_echantillon=self.config.size_population
+
+
+
+
+    def lance(self):
+        """
+        Exécute l'algorithme (cf execute), sous profilage si mode_profil est défini ; les rapports
+        sont écrits à partir de la base fichier_profil (cf ProfilToolsGP).
+        """
+        ProfilToolsGP.execute(self.config.mode_profil,self.execute,self.config.fichier_profil)
+
+    def execute(self):
+        """
+        Lance l'exécution de l'algorithme génétique, comprenant les étapes de sélection,
+        reproduction, mutation et remplacement des individus.
+        """
+        self.stop=False
+        self.isRunning=True                 # Indicateur que l'algorithme est en cours
+        checkpoint=CheckpointGP(self.config.checkpoint_fichier,self.config.checkpoint_iterations,self.config.checkpoint_duree)
+
+        curent_fitness=sys.float_info.max   # Valeur initiale très élevée pour la fitness
+        self.compteurs={'enfants':0,'rejets_croisement':0,'rejets_profondeur':0,'rejets_fitness':0,'generations_tronquees':0,'regenerations':0}
+        self.chronometre=ChronometreGP(self.config.chronometrage or self.config.fichier_telemetrie!="")
+        self.telemetrie=TelemetrieGP(self.config.fichier_telemetrie,self.config.fichier_reprise!="") if self.config.fichier_telemetrie!="" else None
+        self.memoire=MemoireGP(self.config.memoire_periode,self.config.memoire_plafond,self.config.memoire_action,self.config.memoire_allocations)
+        self.memoire.demarre()
+        self.nb_evaluations=0
+        self.nb_evaluations_points=0
+        self.echantillon_constantes=None
+        self.tolerance_mutation=self.config.tolerance_gene_Mutate
+        self.stagnation={'fitness':sys.float_info.max,'iteration':0}
+        self.evenements=[]
+        self.temple=[]
+        self.operateurs_croisement=None
+        self.operateurs_mutation=None
+        if self.config.mode_croisement==self.config.CROISEMENT_ADAPTATIF:
+            self.operateurs_croisement=OperateursGP((self.config.CROISEMENT_MIDDLE,self.config.CROISEMENT_ABSORPTION_PARTIELLE,self.config.CROISEMENT_ABSORPTION_TOTALE),
+                                                    self.config.taux_apprentissage,self.config.probabilite_minimum)
+        if self.config.mode_mutation==self.config.MUTATION_ADAPTATIVE:
+            self.operateurs_mutation=OperateursGP((self.config.MUTATION_REPLACE,self.config.MUTATION_SWAP,self.config.MUTATION_DEPLACE),
+                                                  self.config.taux_apprentissage,self.config.probabilite_minimum)
+        if self.config.mode_selection==self.config.SELECTION_LEXICASE:
+            self.dataset.selectionne_cas(self.config.nb_cas_lexicase)   # Cas dont les erreurs sont conservées
+        else:
+            self.dataset.cas=None
+        if self.config.fichier_reprise!="" :
+            # Reprise d'une exécution interrompue à partir d'un point de reprise
+            iteration=self.checkpoint_restaure(CheckpointGP.load(self.config.fichier_reprise))
+            if len(self.historique)>0:
+                curent_fitness= self.historique.derniere_fitness()
+        else:
+            self.population   = []              # Réinitialisation de la population
+            self.historique   = HistoriqueGP(self.config.historique_taille) # Historique des meilleurs résultats à chaque itération
+            self.elapsed_time=0
+            self.populate()                     # Initialisation de la population
+            self.termine_generation(-1)
+            iteration=0  
+        start_time=time.time()-self.elapsed_time # Démarrage du chronomètre
+
+        # Boucle principale de l'algorithme avec critères d'arrêt
+        while( iteration<self.config.max_iterations   
+                and  curent_fitness>=self.config.seuil_fitness  
+                and self.elapsed_time<=self.config.duree_maximum  
+                and not self.budget_epuise()
+                and not self.memoire.depasse
+                and not self.isStop()):
+
+            self.setAvancement("itération",iteration,self.config.max_iterations) #pour la jauge
+
+            if self.config.moteur==self.config.MOTEUR_STATIONNAIRE:
+                self.iterate_stationnaire(iteration)     # Itération du moteur stationnaire
+            else:
+                self.iterate(iteration)                  # Exécution d'une itération
+            best= self.get_best()                        # Récupération du meilleur individu
+            if best is not None:
+                curent_fitness= best.fitness                 # Mise à jour de la fitness
+                self.elapsed_time = time.time() - start_time # Mise à jour du temps écoulé
+                self.historique.ajoute(iteration,best)       # Sauvegarde des meilleurs résultats
+                self.affiche_chromosome(iteration,best)         #pour le graphe
+                if self.config.verbose :
+                    print(iteration,curent_fitness,best.generation,"[",best.formule,"]",round(self.longueur_moyenne(),2))
+                if self.config.stagnation_fenetre>0:
+                    self.detecte_stagnation(iteration,best)
+            self.surveille_memoire(iteration)
+            self.termine_generation(iteration)
+            iteration+=1
+            if checkpoint.echeance(iteration):
+                checkpoint.save(self.checkpoint_etat(iteration))   # Écriture en arrière-plan
+
+        checkpoint.attend()
+        self.memoire.arrete()
+        if self.telemetrie is not None:
+            self.telemetrie.vide()
+        if self.config.verbose :
+            print("Enfants :",self.compteurs,"taux de rejet :",round(self.taux_rejet(),4))
+            print("Évaluations :",self.nb_evaluations,"points évalués :",self.nb_evaluations_points)
+            for operateurs in (self.operateurs_croisement,self.operateurs_mutation):
+                if operateurs is not None:
+                    for statistiques in operateurs.statistiques():
+                        print("Opérateur :",statistiques)
+            if self.config.mode_remplacement==self.config.REMPLACEMENT_PARETO:
+                for item,taille in self.front_pareto():
+                    print("Front de Pareto :",item.fitness,taille,"[",item.formule,"]")
+            if self.memoire.periode>0:
+                print("Mémoire :",self.memoire.resume())
+            if self.chronometre.actif:
+                print("Phases (total) :",{key:round(val,4) for key,val in self.chronometre.totaux().items()})
+
+        self.affiche_resultats()                         # Affichage des résultats finaux
+        self.isRunning=False                             # L'algorithme s'est terminé
+
+
+    def checkpoint_etat(self,iteration):
+        """
+        Capture l'état complet de l'exécution, à la fin d'une itération.
+        Args:
+            iteration (int): Nombre d'itérations effectuées.
+        Returns:
+            dict: État de l'algorithme (indépendant des objets en cours d'utilisation).
+        """
+        config={key:val for key,val in vars(self.config).items() if isinstance(val,(int,float,str,bool,list,tuple))}
+        return {
+                'iteration':iteration,
+                'elapsed_time':self.elapsed_time,
+                'population':PopulationCodecGP.encode(self.population),
+                'historique':self.historique.etat(),
+                'compteurs':dict(self.compteurs),
+                'nb_evaluations':self.nb_evaluations,
+                'nb_evaluations_points':self.nb_evaluations_points,
+                'echantillon_constantes':self.echantillon_constantes,
+                'tolerance_mutation':self.tolerance_mutation,
+                'stagnation':dict(self.stagnation),
+                'evenements':list(self.evenements),
+                'temple':PopulationCodecGP.encode(self.temple),
+                'operateurs_croisement':self.operateurs_croisement.etat() if self.operateurs_croisement is not None else None,
+                'operateurs_mutation':self.operateurs_mutation.etat() if self.operateurs_mutation is not None else None,
+                'chronometre':self.chronometre.etat(),
+                'config':config,
+                'random':random.getstate(),
+                'np_random':np.random.get_state(),
+               }
+
+    def checkpoint_restaure(self,etat):
+        """
+        Restaure l'état complet de l'exécution à partir d'un point de reprise.
+        Les paramètres de pilotage de l'exécution (critères d'arrêt, points de reprise, traces, thread) ne sont
+        pas restaurés : une exécution reprise peut ainsi être prolongée.
+        Args:
+            etat (dict): État produit par checkpoint_etat.
+        Returns:
+            int: Nombre d'itérations déjà effectuées.
+        """
+        for key,val in etat['config'].items():
+            if key not in ('max_iterations','seuil_fitness','duree_maximum','fichier_reprise',
+                           'checkpoint_fichier','checkpoint_iterations','checkpoint_duree','verbose','bl_thread',
+                           'chronometrage','fichier_telemetrie','mode_profil','fichier_profil',
+                           'memoire_periode','memoire_plafond','memoire_action','memoire_allocations'):
+                setattr(self.config,key,val)
+        GeneGP.init_fonctions(self.config)
+        self.population=PopulationCodecGP.decode(etat['population'],self.config)
+        self.historique=HistoriqueGP(self.config.historique_taille)
+        self.historique.restaure(etat['historique'])
+        self.compteurs.update(etat.get('compteurs',{}))
+        self.nb_evaluations=etat.get('nb_evaluations',0)
+        self.nb_evaluations_points=etat.get('nb_evaluations_points',0)
+        self.echantillon_constantes=etat.get('echantillon_constantes')
+        self.tolerance_mutation=etat.get('tolerance_mutation',self.config.tolerance_gene_Mutate)
+        self.stagnation.update(etat.get('stagnation',{}))
+        self.evenements=list(etat.get('evenements',[]))
+        if 'temple' in etat:
+            self.temple=PopulationCodecGP.decode(etat['temple'],self.config)
+        for nom in ('operateurs_croisement','operateurs_mutation'):
+            if getattr(self,nom) is not None and etat.get(nom) is not None:
+                getattr(self,nom).restaure(etat[nom])
+        self.chronometre.restaure(etat.get('chronometre',{}))
+        self.index_population()
+        self.elapsed_time=etat['elapsed_time']
+        random.setstate(etat['random'])
+        np.random.set_state(etat['np_random'])
+        return etat['iteration']
+
+    def populate(self):
+        """
+        Initialise la population 
+        """
+        if self.config.fichier_populate!="" :
+            self.populate_read(self.config.fichier_populate)
+        else:
+            self.populate_generate()
+        self.index_population()
+
+    def iterate(self,iteration):
+        """
+        Gère l'évolution d'une génération : sélection, croisement et mutation.
+        """
+
+        self.new_population=[]                   # Liste pour la nouvelle génération
+
+        debut=time.time()
+        chrono=self.chronometre.top()
+        self.population_selection=self.selection()       # Sélection des individus pour cette génération
+        self.chronometre.ajoute('selection',chrono)
+        size=len(self.population_selection)
+ 
+        i=0
+        while i <size//2:
+            if self.generation_epuisee(debut):
+                self.compteurs['generations_tronquees']+=1  # Production des enfants interrompue
+                break
+            chrono=self.chronometre.top()
+            mother,father=self.mariage(i, size)
+            self.chronometre.ajoute('selection',chrono)
+            # Croisement pour produire deux enfants
+            chrono=self.chronometre.top()
+            child1,child2  = self.croisement(mother, father)
+            self.chronometre.ajoute('croisement',chrono)
+            self.compteurs['enfants']+=2
+            self.compteurs['rejets_croisement']+=(child1 is None)+(child2 is None)
+            reference=min(mother.fitness,father.fitness)
+            child1=self.mutate(child1)   
+            self.recompense(child1,reference)
+            if child1 is not None:
+                child1.generation=iteration
+                self.new_population.append(child1)              # Ajout à la nouvelle population
+            child2=self.mutate(child2)   
+            self.recompense(child2,reference)
+            if child2 is not None:
+                child2.generation=iteration
+                self.new_population.append(child2)              # Ajout à la nouvelle population
+            i+=1
+        # Mise à jour de la population actuelle
+        chrono=self.chronometre.top()
+        self.remplacement()
+        self.chronometre.ajoute('remplacement',chrono)
+        if self.config.nb_elites_constantes>0:
+            self.optimise_constantes()
+
+    def iterate_stationnaire(self,iteration):
+        """
+        Itération du moteur stationnaire : size_echantillon enfants sont produits un couple de parents à la fois,
+        et chaque enfant valide remplace aussitôt le perdant d'un tournoi inversé (cf remplace_perdant).
+        Les parents sont choisis par tournois, quel que soit le mode de sélection ; le mode de remplacement n'est pas utilisé.
+        Les tournois portent sur des listes Python (cf cles_tournoi) ; l'index des fitness n'est mis à jour qu'une
+        fois, en fin d'itération, pour toutes les places remplacées (cf index_remplacements).
+        """
+        debut=time.time()
+        if len(self.fitness_population)!=len(self.population):
+            self.index_population()
+        nb_couples=(self.config.size_echantillon+1)//2
+        # Participants des tournois de tous les pas : 2 tournois pour les parents, 2 tournois inversés pour les remplacements
+        tirages=np.random.randint(len(self.population),size=(nb_couples,4,max(1,self.config.taille_tournoi))).tolist()
+        cles=self.cles_tournoi()                        # Clés de classement (listes Python) tenues à jour à chaque remplacement
+        controle=self.config.duree_generation>0 or self.config.max_evaluations>0 or self.config.max_evaluations_points>0
+        adaptatif=self.operateurs_croisement is not None or self.operateurs_mutation is not None
+        remplaces=[]                                    # Places remplacées pendant l'itération
+        for couple in range(nb_couples):
+            if controle and self.generation_epuisee(debut):
+                self.compteurs['generations_tronquees']+=1  # Production des enfants interrompue
+                break
+            chrono=self.chronometre.top()
+            mother=self.population[self.vainqueur(tirages[couple][0],cles)]
+            father=self.population[self.vainqueur(tirages[couple][1],cles)]
+            self.chronometre.ajoute('selection',chrono)
+            chrono=self.chronometre.top()
+            child1,child2  = self.croisement(mother, father)
+            self.chronometre.ajoute('croisement',chrono)
+            self.compteurs['enfants']+=2
+            self.compteurs['rejets_croisement']+=(child1 is None)+(child2 is None)
+            reference=min(mother.fitness,father.fitness)
+            for child,candidats in ((child1,tirages[couple][2]),(child2,tirages[couple][3])):
+                child=self.mutate(child)
+                if adaptatif:
+                    self.recompense(child,reference)
+                if child is not None:
+                    child.generation=iteration
+                    chrono=self.chronometre.top()
+                    remplaces.append(self.remplace_perdant(child,candidats,cles))
+                    self.chronometre.ajoute('remplacement',chrono)
+        chrono=self.chronometre.top()
+        self.index_remplacements(remplaces)
+        self.chronometre.ajoute('remplacement',chrono)
+        if self.config.nb_elites_constantes>0:
+            self.optimise_constantes()
+
+    def cles_tournoi(self):
+        """
+        Clés de classement de chaque individu pour les tournois du moteur stationnaire, en liste Python : un
+        tournoi de quelques candidats coûte alors un min ou un max sur la liste, sans appel NumPy par pas.
+        Mêmes classements que scores sur les candidats : fitness, fitness pénalisée par la longueur (parcimonie
+        linéaire) ou couple (fitness, longueur) (parcimonie lexicographique).
+        Returns:
+            list: Clé de chaque individu, dans l'ordre de la population.
+        """
+        if self.config.mode_parcimonie==self.config.PARCIMONIE_LINEAIRE:
+            return (self.fitness_population+self.config.coef_parcimonie*self.longueurs_population).tolist()
+        elif self.config.mode_parcimonie==self.config.PARCIMONIE_LEXICO:
+            return list(zip(self.fitness_population.tolist(),self.longueurs_population.tolist()))
+        return self.fitness_population.tolist()
+
+    def cle_tournoi(self,fitness,longueur):
+        """
+        Clé de classement d'un individu (cf cles_tournoi).
+        """
+        if self.config.mode_parcimonie==self.config.PARCIMONIE_LINEAIRE:
+            return fitness+self.config.coef_parcimonie*longueur
+        elif self.config.mode_parcimonie==self.config.PARCIMONIE_LEXICO:
+            return (fitness,longueur)
+        return fitness
+
+    def vainqueur(self,candidats,cles):
+        """
+        Vainqueur d'un tournoi : le meilleur des candidats (le premier tiré à égalité, comme np.argmin).
+        Args:
+            candidats (list): Indices des participants.
+            cles (list): Clés de classement de la population (cf cles_tournoi).
+        Returns:
+            int: Indice du vainqueur.
+        """
+        if len(candidats)==1:
+            return candidats[0]
+        valeurs=itemgetter(*candidats)(cles)           # Clés des candidats en un appel (tuple)
+        return candidats[valeurs.index(min(valeurs))]
+
+    def remplace_perdant(self,child,candidats,cles):
+        """
+        Remplace en place, par un enfant, le plus mauvais des candidats (tournoi inversé, le premier tiré à
+        égalité), et met à jour sa clé de classement en O(1). L'index des fitness est mis à jour ensuite
+        (cf index_remplacements).
+        Args:
+            child (ChromosomeGP): Enfant valide.
+            candidats (list): Indices des participants du tournoi inversé.
+            cles (list): Clés de classement de la population (cf cles_tournoi).
+        Returns:
+            int: Place remplacée.
+        """
+        if len(candidats)==1:
+            perdant=candidats[0]
+        else:
+            valeurs=itemgetter(*candidats)(cles)
+            perdant=candidats[valeurs.index(max(valeurs))]
+        cles[perdant]=self.cle_tournoi(child.fitness,len(child.gen))
+        self.population[perdant]=child
+        return perdant
+
+    def index_remplacements(self,remplaces):
+        """
+        Met à jour l'index des fitness et des longueurs pour les places remplacées (en une affectation NumPy),
+        puis la position du meilleur individu (np.argmin : première position à égalité).
+        Args:
+            remplaces (list): Places remplacées (éventuellement plusieurs fois).
+        """
+        if len(remplaces)==0:
+            return
+        places=list(set(remplaces))
+        self.fitness_population[places]=[self.population[i].fitness for i in places]
+        self.longueurs_population[places]=[len(self.population[i].gen) for i in places]
+        self.index_best=int(np.argmin(self.fitness_population))
+
+    def detecte_stagnation(self,iteration,best):
+        """
+        Détecte une stagnation : aucune amélioration de la meilleure fitness de plus de stagnation_epsilon
+        depuis stagnation_fenetre itérations. La stratégie configurée est alors appliquée et une nouvelle
+        fenêtre commence.
+        Args:
+            iteration (int): Numéro de l'itération.
+            best (ChromosomeGP): Meilleur individu de l'itération.
+        """
+        if best.fitness<self.stagnation['fitness']-self.config.stagnation_epsilon:
+            self.stagnation={'fitness':best.fitness,'iteration':iteration}
+            self.tolerance_mutation=self.config.tolerance_gene_Mutate          # Fin de la stagnation
+        elif iteration-self.stagnation['iteration']>=self.config.stagnation_fenetre:
+            self.stagnation['iteration']=iteration
+            self.evenements.append((iteration,self.config.mode_stagnation))
+            if self.config.verbose :
+                print("Stagnation à l'itération",iteration,"(",self.config.stagnation_fenetre,"itérations sans amélioration ) :",self.config.mode_stagnation)
+            self.traite_stagnation()
+
+    def traite_stagnation(self):
+        """
+        Applique la stratégie de stagnation configurée.
+            reinjection : les taux_reinjection moins bons individus sont remplacés par de nouveaux individus (populate_generate).
+            mutation    : la tolérance de mutation passe à tolerance_stagnation jusqu'à la prochaine amélioration.
+            redemarrage : la population est entièrement recréée, à l'exception du temple de la renommée
+                          (les taille_temple meilleurs individus distincts rencontrés lors des redémarrages).
+        """
+        if self.config.mode_stagnation==self.config.STAGNATION_MUTATION:
+            self.tolerance_mutation=self.config.tolerance_stagnation
+            return
+        taille=len(self.population)
+        if self.config.mode_stagnation==self.config.STAGNATION_REDEMARRAGE:
+            candidats=self.temple+[self.population[i] for i in self.meilleurs(self.fitness_population,self.config.taille_temple).tolist()]
+            candidats.sort(key=lambda x:x.fitness)
+            genomes=set()
+            self.temple=[]
+            for item in candidats:
+                genome=item.write_gene()
+                if genome not in genomes and len(self.temple)<self.config.taille_temple:
+                    genomes.add(genome)
+                    self.temple.append(item)
+            self.population=list(self.temple)
+        else: # self.config.mode_stagnation==self.config.STAGNATION_REINJECTION:
+            nombre=int(round(self.config.taux_reinjection*taille))
+            indices=self.meilleurs(self.scores(self.fitness_population,self.longueurs_population),taille-nombre)
+            self.population=[self.population[i] for i in indices.tolist()]
+        self.populate_generate(taille-len(self.population))
+        self.index_population()
+
+    def optimise_constantes(self):
+        """
+        Optimise les constantes des meilleurs individus (cf ConstantesGP), dans la limite du budget de temps.
+        Un individu amélioré remplace l'original dans la population ; chaque individu n'est optimisé qu'une fois.
+        """
+        if self.echantillon_constantes is None:
+            self.echantillon_constantes=self.dataset.echantillon(self.config.nb_points_constantes)
+        inputs,outputs=self.echantillon_constantes
+        debut=time.time()
+        for i in self.meilleurs(self.fitness_population,self.config.nb_elites_constantes).tolist():
+            if time.time()-debut>self.config.duree_constantes:
+                break
+            item=self.population[i]
+            if item.constantes_optimisees:
+                continue
+            item.constantes_optimisees=True
+            chrono=self.chronometre.top()
+            newitem=ConstantesGP.optimise(item,inputs,outputs,self.config.iterations_constantes)
+            self.chronometre.ajoute('constantes',chrono)
+            if newitem is None:
+                continue
+            newitem.constantes_optimisees=True
+            self.calculate_fitness(newitem)                 # Fitness sur tout le jeu de données
+            if newitem.isFitnessValide() and newitem.fitness<item.fitness:
+                self.population[i]=newitem
+                self.fitness_population[i]=newitem.fitness
+                if newitem.fitness<self.fitness_population[self.index_best]:
+                    self.index_best=i
+
+    def selection(self):
+        """
+        Sélectionne un sous-ensemble d'individus pour la reproduction.
+        """
+  
+        if  self.config.mode_selection==self.config.SELECTION_BEST:
+            indices=self.meilleurs(self.scores(self.fitness_population,self.longueurs_population),self.config.size_echantillon)    # Sélection partielle des best
+            selection=[self.population[i] for i in indices.tolist()]              # Échantillonnage des best
+        elif  self.config.mode_selection==self.config.SELECTION_WORST:
+            indices=self.meilleurs(-self.scores(self.fitness_population,self.longueurs_population),self.config.size_echantillon)   # Sélection partielle des worst
+            selection=[self.population[i] for i in indices.tolist()]              # Échantillonnage des worst
+        elif  self.config.mode_selection==self.config.SELECTION_TOURNOI:
+            indices=self.tournoi(self.config.size_echantillon)                  # Tournois sur l'index des fitness
+            selection=[self.population[i] for i in indices.tolist()]
+        elif  self.config.mode_selection==self.config.SELECTION_LEXICASE:
+            indices=self.lexicase(self.config.size_echantillon)                 # Epsilon-lexicase sur la matrice des erreurs
+            selection=[self.population[i] for i in indices.tolist()]
+        else: #self.config.mode_selection==self.config.SELECTION_RANDOM:
+            selection=random.sample(self.population, self.config.size_echantillon) # Échantillonnage aléatoire
+
+        selection.sort(reverse=False,key=lambda x:x.fitness)                       # Tri des individus par fitness 
+        return selection
+
+    def tournoi(self,nombre):
+        """
+        Sélection par tournois : chaque individu sélectionné est le meilleur de taille_tournoi individus
+        tirés au hasard (avec remise). Tous les tournois sont joués en une fois sur l'index des fitness,
+        en O(nombre * taille_tournoi), sans tri.
+        Args:
+            nombre (int): Nombre d'individus à sélectionner.
+        Returns:
+            np.ndarray: Indices des individus sélectionnés.
+        """
+        candidats=np.random.randint(len(self.population),size=(nombre,max(1,self.config.taille_tournoi)))
+        scores=self.scores(self.fitness_population[candidats].ravel(),self.longueurs_population[candidats].ravel()).reshape(candidats.shape)
+        return candidats[np.arange(nombre),np.argmin(scores,axis=1)]
+
+    def lexicase(self,nombre):
+        """
+        Sélection epsilon-lexicase : pour chaque individu sélectionné, les cas sont parcourus dans un ordre
+        aléatoire et seuls les candidats dont l'erreur sur le cas est à moins de epsilon de la meilleure
+        sont conservés, jusqu'à ce qu'il n'en reste qu'un (tirage au hasard parmi les survivants sinon).
+        epsilon est, pour chaque cas, l'écart absolu médian (MAD) des erreurs de la population.
+        Le premier filtre, commun à toutes les sélections, est calculé une seule fois sur toute la matrice.
+        Args:
+            nombre (int): Nombre d'individus à sélectionner.
+        Returns:
+            np.ndarray: Indices des individus sélectionnés.
+        """
+        erreurs=np.ascontiguousarray(self.erreurs_population().T)               # Matrice (cas, individus) : une ligne par cas
+        nb_cas=erreurs.shape[0]
+        epsilon=np.median(np.abs(erreurs-np.median(erreurs,axis=1,keepdims=True)),axis=1)
+        elites=[np.flatnonzero(ligne<=ligne.min()+eps) for ligne,eps in zip(erreurs,epsilon)]  # Survivants du premier cas
+        selection=np.empty(nombre,dtype=np.int64)
+        for i in range(nombre):
+            ordre=np.random.permutation(nb_cas)
+            candidats=elites[ordre[0]]
+            for cas in ordre[1:]:
+                if len(candidats)==1:
+                    break
+                valeurs=erreurs[cas,candidats]
+                candidats=candidats[valeurs<=valeurs.min()+epsilon[cas]]
+            selection[i]=candidats[np.random.randint(len(candidats))]
+        return selection
+
+    def erreurs_population(self):
+        """
+        Construit la matrice des erreurs absolues (individus, cas) de la population.
+        Les individus dont les erreurs n'ont pas été conservées (population relue, reprise) sont réévalués.
+        Returns:
+            np.ndarray: Matrice des erreurs.
+        """
+        for item in self.population:
+            if item.erreurs is None or len(item.erreurs)!=len(self.dataset.cas):
+                self.calculate_fitness(item)
+        return np.vstack([item.erreurs for item in self.population])
+
+    def mariage(self,pos, size):
+        """
+        sélection d'un couple de deux chromosomes.
+        """
+ 
+        if  self.config.mode_mariage==self.config.MARIAGE_BEST:
+            mother = self.population_selection[2*pos]
+            father = self.population_selection[2*pos+1]
+        elif  self.config.mode_mariage==self.config.MARIAGE_EXTREME:
+            mother = self.population_selection[pos]
+            father = self.population_selection[size-pos-1]
+        else: # self.config.mode_mariage==self.config.MARIAGE_RAND:
+            mother = self.population_selection[np.random.randint(size)]
+            father = self.population_selection[np.random.randint(size)]
+        return mother,father
+
+    def croisement(self,mother, father):
+        """
+        croisement de deux chromosommes (mother, father).
+        """
+        mode=self.config.mode_croisement
+        if self.operateurs_croisement is not None:
+            mode=self.operateurs_croisement.choisit()              # Choix adaptatif de l'opérateur
+        self.croisement_choisi=mode
+        points=(None,None)
+        if self.config.croisement_profondeur:
+            # Points de croisement choisis parmi ceux qui donnent des enfants valides
+            points=ChromosomeGP.points_croisement(mother, father, mode)
+            if points is None:
+                return None,None
+        # Créer de nouveaux enfanst en croisant les gènes des deux chromosomes (mère et père)
+        if  mode==self.config.CROISEMENT_MIDDLE:
+            return ChromosomeGP.croisement_middle(mother, father, *points)
+        elif  mode==self.config.CROISEMENT_ABSORPTION_PARTIELLE :
+            return ChromosomeGP.croisement_absorption_partielle(mother, father, *points)
+        else  :# mode==self.config.CROISEMENT_ABSORPTION_TOTALE :
+            return ChromosomeGP.croisement_absorption_totale(mother, father, *points)
+  
+    def mutate(self,child):
+        """
+        Ajoute un enfant à la nouvelle population, avec éventuellement une mutation.
+        """
+        self.mutation_choisie=None
+        if child is None :
+            return None
+        tolerence=random.random()
+        depth=child.depth
+        # Vérification de la profondeur maximale
+        if depth > self.config.max_depth :
+            if tolerence < self.config.tolerance_gene_Length:
+                self.compteurs['rejets_profondeur']+=1
+                return None
+
+        if tolerence > self.tolerance_mutation:
+            mode=self.config.mode_mutation
+            if self.operateurs_mutation is not None:
+                mode=self.operateurs_mutation.choisit()            # Choix adaptatif de l'opérateur
+            self.mutation_choisie=mode
+            chrono=self.chronometre.top()
+            if  mode==self.config.MUTATION_DEPLACE:
+                child.mutate_deplace () 
+            elif  mode==self.config.MUTATION_SWAP:
+                child.mutate_swap() 
+            else  :# mode==self.config.MUTATION_REPLACE :
+                child.mutate_remplace() 
+            self.chronometre.ajoute('mutation',chrono)
+
+        self.calculate_fitness(child)                       # Calcul de la fitness
+        if not child.isFitnessValide():                    # Si l'enfant est non valide
+                self.compteurs['rejets_fitness']+=1
+                return None
+        return  child      
+
+    def recompense(self,child,reference):
+        """
+        Crédite les opérateurs choisis de façon adaptative pour produire un enfant.
+        Args:
+            child (ChromosomeGP): Enfant produit (None s'il a été rejeté).
+            reference (float): Fitness du meilleur des deux parents.
+        """
+        valide=child is not None
+        amelioration=valide and child.fitness<reference
+        if self.operateurs_croisement is not None:
+            self.operateurs_croisement.recompense(self.croisement_choisi,valide,amelioration)
+        if self.operateurs_mutation is not None and self.mutation_choisie is not None:
+            self.operateurs_mutation.recompense(self.mutation_choisie,valide,amelioration)
+
+    def remplacement(self):
+        """
+        remplacement un sous-ensemble d'individus pour la reproduction.
+        """
+        if len(self.fitness_population)!=len(self.population):
+            self.index_population()
+
+        if  self.config.mode_remplacement == self.config.REMPLACEMENT_CHILD_ONLY:
+            self.population=self.new_population.copy()                                      # remplacer la population par les enfants 
+        elif  self.config.mode_remplacement == self.config.REMPLACEMENT_CHILD_ADD:
+            self.population+=self.new_population                                            # ajouter les enfants  à la population 
+        elif  self.config.mode_remplacement == self.config.REMPLACEMENT_MIXT_RAND:
+            self.population+=self.new_population
+            self.population=random.sample(self.population, self.config.size_population)     # Limitation à la taille de la population
+        else:#  self.config.mode_remplacement in (self.config.REMPLACEMENT_MIXT_BEST, self.config.REMPLACEMENT_PARETO):
+            population=self.population+self.new_population                                  # mixer parents et enfants
+            fitness=np.concatenate((self.fitness_population,[item.fitness for item in self.new_population]))
+            longueurs=np.concatenate((self.longueurs_population,[len(item.gen) for item in self.new_population])).astype(np.int64)
+            if len(population)>self.config.size_population:                                 # Limitation à la taille de la population
+                if self.config.mode_remplacement == self.config.REMPLACEMENT_PARETO:
+                    indices=ParetoToolsGP.selection(self.objectifs(population,fitness,longueurs),self.config.size_population)  # Fronts de Pareto (NSGA-II)
+                else:
+                    indices=self.meilleurs(self.scores(fitness,longueurs),self.config.size_population)
+                population=[population[i] for i in indices.tolist()]                       # Sélection partielle, par fitness croissante
+                fitness=fitness[indices]
+                longueurs=longueurs[indices]
+            self.population=population
+            self.fitness_population=fitness
+            self.longueurs_population=longueurs
+        if  self.config.mode_remplacement in (self.config.REMPLACEMENT_MIXT_BEST,self.config.REMPLACEMENT_PARETO):
+            self.index_best=int(np.argmin(self.fitness_population)) if len(self.population)>0 else -1
+        else:
+            self.index_population()                                                         # Index des fitness de la nouvelle population
+
+        self.config.size_population=len(self.population)
+        if self.config.size_echantillon>self.config.size_population:
+            self.config.size_echantillon=self.config.size_population
+
+
+#------------------------------------------------------------------------
+    def populate_generate(self,nombre=None):
+        """
+        Initialise la population en créant des individus jusqu'à atteindre la taille spécifiée.
+        Args:
+            nombre (int): Nombre d'individus à ajouter à la population (None : size_population).
+        """
+        if nombre is None:
+            nombre=self.config.size_population
+        rejet_doublons=self.config.mode_initialisation==self.config.INITIALISATION_RAMPED
+        genomes={item.write_gene() for item in self.population}        # Génomes déjà présents dans la population
+        self.compteurs_initialisation={'individus':0,'evaluations':0,'invalides':0,'doublons_rejetes':0}
+        for i in range(nombre):
+            if self.isStop():
+                break
+            newitem=ChromosomeGP(self.config,  'none')
+            tentatives=0
+            # Regénération des individus jusqu'à obtenir un génome nouveau et une fitness valide
+            while True:
+                self.initialise_individu(newitem,i)
+                genome=newitem.write_gene()
+                if rejet_doublons and genome in genomes and tentatives<AlgoGP.TENTATIVES_DOUBLON:
+                    tentatives+=1
+                    self.compteurs_initialisation['doublons_rejetes']+=1   # Évaluation économisée
+                    continue
+                self.calculate_fitness(newitem)
+                self.compteurs_initialisation['evaluations']+=1
+                if newitem.isFitnessValide() or self.isStop():
+                    break
+                self.compteurs_initialisation['invalides']+=1
+            # Ajout de l'individu à la population
+            genomes.add(genome)
+            self.population.append(newitem)
+            self.compteurs_initialisation['individus']+=1
+            self.setAvancement("Création de populations",i,nombre) # Mise à jour de l'interface graphique
+        self.compteurs_initialisation['diversite']=len(genomes)/len(self.population) if len(self.population)>0 else 0.0
+        self.compteurs['regenerations']=(self.compteurs.get('regenerations',0)+self.compteurs_initialisation['invalides']
+                                         +self.compteurs_initialisation['doublons_rejetes'])
+        if self.config.verbose :
+            print("Initialisation :",self.compteurs_initialisation)
+
+    def initialise_individu(self,item,i):
+        """
+        Crée le génome du i-ème nouvel individu : full ou grow au hasard à la profondeur max_depth, ou,
+        en mode ramped half-and-half, profondeur et méthode réparties selon i.
+        Args:
+            item (ChromosomeGP): Individu à initialiser.
+            i (int): Rang de l'individu parmi les individus créés.
+        """
+        if self.config.mode_initialisation==self.config.INITIALISATION_RAMPED:
+            profondeur_min=max(0,min(self.config.profondeur_min_initialisation,self.config.max_depth))
+            nb_profondeurs=self.config.max_depth-profondeur_min+1
+            methode='full' if (i//nb_profondeurs)%2==0 else 'grow'
+            item.initialise_Item(methode,profondeur_min+i%nb_profondeurs)
+        else:
+            item.initialise_Item('rand')
+
+    def populate_read(self,fichier):
+        """
+        Initialise la population en chargeant des individus à partir d'un fichier
+        (format binaire si le fichier se termine par .npz, format texte sinon).
+        """
+        if fichier.endswith(".npz"):
+            self.populate_read_npz(fichier)
+            return
+        self.population=[] # Vide la population existante
+        self.compteurs_lecture={'lignes':0,'vides':0,'mal_formees':0,'invalides':0,'acceptes':0}
+        limite=self.config.size_population if self.config.populate_limite else None
+
+        # Les lots de lignes sont analysés et évalués en parallèle (threads) si plusieurs workers sont disponibles ;
+        # les résultats sont repris dans l'ordre du fichier, avec au plus 2 lots en attente par worker.
+        with ThreadPoolExecutor(max_workers=max(1,self.config.nb_workers)) as executor:
+            en_cours=deque()
+            for lot in self.populate_lots(fichier):
+                if self.isStop():
+                    break
+                if self.config.nb_workers>1:
+                    en_cours.append(executor.submit(self.populate_lot,lot))
+                    if len(en_cours)<2*self.config.nb_workers:
+                        continue
+                    resultat=en_cours.popleft().result()
+                else:
+                    resultat=self.populate_lot(lot)
+                if self.populate_accepte(resultat,limite):
+                    break
+            else:
+                while len(en_cours)>0 and not self.populate_accepte(en_cours.popleft().result(),limite):
+                    pass
+            for future in en_cours:
+                future.cancel()
+
+        if self.config.verbose :
+            print("Lecture de",fichier,":",self.compteurs_lecture)
+        self.populate_ajuste()
+
+    def populate_lots(self,fichier):
+        """
+        Générateur : lit le fichier de population par lots de lignes, sans le charger entièrement.
+        """
+        lot=[]
+        with open(fichier, 'r') as file:
+            for line in file:
+                lot.append(line)
+                if len(lot)>=self.config.taille_lot_lecture:
+                    yield lot
+                    lot=[]
+        if len(lot)>0:
+            yield lot
+
+    def populate_lot(self,lot):
+        """
+        Analyse et évalue un lot de lignes.
+        Returns:
+            list: Individus valides du lot, dans l'ordre du fichier.
+            dict: Compteurs du lot (lignes, vides, mal formées, fitness invalides).
+        """
+        compteurs={'lignes':len(lot),'vides':0,'mal_formees':0,'invalides':0}
+        valides=[]
+        for line in lot:
+            line=line.strip()
+            if line=="" :
+                compteurs['vides']+=1
+                continue
+            newitem=ChromosomeGP(self.config, 'none')
+            try:
+                newitem.read_gene(line)
+                if newitem.position_fin_branche(0)!=len(newitem.gen):
+                    raise ValueError("arbre incomplet")
+                newitem.set_variables()
+            except Exception:
+                compteurs['mal_formees']+=1
+                continue
+            self.calculate_fitness(newitem)
+            if newitem.isFitnessValide():
+                valides.append(newitem)
+            else:
+                compteurs['invalides']+=1
+        return valides,compteurs
+
+    def populate_accepte(self,resultat,limite):
+        """
+        Ajoute à la population les individus valides d'un lot.
+        Returns:
+            bool: True si la limite de population est atteinte.
+        """
+        valides,compteurs=resultat
+        for key,val in compteurs.items():
+            self.compteurs_lecture[key]+=val
+        if limite is not None:
+            valides=valides[:limite-len(self.population)]
+        self.population+=valides # Ajout des individus valides à la population
+        self.compteurs_lecture['acceptes']=len(self.population)
+        return limite is not None and len(self.population)>=limite
+
+    def populate_read_npz(self,fichier):
+        """
+        Initialise la population à partir d'un fichier binaire .npz.
+        Les fitness mémorisées sont reprises si le fichier a été écrit pour le même jeu de données,
+        sinon elles sont recalculées.
+        """
+        tableaux=PopulationCodecGP.read(fichier)
+        population=PopulationCodecGP.decode(tableaux,self.config)
+        if self.config.populate_limite:
+            population=population[:self.config.size_population]
+        if tableaux['empreinte']!=self.dataset.empreinte():
+            if self.config.verbose :
+                print("Jeu de données différent : recalcul des fitness")
+            for item in population:
+                self.calculate_fitness(item)
+        self.population=[item for item in population if item.isFitnessValide()] # Ajout des individus valides à la population
+        self.populate_ajuste()
+
+    def populate_ajuste(self):
+        """
+        Ajuste la taille de la population et de l'échantillon après un chargement.
+        """
+        self.config.size_population=len(self.population)
+        if self.config.size_echantillon>self.config.size_population:
+            self.config.size_echantillon=self.config.size_population
+
+    def populate_write(self, fichier):
+        """
+        Écrire la population dans un fichier
+        (format binaire avec les fitness si le fichier se termine par .npz, format texte sinon).
+        """
+        if fichier.endswith(".npz"):
+            PopulationCodecGP.write(fichier,self.population,self.dataset.empreinte())
+            return
+        with open(fichier, 'w') as file:
+            for item in self.population:
+                file.write(item.write_gene()+"\n")  # Conversion des génomes en chaîne de caractères
+#------------------------------------------------------------------------
+
+    def calculate_fitness(self,chromosome):
+        """
+        Calcule la fitness d'un individu sur le jeu de données, en comptant les évaluations.
+        """
+        with self.verrou_evaluations:
+            self.nb_evaluations+=1
+            self.nb_evaluations_points+=len(self.dataset)
+        chrono=self.chronometre.top()
+        fitness=chromosome.calculate_fitness(self.dataset)
+        if self.chronometre.actif:
+            with self.verrou_evaluations:
+                self.chronometre.ajoute('evaluation',chrono)
+        return fitness
+
+    def termine_generation(self,iteration):
+        """
+        Relève les temps par phase et les compteurs de la génération terminée (cf ChronometreGP), et les affiche en mode verbeux.
+        Args:
+            iteration (int): Numéro de la génération (-1 : population initiale).
+        """
+        compteurs={'evaluations':self.nb_evaluations}
+        for key in ('enfants','rejets_croisement','rejets_profondeur','rejets_fitness','regenerations'):
+            compteurs[key]=self.compteurs.get(key,0)
+        mesure=self.chronometre.termine(iteration,compteurs)
+        if mesure is None:
+            return
+        if self.config.verbose and self.config.chronometrage:
+            print("Phases :",{key:round(val,4) for key,val in mesure.items()})
+        if self.telemetrie is not None:
+            self.telemetrie.ecrit(self.enregistrement_telemetrie(mesure))
+
+    def enregistrement_telemetrie(self,mesure):
+        """
+        Enregistrement de télémétrie d'une génération.
+        Args:
+            mesure (dict): Mesure de la génération (cf ChronometreGP.termine).
+        Returns:
+            dict: Itération, temps écoulé, meilleure fitness et fitness médiane, longueur moyenne, taille de la population,
+                  évaluations (cumulées et de la génération), enfants, taux de rejet par cause, régénérations et temps par phase.
+        """
+        if len(self.fitness_population)!=len(self.population):
+            self.index_population()
+        enfants=mesure['enfants']
+        return {'iteration':mesure['generation'],
+                'temps':round(self.elapsed_time,6),
+                'fitness':float(self.fitness_population[self.index_best]) if len(self.population)>0 else None,
+                'fitness_mediane':float(np.median(self.fitness_population)) if len(self.population)>0 else None,
+                'longueur_moyenne':round(self.longueur_moyenne(),4),
+                'taille_population':len(self.population),
+                'evaluations':self.nb_evaluations,
+                'evaluations_generation':mesure['evaluations'],
+                'enfants':enfants,
+                'taux_rejet':{cause:(mesure['rejets_'+cause]/enfants if enfants>0 else 0.0) for cause in ('croisement','profondeur','fitness')},
+                'regenerations':mesure['regenerations'],
+                'phases':{phase:round(mesure[phase],6) for phase in ChronometreGP.PHASES+('autres','duree')},
+                'memoire':dict(self.memoire.derniere) if self.memoire.derniere is not None and self.memoire.derniere['iteration']==mesure['generation'] else None}
+
+    def surveille_memoire(self,iteration):
+        """
+        Mesure l'empreinte mémoire si une mesure est due (cf MemoireGP), et signale l'approche ou le dépassement du plafond.
+        Args:
+            iteration (int): Numéro de la génération.
+        """
+        if not self.memoire.echeance(iteration):
+            return
+        mesure=self.memoire.mesure(iteration,self.population)
+        if self.config.verbose:
+            print("Mémoire :",mesure)
+        if mesure['etat']!="ok":
+            print("Mémoire : plafond de",self.memoire.plafond,"Mo",("dépassé, arrêt" if mesure['etat']=="arret" else "bientôt atteint"),
+                  "à l'itération",iteration,"( rss",mesure['rss_mo'],"Mo, population",mesure['population'],")",file=sys.stderr)
+
+    def get_phases(self):
+        """
+        Temps par phase et compteurs relevés à chaque génération (chronometrage activé).
+        Returns:
+            dict: Mesures par génération ('generations') et leurs totaux ('totaux').
+        """
+        return {'generations':[dict(mesure) for mesure in self.chronometre.generations],'totaux':self.chronometre.totaux()}
+
+    def budget_epuise(self):
+        """
+        Vérifie si le budget d'évaluations (max_evaluations) ou de points évalués (max_evaluations_points) est épuisé.
+        """
+        return ((self.config.max_evaluations>0 and self.nb_evaluations>=self.config.max_evaluations)
+                or (self.config.max_evaluations_points>0 and self.nb_evaluations_points>=self.config.max_evaluations_points))
+
+    def generation_epuisee(self,debut):
+        """
+        Vérifie si la production des enfants de la génération doit s'interrompre : budget d'évaluations épuisé,
+        ou durée de la génération (duree_generation) dépassée.
+        Args:
+            debut (float): Début de la génération (time.time()).
+        """
+        return self.budget_epuise() or (self.config.duree_generation>0 and time.time()-debut>self.config.duree_generation)
+
+    def isStop(self):
+        """
+        Vérifie si l'algorithme doit s'arrêter.
+        """
+        return  self.stop
+
+    def setStop(self):
+        """
+        Vérifie si l'algorithme doit s'arrêter.
+        """
+        self.stop=True
+
+    def setAvancement(self,str_message,pos_value,max_value):
+        """
+        Met à jour l'interface graphique avec l'état d'avancement.
+        """
+        if self.widget is not None:
+            chrono=self.chronometre.top()
+            self.widget.set_jauge_value(str_message,pos_value,max_value)
+            self.chronometre.ajoute('interface',chrono)
+
+    def affiche_resultats(self):
+        """
+        Affiche les résultats finaux de l'algorithme.
+        """
+        if self.widget is not None:
+            self.widget.affiche_resultats()
+
+    def affiche_chromosome(self,iteration,chromosome):
+        """
+        Met à jour l'interface graphique avec le  chromosome.
+        """
+        if self.widget is not None:
+            chrono=self.chronometre.top()
+            self.widget.affiche_chromosome(iteration,chromosome)
+            self.chronometre.ajoute('interface',chrono)
+
+    def get_best(self):
+        """
+        Récupère le meilleur individu de la population.
+        """
+        if len(self.population) ==0:
+            return None
+        if len(self.fitness_population)!=len(self.population):
+            self.index_population()
+        return self.population[self.index_best]
+
+    def index_population(self):
+        """
+        Reconstruit l'index des fitness de la population et la position du meilleur individu.
+        """
+        self.fitness_population=np.fromiter((item.fitness for item in self.population),dtype=np.float64,count=len(self.population))
+        self.longueurs_population=np.fromiter((len(item.gen) for item in self.population),dtype=np.int64,count=len(self.population))
+        self.index_best=int(np.argmin(self.fitness_population)) if len(self.population)>0 else -1
+
+    def scores(self,fitness,longueurs):
+        """
+        Clés de classement (à minimiser) selon la pression de parcimonie configurée.
+            aucune   : la fitness.
+            lineaire : fitness + coef_parcimonie * longueur du génome.
+            lexico   : rang dans l'ordre (fitness, longueur) : à fitness égale, le génome le plus court l'emporte.
+        Args:
+            fitness (np.ndarray): Fitness des individus.
+            longueurs (np.ndarray): Longueurs des génomes.
+        Returns:
+            np.ndarray: Clés de classement.
+        """
+        if self.config.mode_parcimonie==self.config.PARCIMONIE_LINEAIRE:
+            return fitness+self.config.coef_parcimonie*longueurs
+        elif self.config.mode_parcimonie==self.config.PARCIMONIE_LEXICO:
+            rangs=np.empty(len(fitness),dtype=np.float64)
+            rangs[np.lexsort((longueurs,fitness))]=np.arange(len(fitness))
+            return rangs
+        return fitness
+
+    def objectifs(self,population,fitness,longueurs):
+        """
+        Objectifs (à minimiser) du remplacement pareto : la fitness, et la longueur du génome ou le coût
+        d'évaluation estimé (cf ChromosomeGP.cout) selon objectif_taille.
+        Args:
+            population (list): Individus.
+            fitness (np.ndarray): Fitness des individus.
+            longueurs (np.ndarray): Longueurs des génomes.
+        Returns:
+            np.ndarray: Matrice des objectifs (n, 2).
+        """
+        if self.config.objectif_taille==self.config.OBJECTIF_COUT:
+            longueurs=np.fromiter((item.cout() for item in population),dtype=np.int64,count=len(population))
+        return np.column_stack((fitness,longueurs))
+
+    def front_pareto(self):
+        """
+        Front de Pareto (erreur, taille) de la population, par fitness croissante ; un seul individu
+        est gardé par couple d'objectifs.
+        Returns:
+            list: Couples (individu, taille).
+        """
+        if len(self.fitness_population)!=len(self.population):
+            self.index_population()
+        objectifs=self.objectifs(self.population,self.fitness_population,self.longueurs_population)
+        front=np.flatnonzero(ParetoToolsGP.rangs(objectifs)==0)
+        objectifs_front,distincts=np.unique(objectifs[front],axis=0,return_index=True)   # Tri lexicographique (fitness, taille)
+        return [(self.population[i],int(taille)) for i,taille in zip(front[distincts].tolist(),objectifs_front[:,1].tolist())]
+
+    def taux_rejet(self):
+        """
+        Proportion des enfants demandés au croisement qui n'ont pas rejoint la nouvelle population.
+        """
+        if self.compteurs.get('enfants',0)==0:
+            return 0.0
+        rejets=self.compteurs['rejets_croisement']+self.compteurs['rejets_profondeur']+self.compteurs['rejets_fitness']
+        return rejets/self.compteurs['enfants']
+
+    def longueur_moyenne(self):
+        """
+        Longueur moyenne des génomes de la population.
+        """
+        if len(self.longueurs_population)!=len(self.population):
+            self.index_population()
+        return float(np.mean(self.longueurs_population)) if len(self.population)>0 else 0.0
+
+    def meilleurs(self,fitness,nombre):
+        """
+        Renvoie les indices des `nombre` plus petites valeurs de fitness, par fitness croissante.
+        La sélection partielle (np.partition) évite de trier toute la population : seuls les candidats
+        dont la fitness ne dépasse pas la valeur de rang `nombre` sont triés, de façon stable. À fitness
+        égale, la position la plus petite l'emporte, comme avec un tri stable de toute la population.
+        Args:
+            fitness (np.ndarray): Fitness des individus.
+            nombre (int): Nombre d'indices à renvoyer.
+        Returns:
+            np.ndarray: Indices des meilleurs individus.
+        """
+        nombre=min(nombre,len(fitness))
+        if nombre<=0:
+            return np.empty(0,dtype=np.int64)
+        if nombre<len(fitness):
+            limite=np.partition(fitness,nombre-1)[nombre-1]    # Valeur de rang nombre
+            indices=np.flatnonzero(fitness<=limite)             # Candidats, par position croissante
+        else:
+            indices=np.arange(len(fitness))
+        return indices[np.argsort(fitness[indices],kind='stable')][0:nombre]
+
+    def get_best_iteration(self,iteration):
+        """
+        Récupère le meilleur individu d'une itération donnée.
+        """
+        return self.historique.get(iteration,self.config)
@@ -0,0 +1,96 @@
+import os
+import pickle
+import threading
+import time
+
+"""
+La classe CheckpointGP gère les points de reprise (checkpoints) d'une exécution longue.
+
+Un point de reprise est un dictionnaire (cf AlgoGP.checkpoint_etat) contenant la population,
+l'historique des meilleurs résultats, le compteur d'itérations, le temps écoulé, la configuration
+et l'état des deux générateurs aléatoires (random et np.random).
+
+Fonctionnement
+	echeance : indique si un point de reprise est dû (toutes les N itérations ou toutes les T secondes).
+	save : écrit le point de reprise dans un thread séparé, pour ne pas bloquer la boucle principale.
+	       L'écriture est atomique : fichier temporaire dans le même répertoire puis os.replace,
+	       de sorte qu'un arrêt brutal laisse toujours le point de reprise précédent intact.
+	attend : attend la fin de l'écriture en cours.
+	load : relit un point de reprise.
+"""
+
+class CheckpointGP():
+
+    def __init__(self, fichier, nb_iterations=0, duree=0):
+        """
+        Initialise le gestionnaire de points de reprise.
+        Args:
+            fichier (str): Fichier du point de reprise.
+            nb_iterations (int): Période en itérations (0 : désactivé).
+            duree (float): Période en secondes (0 : désactivé).
+        """
+        self.fichier = fichier
+        self.nb_iterations = nb_iterations
+        self.duree = duree
+        self.thread = None
+        self.derniere_sauvegarde = time.time()
+
+    def echeance(self, iteration):
+        """
+        Indique si un point de reprise doit être écrit après l'itération donnée.
+        Args:
+            iteration (int): Nombre d'itérations effectuées.
+        Returns:
+            bool: True si un point de reprise est dû.
+        """
+        if self.fichier == "":
+            return False
+        if self.nb_iterations > 0 and iteration % self.nb_iterations == 0:
+            return True
+        if self.duree > 0 and time.time() - self.derniere_sauvegarde >= self.duree:
+            return True
+        return False
+
+    def save(self, etat):
+        """
+        Écrit un point de reprise en arrière-plan.
+        Args:
+            etat (dict): État de l'algorithme (déjà copié : il n'est plus modifié par la suite).
+        """
+        self.attend()
+        self.derniere_sauvegarde = time.time()
+        self.thread = threading.Thread(target=CheckpointGP.write, args=(self.fichier, etat), daemon=True)
+        self.thread.start()
+
+    def attend(self):
+        """
+        Attend la fin de l'écriture en cours, s'il y en a une.
+        """
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def write(fichier, etat):
+        """
+        Écrit un point de reprise de façon atomique.
+        Args:
+            fichier (str): Fichier du point de reprise.
+            etat (dict): État de l'algorithme.
+        """
+        fichier_tmp = fichier + ".tmp"
+        with open(fichier_tmp, 'wb') as file:
+            pickle.dump(etat, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(fichier_tmp, fichier)
+
+    def load(fichier):
+        """
+        Relit un point de reprise.
+        Args:
+            fichier (str): Fichier du point de reprise.
+        Returns:
+            dict: État de l'algorithme.
+        """
+        with open(fichier, 'rb') as file:
+            return pickle.load(file)
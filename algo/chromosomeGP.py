@@ -1,438 +1,670 @@
-import numpy as np
-import random
-import math
-from algo.geneGP import GeneGP
-"""
-ChromosomeGP:
-Cette classe représente un individu génétique sous forme de chromosome dans un algorithme de programmation génétique (GP), et elle contient des méthodes pour gérer la création, l'évaluation, la mutation, et le croisement des chromosomes.
-
-Attributs
-	genes : Liste des gènes du chromosome, où chaque gène peut être une fonction ou un terminal.
-	fitness : La valeur de fitness du chromosome, qui évalue sa performance par rapport à une solution optimale.
-	max_genes : Le nombre maximal de gènes dans le chromosome, ce qui détermine la "taille" du chromosome.
-Méthodes principales
-	initialise_chromosome : Initialise le chromosome en fonction de la méthode spécifiée (full, grow, etc.).
-	full : Crée un chromosome complet, où tous les gènes sont remplis de fonctions ou de terminaux.
-	grow : Crée un chromosome en mélangeant des fonctions et des terminaux, avec une probabilité plus élevée de choisir des terminaux.
-	calculate_fitness : Calcule la fitness du chromosome en comparant ses sorties avec les sorties attendues pour un ensemble d'entrées.
-	mutate : Applique une mutation sur un gène aléatoire du chromosome, modifiant ainsi sa structure génétique.
-	cross_over : Applique un croisement entre ce chromosome et un autre (le père), générant un nouvel enfant avec les gènes des deux parents.
-	evaluate : Évalue le chromosome pour une donnée d'entrée en calculant le résultat de chaque gène.
-""" 
-
-class ChromosomeGP():
-    """
-    Classe représentant un individu génétique sous forme de chromosome dans un algorithme de programmation génétique.
-    Cette classe hérite de `ItemGP` et implémente les méthodes spécifiques pour manipuler des chromosomes.
-    
-    Attributs :
-        genes (list): Liste représentant les gènes du chromosome. Chaque gène peut être une fonction ou un terminal.
-        fitness (float): La valeur de fitness de l'individu, indiquant sa performance par rapport à la solution optimale.
-        depth : La profondeur   de l'individu. Cela détermine la "taille" ou la complexité maximale de l'individu dans l'algorithme génétique.
-        config : Instance de la boite de configuration.
-        fitness : La valeur de fitness de l'individu, représentant sa performance ou son adéquation avec la solution optimale. Initialisée à NaN jusqu'à ce qu'elle soit calculée.
-    """
-    def __init__(self, config, method='full'):
-        """
-        Initialise un chromosome génétique avec une profondeur donnée, une méthode d'initialisation et un nombre maximal de gènes.
-
-        Args:
-            config (obj): Instance de la boite de config.
-            depth (int): Profondeur maximale de l'arbre ou du chromosome.
-            method (str): Méthode d'initialisation du chromosome ('full', 'grow', etc.).
-        """
-        self.generation=0            # indice de génération
-        self.gen = []                # Liste des gènes du chromosome.
-        self._depth = 0              # Profondeur de l'individu.
-        self.formule=""              # équation au format texte
-        self.config = config           # Instance de la boite à outils génétique.
-        self.fitness = float('nan')  # Initialisation de la fitness à NaN (indique qu'il n'a pas encore été évalué).
-        self.initialise_Item(method) # Initialisation de l'individu avec la méthode spécifiée.
-
-#-----------------------------------------------------------------------------
-
-    def initialise_Item(self, method):
-        """
-        Initialise l'individu génétique en fonction de la méthode spécifiée.
-
-        Args:
-            method (str): Méthode d'initialisation de l'individu ('none', 'full', 'grow', etc.).
-        """
-        self.gen = []  # Initialise les éléments de base de l'individu.
-        if method == 'none':
-            return  # Si aucune méthode, rien n'est fait.
-        elif method == 'full':
-            self.full()  # Crée l'individu avec la méthode 'full'.
-        elif method == 'grow':
-            self.grow()  # Crée l'individu avec la méthode 'grow'.
-        else:
-            # Si aucune méthode explicite, choisit aléatoirement entre 'full' et 'grow'.
-            if random.random() > 0.5:
-                self.grow()
-            else:
-                self.full()
-        self.set_variables()
-
-    def full(self, level = 0):
-        """
-        Crée un chromosome complet, c'est-à-dire un chromosome où tous les gènes sont des fonctions ou des terminaux
-        jusqu'à la profondeur maximale spécifiée.
-
-        Cette méthode construit un chromosome dont chaque gène est un élément complet, en remplissant l'arbre génétique
-        avec des fonctions et des terminaux jusqu'à la profondeur maximale.
-
-        Retourne:
-            None
-        """
-        if level == self.config.max_depth:
-            self.gen.append(GeneGP.random_choice_terminal())
-        else:
-            elem = GeneGP.random_choice_fonction() #pour pouvoir choisir aleéatoirement dans toutes les fonctions unaires et binaires
-            if elem.is_fonction_binaire():
-                self.gen.append(elem)
-                self.full(level + 1)
-                self.full(level + 1) # une fois à droite et une fois à gauche (car fct binaire)
-            else: #fonction unaire
-                self.gen.append(elem)
-                self.full(level + 1)
-        
-    def grow(self, level = 0):
-        """
-        Crée un chromosome en utilisant la méthode 'grow', qui consiste à mélanger des fonctions et des terminaux
-        tout en ayant une probabilité plus élevée de sélectionner des terminaux à des niveaux plus profonds.
-
-        Cette méthode génère un chromosome où certains gènes peuvent être des fonctions et d'autres des terminaux.
-        Le nombre de terminaux augmente à mesure que l'on descend dans l'arbre.
-
-        Retourne:
-            None
-        """
-        if level == self.config.max_depth:
-            self.gen.append(GeneGP.random_choice_terminal())
-        else:
-            if random.random() < 0.5:
-                elem = GeneGP.random_choice_fonction()
-                if elem.is_fonction_binaire():
-                    self.gen.append(elem)
-                    self.grow(level + 1)
-                    self.grow(level + 1)
-                else:
-                    self.gen.append(elem)
-                    self.grow(level + 1)
-            else:
-                elem = GeneGP.random_choice_terminal()
-                self.gen.append(elem)
-#-----------------------------------------------------------------------------
-    def isFitnessValide(self):
-        """
-        Vérifie si la fitness de l'individu est valide (c'est-à-dire non NaN et non infinie).
-        
-        Returns:
-            bool: True si la fitness est valide, False sinon.
-        """
-        return not math.isnan(self.fitness) and not math.isinf(self.fitness)
-
-    def calculate_fitness(self, inputs, outputs):
-        """
-        Calcule la fitness de l'individu en fonction des entrées et sorties fournies.
-
-        Args:
-            inputs (list): Liste des entrées à utiliser pour l'évaluation.
-            outputs (list): Liste des sorties attendues pour chaque entrée.
-
-        Returns:
-            float: La fitness calculée de l'individu.
-        """
-        diff = 0  # Variable pour accumuler les différences quadratiques.
- 
-        # Calcule la différence entre la sortie attendue et la sortie générée pour chaque entrée.
-        try:
-            for i in range(len(inputs)):
-
-                eval_in = self.evaluate(inputs[i])  # Évalue l'individu pour une entrée donnée : cf ChromosomeGP
-                val_out = outputs[i]  # Valeur attendue pour cette entrée.
-                ecart = eval_in - val_out  # Écart entre la sortie et la valeur attendue.
-                diff += ecart ** 2  # Ajoute le carré de l'écart à la différence totale.
-
-            # Calcule la moyenne des différences quadratiques et renvoie la fitness.
-            self.fitness = np.sqrt(diff) / len(inputs)
-            return self.fitness
-
-        except Exception as ex:
-            # Si une exception se produit lors de l'évaluation, marque la fitness comme NaN.
-            self.fitness = float('nan')
-            return float('nan')
-
-    def evaluate(self, input):
-        """
-        Évalue le chromosome pour une donnée d'entrée spécifique.
-        Args:
-            input (float): Valeur d'entrée.
-        Retourne:
-            float: Résultat de l'évaluation.
-        """
-        return self.__evaluate(input,0)[0]
-        
-    def __evaluate(self, input, position = 0): #fct auxiliaire 
-        elem=self.gen[position]
-        if elem.is_terminal(): 
-            return elem.evaluate(input),position  
-        elif elem.is_fonction_binaire():
-            left, position  = self.__evaluate(input, position + 1)
-            right, position = self.__evaluate(input, position + 1)
-            return elem.evaluate(left,right),position
-        else:
-            left, position = self.__evaluate(input, position + 1)
-            return elem.evaluate(left),position
-
-#-----------------------------------------------------------------------------
-
-    def croisement_middle(mother, father):
-        """
-        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
-        Args:
-            father (Chromosome): Chromosome père.
-        Returns:
-            Chromosome: Nouveau chromosome issu du croisement.
-        """
-        len_mother= len(mother.gen)
-        len_father= len(father.gen)
-
-        child1 = ChromosomeGP(mother.config, 'none')
-        child2 = ChromosomeGP(father.config,  'none')
-        start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
-        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
-        start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
-        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
-        child1.gen = mother.gen[:start_m] + father.gen[start_f : end_f] + mother.gen[end_m :]# Affecte les gènes croisés à l'enfant 1
-        child2.gen = father.gen[:start_f] + mother.gen[start_m : end_m] + father.gen[end_f :]# Affecte les gènes croisés à l'enfant 2
-        child1.set_variables()
-        child2.set_variables()
-        return child1,child2
-
-    def croisement_absorption_partielle(mother, father):
-        """
-        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
-        Args:
-            father (Chromosome): Chromosome père.
-        Returns:
-            Chromosome: Nouveau chromosome issu du croisement.
-        """
-        len_mother= len(mother.gen)
-        len_father= len(father.gen)
-
-        child1 = ChromosomeGP(mother.config, 'none')
-        child2 = ChromosomeGP(father.config,  'none')
-        start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
-        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
-        start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
-        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
-        child1.gen = mother.gen[:start_m]+ father.gen[:start_f]+mother.gen[start_m : end_m]+father.gen[end_f :]+ mother.gen[end_m :] 
-        child2.gen = father.gen[:start_f]+ mother.gen[:start_m]+father.gen[start_f : end_f]+mother.gen[end_m :]+ father.gen[end_f :]
-        child1.set_variables()
-        child2.set_variables()
-        return child1,child2
-
-    def croisement_absorption_totale(mother, father):
-        """
-        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
-        Args:
-            father (Chromosome): Chromosome père.
-        Returns:
-            Chromosome: Nouveau chromosome issu du croisement.
-        """
-        len_mother= len(mother.gen)
-        len_father= len(father.gen)
-
-        child1 = ChromosomeGP(mother.config, 'none')
-        child2 = ChromosomeGP(father.config,  'none')
-        start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
-        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
-        start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
-        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
-        child1.gen = mother.gen[:start_m] + father.gen + mother.gen[end_m :]# Affecte les gènes croisés à l'enfant 1
-        child2.gen = father.gen[:start_f] + mother.gen + father.gen[end_f :]# Affecte les gènes croisés à l'enfant 2
-        child1.set_variables()
-        child2.set_variables()
-        return child1,child2
-
-#------------------------------------------------------------------------
-    def mutate_remplace(self):
-        """
-        Applique une mutation sur un gène aléatoire du chromosome.
-        """
-        position = np.random.randint(len(self.gen))
-
-        element=self.gen[position]
-
-        if element.is_fonction():
-            if  element.is_fonction_unaire():
-                self.gen[position] = GeneGP.random_choice_fonction_unaire()
-            else:
-                self.gen[position] = GeneGP.random_choice_fonction_binaire()
-        else:
-            self.gen[position] = GeneGP.random_choice_terminal()
-
-        self.set_variables()
-
-
-    def mutate_swap(self):
-        """
-        Applique une mutation d'échange de la position de deux gènes du chromosome de façon  aléatoire .
-        """
-        if len(self.gen)<=3:
-            return
-        start_1 = np.random.randint(1,len(self.gen))
-        end_1   = self.position_fin_branche(start_1 )#fin de la branche issue de la position start_1 dans le tableau du chromosome   
-        start_2 = np.random.randint(1,len(self.gen))
-        end_2   = self.position_fin_branche(start_2 )#fin de la branche issue de la position start_2 dans le tableau du chromosome 
-
-        #if self.gen[start_1].type_gen!=self.gen[start_2].type_gen:
-        #    return
-
-        if (start_1<=start_2 and start_2<=end_1) or (start_2<=start_1 and start_1<=end_2):
-            #print ("aucun traitement")
-            return
-        if start_1 < start_2 :
-            self.gen = self.gen[:start_1] + self.gen[start_2 : end_2] + self.gen[end_1 :start_2] + self.gen[start_1 : end_1] + self.gen[end_2 :]
-        else:
-            self.gen = self.gen[:start_2] + self.gen[start_1 : end_1] + self.gen[end_2 :start_1] + self.gen[start_2 : end_2] + self.gen[end_1 :]
-        self.set_variables()
-   
-    def mutate_deplace(self):
-        """
-        Applique une mutation sur un gène aléatoire du chromosome en déplaçant sa position.
-        """
-        if len(self.gen)<=2:
-            return
-        start_1 = np.random.randint(1,len(self.gen))
-        end_1   = self.position_fin_branche(start_1 )#fin de la branche issue de la position start_1 dans le tableau du chromosome   
-
-        max_iteration=10
-        cpt=0
-        while  cpt<max_iteration:
-            pos_cible = np.random.randint(len(self.gen))
-            element=self.gen[pos_cible]
-            if (start_1>pos_cible or pos_cible>end_1) :
-                if  element.is_terminal()  :
-                    break
-            cpt+=1
-        if cpt==max_iteration:
-            return
-
-        #print(start_1,end_1,self.gen[start_1 : end_1],pos_cible,element)
-
-        nullElement=[GeneGP.create_gene(GeneGP.TYPE_GEN_TERMINAL_INTEGER,0)]
-        if start_1 > pos_cible :
-            self.gen = self.gen[:pos_cible] + self.gen[start_1 : end_1] + self.gen[pos_cible+1 :start_1]+ nullElement+ self.gen[end_1 :]
-        else:
-            self.gen = self.gen[:start_1] +nullElement+ self.gen[end_1 :pos_cible] + self.gen[start_1 : end_1] + self.gen[pos_cible+1 :]
-
-        self.set_variables()
-
-#------------------------------------------------------------------------
-    def read_gene(self,str_line):
-        """
-        Lit un gène depuis une chaîne de caractères.
-        Args:
-            str_line (str): La ligne représentant le gène.
-        Returns:
-            list: Liste de valeurs représentant le gène.
-        """
-        self.gen=[]
-        items=str_line.split(';')
-        for item in items:
-            valeur,type_val=item.split(':')
-            elem=GeneGP.read_str(int(type_val),valeur)
-            self.gen.append(elem)
-
-
-
-    def write_gene(self):
-        """
-        Écrit un gène sous forme de chaîne de caractères.
-        Args:
-            gen (list): Le gène sous forme de liste.
-        Returns:
-            str: La chaîne de caractères représentant le gène.
-        """
-        strOut=""
-        for item in self.gen:
-           if strOut!="" : strOut+=";"
-           strOut+= item.write_str() 
-        return strOut
-#------------------------------------------------------------------------
-    def set_variables(self):
-        """
-        Méthode auxiliaire pour calculer la profondeur.
-         Returns:
-           int: profondeur.
-        """        
-        self.depth   = self.__get_depth_aux()[0] - 1
-        self.formule = self.__formule_aux(0)[1]
-    def trace(self):
-        strOut=""
-        for item in self.gen:
-           if strOut!="" : strOut+=" "
-           strOut+= item.name_gen 
-        print(strOut)
-#------------------------------------------------------------------------
-    def position_fin_branche(self,position):
-        """
-        parcourt le tableau de genes jusqu'a la fin de l'arbre.
-        Args:
-            position (int): position courante dans le tableau de gen.
-        Returns:
-             position de la fin de l'arbre.
-        """
-        if self.gen[position].is_terminal () :
-            return position + 1
-        elif self.gen[position].is_fonction_unaire ():
-            return self.position_fin_branche(position + 1)
-        else:
-            new_position = self.position_fin_branche(position + 1)
-            return self.position_fin_branche(new_position)
-#------------------------------------------------------------------------
-
-    def __get_depth_aux(self, position = 0):
-        """
-        Méthode auxiliaire pour calculer la profondeur.
-        Args:
-            position (int): position courante dans le tableau de gen.
-        Returns:
-            int: position courante.
-            int: profondeur.
-        """        
-        elem = self.gen[position]
-        
-        if elem.is_fonction_binaire():
-            left, position = self.__get_depth_aux(position + 1)
-            right, position = self.__get_depth_aux(position)
-
-            return 1 + max(left, right), position
-        elif elem.is_fonction_unaire():
-            left, position = self.__get_depth_aux(position + 1)
-            return left + 1, position
-        else:
-            return 1, position + 1
-#------------------------------------------------------------------------
- 
-    def __formule_aux(self, position ):
-        """
-        Méthode auxiliaire pour générer la formule lisible.
-        Args:
-            position (int): position courante dans le tableau de gen.
-        Returns:
-           str: formules au format texte
-        """        
-        elem=self.gen[position]        
-        if elem.is_terminal(): 
-            return position,elem.writeStr()
-        elif elem.is_fonction_binaire():
-            position,str_next1=self.__formule_aux(position + 1)
-            position,str_next2=self.__formule_aux(position + 1)
-            return position,elem.writeStr(str_next1,str_next2)
-        elif elem.is_fonction_unaire():
-            position,str_next=self.__formule_aux(position + 1)
-            return position,elem.writeStr(str_next)
-
+import numpy as np
+import random
+import math
+from algo.geneGP import GeneGP
+"""
+ChromosomeGP:
+Cette classe représente un individu génétique sous forme de chromosome dans un algorithme de programmation génétique (GP), et elle contient des méthodes pour gérer la création, l'évaluation, la mutation, et le croisement des chromosomes.
+
+Attributs
+	genes : Liste des gènes du chromosome, où chaque gène peut être une fonction ou un terminal.
+	fitness : La valeur de fitness du chromosome, qui évalue sa performance par rapport à une solution optimale.
+	max_genes : Le nombre maximal de gènes dans le chromosome, ce qui détermine la "taille" du chromosome.
+Méthodes principales
+	initialise_chromosome : Initialise le chromosome en fonction de la méthode spécifiée (full, grow, etc.).
+	full : Crée un chromosome complet, où tous les gènes sont remplis de fonctions ou de terminaux.
+	grow : Crée un chromosome en mélangeant des fonctions et des terminaux, avec une probabilité plus élevée de choisir des terminaux.
+	calculate_fitness : Calcule la fitness du chromosome en comparant ses sorties avec les sorties attendues pour un ensemble d'entrées.
+	mutate : Applique une mutation sur un gène aléatoire du chromosome, modifiant ainsi sa structure génétique.
+	cross_over : Applique un croisement entre ce chromosome et un autre (le père), générant un nouvel enfant avec les gènes des deux parents.
+	evaluate : Évalue le chromosome pour une donnée d'entrée en calculant le résultat de chaque gène.
+""" 
+
+class ChromosomeGP():
+    """
+    Classe représentant un individu génétique sous forme de chromosome dans un algorithme de programmation génétique.
+    Cette classe hérite de `ItemGP` et implémente les méthodes spécifiques pour manipuler des chromosomes.
+    
+    Attributs :
+        genes (list): Liste représentant les gènes du chromosome. Chaque gène peut être une fonction ou un terminal.
+        fitness (float): La valeur de fitness de l'individu, indiquant sa performance par rapport à la solution optimale.
+        depth : La profondeur   de l'individu. Cela détermine la "taille" ou la complexité maximale de l'individu dans l'algorithme génétique.
+        config : Instance de la boite de configuration.
+        fitness : La valeur de fitness de l'individu, représentant sa performance ou son adéquation avec la solution optimale. Initialisée à NaN jusqu'à ce qu'elle soit calculée.
+    """
+    def __init__(self, config, method='full'):
+        """
+        Initialise un chromosome génétique avec une profondeur donnée, une méthode d'initialisation et un nombre maximal de gènes.
+
+        Args:
+            config (obj): Instance de la boite de config.
+            depth (int): Profondeur maximale de l'arbre ou du chromosome.
+            method (str): Méthode d'initialisation du chromosome ('full', 'grow', etc.).
+        """
+        self.generation=0            # indice de génération
+        self.gen = []                # Liste des gènes du chromosome.
+        self._depth = 0              # Profondeur de l'individu.
+        self._formule=""             # équation au format texte (calculée à la demande, cf formule)
+        self._structure=None         # fins, hauteurs et niveaux des sous-arbres (calculés à la demande, cf structure)
+        self.config = config           # Instance de la boite à outils génétique.
+        self.fitness = float('nan')  # Initialisation de la fitness à NaN (indique qu'il n'a pas encore été évalué).
+        self.erreurs = None          # Erreurs absolues sur les cas retenus du jeu de données (cf DatasetGP.cas).
+        self.constantes_optimisees = False # Constantes déjà optimisées (cf ConstantesGP).
+        self.echelle = None          # Mise à l'échelle linéaire (a, b) de la sortie : a + b*f(x) (None : aucune).
+        self.initialise_Item(method) # Initialisation de l'individu avec la méthode spécifiée.
+
+#-----------------------------------------------------------------------------
+
+    def initialise_Item(self, method, profondeur = None):
+        """
+        Initialise l'individu génétique en fonction de la méthode spécifiée.
+
+        Args:
+            method (str): Méthode d'initialisation de l'individu ('none', 'full', 'grow', etc.).
+            profondeur (int): Profondeur de l'arbre à créer (None : max_depth).
+        """
+        self.gen = []  # Initialise les éléments de base de l'individu.
+        if method == 'none':
+            return  # Si aucune méthode, rien n'est fait.
+        elif method == 'full':
+            self.full(0, profondeur)  # Crée l'individu avec la méthode 'full'.
+        elif method == 'grow':
+            self.grow(0, profondeur)  # Crée l'individu avec la méthode 'grow'.
+        else:
+            # Si aucune méthode explicite, choisit aléatoirement entre 'full' et 'grow'.
+            if random.random() > 0.5:
+                self.grow(0, profondeur)
+            else:
+                self.full(0, profondeur)
+        self.set_variables()
+
+    def full(self, level = 0, profondeur = None):
+        """
+        Crée un chromosome complet, c'est-à-dire un chromosome où tous les gènes sont des fonctions ou des terminaux
+        jusqu'à la profondeur maximale spécifiée.
+
+        Cette méthode construit un chromosome dont chaque gène est un élément complet, en remplissant l'arbre génétique
+        avec des fonctions et des terminaux jusqu'à la profondeur maximale (ou la profondeur demandée).
+
+        Retourne:
+            None
+        """
+        if profondeur is None:
+            profondeur = self.config.max_depth
+        if level == profondeur:
+            self.gen.append(GeneGP.random_choice_terminal())
+        else:
+            elem = GeneGP.random_choice_fonction() #pour pouvoir choisir aleéatoirement dans toutes les fonctions unaires et binaires
+            if elem.is_fonction_binaire():
+                self.gen.append(elem)
+                self.full(level + 1, profondeur)
+                self.full(level + 1, profondeur) # une fois à droite et une fois à gauche (car fct binaire)
+            else: #fonction unaire
+                self.gen.append(elem)
+                self.full(level + 1, profondeur)
+        
+    def grow(self, level = 0, profondeur = None):
+        """
+        Crée un chromosome en utilisant la méthode 'grow', qui consiste à mélanger des fonctions et des terminaux
+        tout en ayant une probabilité plus élevée de sélectionner des terminaux à des niveaux plus profonds.
+
+        Cette méthode génère un chromosome où certains gènes peuvent être des fonctions et d'autres des terminaux.
+        Le nombre de terminaux augmente à mesure que l'on descend dans l'arbre.
+
+        Retourne:
+            None
+        """
+        if profondeur is None:
+            profondeur = self.config.max_depth
+        if level == profondeur:
+            self.gen.append(GeneGP.random_choice_terminal())
+        else:
+            if random.random() < 0.5:
+                elem = GeneGP.random_choice_fonction()
+                if elem.is_fonction_binaire():
+                    self.gen.append(elem)
+                    self.grow(level + 1, profondeur)
+                    self.grow(level + 1, profondeur)
+                else:
+                    self.gen.append(elem)
+                    self.grow(level + 1, profondeur)
+            else:
+                elem = GeneGP.random_choice_terminal()
+                self.gen.append(elem)
+#-----------------------------------------------------------------------------
+    def isFitnessValide(self):
+        """
+        Vérifie si la fitness de l'individu est valide (c'est-à-dire non NaN et non infinie).
+        
+        Returns:
+            bool: True si la fitness est valide, False sinon.
+        """
+        return not math.isnan(self.fitness) and not math.isinf(self.fitness)
+
+    def calculate_fitness(self, dataset):
+        """
+        Calcule la fitness de l'individu sur un jeu de données, parcouru par blocs.
+        Chaque bloc est évalué en une seule fois sur des tableaux NumPy, et la somme des
+        carrés des écarts est accumulée d'un bloc à l'autre.
+        Si le jeu de données désigne des cas (DatasetGP.cas), les erreurs absolues sur ces cas sont
+        conservées au passage dans self.erreurs (sélection lexicase), sans évaluation supplémentaire.
+
+        Args:
+            dataset (DatasetGP): Jeu de données (entrées et sorties attendues).
+
+        Returns:
+            float: La fitness calculée de l'individu.
+        """
+        if self.config.echelle_lineaire:
+            return self.calculate_fitness_echelle(dataset)
+        if self.echelle is not None:
+            self.echelle = None
+            self._formule = None
+        diff = 0  # Variable pour accumuler les différences quadratiques.
+        debut = 0 # Position du bloc courant dans le jeu de données.
+        erreurs = []
+
+        # Calcule la différence entre la sortie attendue et la sortie générée pour chaque bloc.
+        try:
+            for inputs, outputs in dataset.blocs():
+                eval_in = self.evaluate_brut(inputs)  # Évalue l'individu sur tout le bloc
+                ecart = eval_in - outputs         # Écarts entre la sortie et la valeur attendue.
+                diff += np.sum(ecart ** 2)        # Ajoute les carrés des écarts à la différence totale.
+                if dataset.cas is not None:
+                    fin = debut + len(outputs)
+                    cas = dataset.cas[np.searchsorted(dataset.cas, debut):np.searchsorted(dataset.cas, fin)] - debut
+                    erreurs.append(np.abs(np.broadcast_to(ecart, outputs.shape)[cas]))
+                    debut = fin
+
+            # Calcule la moyenne des différences quadratiques et renvoie la fitness.
+            self.fitness = float(np.sqrt(diff) / len(dataset))
+            self.erreurs = np.concatenate(erreurs) if dataset.cas is not None else None
+            return self.fitness
+
+        except Exception as ex:
+            # Si une exception se produit lors de l'évaluation, marque la fitness comme NaN.
+            self.fitness = float('nan')
+            self.erreurs = None
+            return float('nan')
+
+    def calculate_fitness_echelle(self, dataset):
+        """
+        Calcule la fitness après mise à l'échelle linéaire de la sortie : les coefficients a et b
+        qui minimisent l'erreur de a + b*f(x) sont calculés exactement (moindres carrés), de sorte
+        que l'évolution n'a plus à chercher le décalage ni le facteur d'échelle.
+        Les moyennes et co-moments de f(x) et de la sortie attendue sont accumulés bloc par bloc
+        (fusion des moments de Chan), sans conserver les prédictions.
+
+        Args:
+            dataset (DatasetGP): Jeu de données (entrées et sorties attendues).
+
+        Returns:
+            float: La fitness calculée de l'individu (erreur après mise à l'échelle).
+        """
+        n = 0                       # Nombre de points parcourus
+        moy_f = moy_y = 0.0         # Moyennes de f(x) et de la sortie attendue
+        c_ff = c_fy = c_yy = 0.0    # Co-moments centrés
+        debut = 0
+        predictions_cas = []
+        sorties_cas = []
+        self._formule = None
+        try:
+            for inputs, outputs in dataset.blocs():
+                eval_in = np.broadcast_to(self.evaluate_brut(inputs), outputs.shape).astype(np.float64)
+                if not np.all(np.isfinite(eval_in)):
+                    raise ValueError("évaluation non finie")
+                n_b = len(outputs)
+                moy_f_b, moy_y_b = eval_in.mean(), outputs.mean()
+                ecart_f, ecart_y = eval_in - moy_f_b, outputs - moy_y_b
+                delta_f, delta_y = moy_f_b - moy_f, moy_y_b - moy_y
+                total = n + n_b
+                c_ff += ecart_f @ ecart_f + delta_f * delta_f * n * n_b / total
+                c_fy += ecart_f @ ecart_y + delta_f * delta_y * n * n_b / total
+                c_yy += ecart_y @ ecart_y + delta_y * delta_y * n * n_b / total
+                moy_f += delta_f * n_b / total
+                moy_y += delta_y * n_b / total
+                n = total
+                if dataset.cas is not None:
+                    fin = debut + n_b
+                    cas = dataset.cas[np.searchsorted(dataset.cas, debut):np.searchsorted(dataset.cas, fin)] - debut
+                    predictions_cas.append(eval_in[cas])
+                    sorties_cas.append(outputs[cas])
+                    debut = fin
+
+            # Coefficients optimaux, puis erreur résiduelle : c_yy - b*c_fy
+            b = c_fy / c_ff if c_ff > 1e-12 * max(1.0, c_yy) else 0.0
+            a = moy_y - b * moy_f
+            self.echelle = (float(a), float(b))
+            self.fitness = float(np.sqrt(max(c_yy - b * c_fy, 0.0)) / len(dataset))
+            if dataset.cas is not None:
+                self.erreurs = np.abs(a + b * np.concatenate(predictions_cas) - np.concatenate(sorties_cas))
+            else:
+                self.erreurs = None
+            return self.fitness
+
+        except Exception as ex:
+            # Si une exception se produit lors de l'évaluation, marque la fitness comme NaN.
+            self.fitness = float('nan')
+            self.echelle = None
+            self.erreurs = None
+            return float('nan')
+
+    def evaluate(self, input):
+        """
+        Évalue le chromosome pour une donnée d'entrée spécifique, ou pour un bloc de données
+        (mise à l'échelle linéaire comprise, si elle est calculée).
+        Args:
+            input (float|np.ndarray): Valeur d'entrée, ou bloc d'entrées transposé (cf DatasetGP.blocs).
+        Retourne:
+            float: Résultat de l'évaluation.
+        """
+        if self.echelle is not None:
+            return self.echelle[0] + self.echelle[1] * self.__evaluate(input,0)[0]
+        return self.__evaluate(input,0)[0]
+
+    def evaluate_brut(self, input):
+        """
+        Évalue l'arbre du chromosome, sans mise à l'échelle linéaire.
+        """
+        return self.__evaluate(input,0)[0]
+        
+    def __evaluate(self, input, position = 0): #fct auxiliaire 
+        elem=self.gen[position]
+        if elem.is_terminal(): 
+            return elem.evaluate(input),position  
+        elif elem.is_fonction_binaire():
+            left, position  = self.__evaluate(input, position + 1)
+            right, position = self.__evaluate(input, position + 1)
+            return elem.evaluate(left,right),position
+        else:
+            left, position = self.__evaluate(input, position + 1)
+            return elem.evaluate(left),position
+
+#-----------------------------------------------------------------------------
+
+    def croisement_middle(mother, father, start_m=None, start_f=None):
+        """
+        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
+        Args:
+            father (Chromosome): Chromosome père.
+            start_m, start_f (int): Points de croisement (None : tirage uniforme, cf points_croisement).
+        Returns:
+            Chromosome: Nouveaux chromosomes issus du croisement (None pour un enfant plus long que max_genes).
+        """
+        len_mother= len(mother.gen)
+        len_father= len(father.gen)
+
+        child1 = None
+        child2 = None
+        if start_m is None:
+            start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
+        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
+        if start_f is None:
+            start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
+        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
+        # La longueur de chaque enfant est connue avant sa construction : un enfant trop long n'est pas créé
+        if ChromosomeGP.longueur_valide(mother.config, start_m + end_f - start_f + len_mother - end_m):
+            child1 = ChromosomeGP(mother.config, 'none')
+            child1.gen = mother.gen[:start_m] + father.gen[start_f : end_f] + mother.gen[end_m :]# Affecte les gènes croisés à l'enfant 1
+            child1.set_variables()
+        if ChromosomeGP.longueur_valide(father.config, start_f + end_m - start_m + len_father - end_f):
+            child2 = ChromosomeGP(father.config,  'none')
+            child2.gen = father.gen[:start_f] + mother.gen[start_m : end_m] + father.gen[end_f :]# Affecte les gènes croisés à l'enfant 2
+            child2.set_variables()
+        return child1,child2
+
+    def croisement_absorption_partielle(mother, father, start_m=None, start_f=None):
+        """
+        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
+        Args:
+            father (Chromosome): Chromosome père.
+            start_m, start_f (int): Points de croisement (None : tirage uniforme, cf points_croisement).
+        Returns:
+            Chromosome: Nouveaux chromosomes issus du croisement (None pour un enfant plus long que max_genes).
+        """
+        len_mother= len(mother.gen)
+        len_father= len(father.gen)
+
+        child1 = None
+        child2 = None
+        if start_m is None:
+            start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
+        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
+        if start_f is None:
+            start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
+        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
+        # La longueur de chaque enfant est connue avant sa construction : un enfant trop long n'est pas créé
+        if ChromosomeGP.longueur_valide(mother.config, start_f + end_m + len_father - end_f + len_mother - end_m):
+            child1 = ChromosomeGP(mother.config, 'none')
+            child1.gen = mother.gen[:start_m]+ father.gen[:start_f]+mother.gen[start_m : end_m]+father.gen[end_f :]+ mother.gen[end_m :] 
+            child1.set_variables()
+        if ChromosomeGP.longueur_valide(father.config, start_m + end_f + len_mother - end_m + len_father - end_f):
+            child2 = ChromosomeGP(father.config,  'none')
+            child2.gen = father.gen[:start_f]+ mother.gen[:start_m]+father.gen[start_f : end_f]+mother.gen[end_m :]+ father.gen[end_f :]
+            child2.set_variables()
+        return child1,child2
+
+    def croisement_absorption_totale(mother, father, start_m=None, start_f=None):
+        """
+        Réalise le croisement entre le chromosome actuel (mère) et un chromosome père.
+        Args:
+            father (Chromosome): Chromosome père.
+            start_m, start_f (int): Points de croisement (None : tirage uniforme, cf points_croisement).
+        Returns:
+            Chromosome: Nouveaux chromosomes issus du croisement (None pour un enfant plus long que max_genes).
+        """
+        len_mother= len(mother.gen)
+        len_father= len(father.gen)
+
+        child1 = None
+        child2 = None
+        if start_m is None:
+            start_m = np.random.randint( len_mother)#choix aléatoire de la position dans le tableau du chromosome mère 
+        end_m   = mother.position_fin_branche(start_m )#fin de la branche issue de la position start_m dans le tableau du chromosome mere 
+        if start_f is None:
+            start_f = np.random.randint( len_father)#choix aléatoire de la position dans le tableau du chromosome père 
+        end_f   = father.position_fin_branche(start_f) #fin de la branche issue de la position start_f dans le tableau du chromosome père 
+        # La longueur de chaque enfant est connue avant sa construction : un enfant trop long n'est pas créé
+        if ChromosomeGP.longueur_valide(mother.config, start_m + len_father + len_mother - end_m):
+            child1 = ChromosomeGP(mother.config, 'none')
+            child1.gen = mother.gen[:start_m] + father.gen + mother.gen[end_m :]# Affecte les gènes croisés à l'enfant 1
+            child1.set_variables()
+        if ChromosomeGP.longueur_valide(father.config, start_f + len_mother + len_father - end_f):
+            child2 = ChromosomeGP(father.config,  'none')
+            child2.gen = father.gen[:start_f] + mother.gen + father.gen[end_f :]# Affecte les gènes croisés à l'enfant 2
+            child2.set_variables()
+        return child1,child2
+
+    def structure(self):
+        """
+        Calcule (une seule fois par génome) la structure de l'arbre, position par position.
+        Returns:
+            np.ndarray: fins : fin (exclue) du sous-arbre issu de chaque position.
+            np.ndarray: hauteurs : hauteur du sous-arbre issu de chaque position (1 pour un terminal).
+            np.ndarray: niveaux : profondeur de chaque position dans l'arbre (0 pour la racine).
+        """
+        if self._structure is None:
+            longueur = len(self.gen)
+            fins = np.empty(longueur, dtype=np.int64)
+            hauteurs = np.empty(longueur, dtype=np.int64)
+            niveaux = np.zeros(longueur, dtype=np.int64)
+            pile = []   # sous-arbres déjà parcourus (parcours de droite à gauche) : le sommet est le fils gauche
+            for position in range(longueur-1, -1, -1):
+                elem = self.gen[position]
+                if elem.is_terminal():
+                    fins[position], hauteurs[position] = position + 1, 1
+                elif elem.is_fonction_unaire():
+                    fils = pile.pop()
+                    fins[position], hauteurs[position] = fins[fils], hauteurs[fils] + 1
+                else:
+                    gauche = pile.pop()
+                    droit = pile.pop()
+                    fins[position], hauteurs[position] = fins[droit], max(hauteurs[gauche], hauteurs[droit]) + 1
+                pile.append(position)
+            for position in range(longueur):
+                if not self.gen[position].is_terminal():
+                    niveaux[position + 1] = niveaux[position] + 1
+                    if self.gen[position].is_fonction_binaire():
+                        niveaux[fins[position + 1]] = niveaux[position] + 1
+            self._structure = (fins, hauteurs, niveaux)
+        return self._structure
+
+    def points_croisement(mother, father, mode):
+        """
+        Choisit des points de croisement compatibles : les deux enfants respectent max_depth et max_genes.
+        Toutes les paires de points (mère, père) sont examinées à la fois sur la structure des deux arbres,
+        et une paire est tirée uniformément parmi les paires compatibles. La profondeur d'un enfant est
+        majorée par la profondeur de la partie insérée augmentée du niveau du point d'insertion.
+        Args:
+            mother, father (ChromosomeGP): Parents.
+            mode (str): Mode de croisement (cf ConfigToolsGP.CROISEMENT_*).
+        Returns:
+            tuple: (start_m, start_f), ou None si aucune paire ne convient.
+        """
+        config = mother.config
+        fins_m, hauteurs_m, niveaux_m = mother.structure()
+        fins_f, hauteurs_f, niveaux_f = father.structure()
+        len_m, len_f = len(mother.gen), len(father.gen)
+        taille_m = (fins_m - np.arange(len_m))[:, None]        # tailles des sous-arbres de la mère (en colonne)
+        taille_f = (fins_f - np.arange(len_f))[None, :]        # tailles des sous-arbres du père (en ligne)
+        niv_m, niv_f = niveaux_m[:, None], niveaux_f[None, :]
+        sous_m, sous_f = hauteurs_m[:, None] - 1, hauteurs_f[None, :] - 1
+
+        if mode == config.CROISEMENT_ABSORPTION_TOTALE:
+            depth1, depth2 = niv_m + father.depth, niv_f + mother.depth
+            longueur1, longueur2 = len_m - taille_m + len_f, len_f - taille_f + len_m
+        elif mode == config.CROISEMENT_ABSORPTION_PARTIELLE:
+            depth1 = niv_m + np.maximum(father.depth, niv_f + sous_m)
+            depth2 = niv_f + np.maximum(mother.depth, niv_m + sous_f)
+            longueur1, longueur2 = len_m + len_f - taille_f, len_m + len_f - taille_m
+        else:
+            depth1, depth2 = niv_m + sous_f, niv_f + sous_m
+            longueur1, longueur2 = len_m - taille_m + taille_f, len_f - taille_f + taille_m
+
+        compatibles = (depth1 <= config.max_depth) & (depth2 <= config.max_depth)
+        if config.max_genes > 0:
+            compatibles &= (longueur1 <= config.max_genes) & (longueur2 <= config.max_genes)
+        paires = np.flatnonzero(compatibles)
+        if len(paires) == 0:
+            return None
+        paire = paires[np.random.randint(len(paires))]
+        return int(paire // len_f), int(paire % len_f)
+
+    def longueur_valide(config, longueur):
+        """
+        Vérifie qu'une longueur de génome respecte la limite config.max_genes (0 : pas de limite).
+        Args:
+            config (obj): Instance de la boite de config.
+            longueur (int): Nombre de gènes.
+        Returns:
+            bool: True si la longueur est acceptable.
+        """
+        return config.max_genes <= 0 or longueur <= config.max_genes
+
+    def cout(self):
+        """
+        Coût d'évaluation estimé de l'individu : nombre de gènes fonctions, chacun correspondant à une
+        opération sur tout un bloc de données (les feuilles ne coûtent qu'une référence ou une constante).
+        Returns:
+            int: Nombre d'opérations par évaluation.
+        """
+        return sum(1 for gene in self.gen if gene.is_fonction())
+
+#------------------------------------------------------------------------
+    def mutate_remplace(self):
+        """
+        Applique une mutation sur un gène aléatoire du chromosome.
+        """
+        position = np.random.randint(len(self.gen))
+
+        element=self.gen[position]
+
+        if element.is_fonction():
+            if  element.is_fonction_unaire():
+                self.gen[position] = GeneGP.random_choice_fonction_unaire()
+            else:
+                self.gen[position] = GeneGP.random_choice_fonction_binaire()
+        else:
+            self.gen[position] = GeneGP.random_choice_terminal()
+
+        self.set_variables()
+
+
+    def mutate_swap(self):
+        """
+        Applique une mutation d'échange de la position de deux gènes du chromosome de façon  aléatoire .
+        """
+        if len(self.gen)<=3:
+            return
+        start_1 = np.random.randint(1,len(self.gen))
+        end_1   = self.position_fin_branche(start_1 )#fin de la branche issue de la position start_1 dans le tableau du chromosome   
+        start_2 = np.random.randint(1,len(self.gen))
+        end_2   = self.position_fin_branche(start_2 )#fin de la branche issue de la position start_2 dans le tableau du chromosome 
+
+        #if self.gen[start_1].type_gen!=self.gen[start_2].type_gen:
+        #    return
+
+        if (start_1<=start_2 and start_2<=end_1) or (start_2<=start_1 and start_1<=end_2):
+            #print ("aucun traitement")
+            return
+        if start_1 < start_2 :
+            self.gen = self.gen[:start_1] + self.gen[start_2 : end_2] + self.gen[end_1 :start_2] + self.gen[start_1 : end_1] + self.gen[end_2 :]
+        else:
+            self.gen = self.gen[:start_2] + self.gen[start_1 : end_1] + self.gen[end_2 :start_1] + self.gen[start_2 : end_2] + self.gen[end_1 :]
+        self.set_variables()
+   
+    def mutate_deplace(self):
+        """
+        Applique une mutation sur un gène aléatoire du chromosome en déplaçant sa position.
+        """
+        if len(self.gen)<=2:
+            return
+        start_1 = np.random.randint(1,len(self.gen))
+        end_1   = self.position_fin_branche(start_1 )#fin de la branche issue de la position start_1 dans le tableau du chromosome   
+
+        max_iteration=10
+        cpt=0
+        while  cpt<max_iteration:
+            pos_cible = np.random.randint(len(self.gen))
+            element=self.gen[pos_cible]
+            if (start_1>pos_cible or pos_cible>end_1) :
+                if  element.is_terminal()  :
+                    break
+            cpt+=1
+        if cpt==max_iteration:
+            return
+
+        #print(start_1,end_1,self.gen[start_1 : end_1],pos_cible,element)
+
+        nullElement=[GeneGP.create_gene(GeneGP.TYPE_GEN_TERMINAL_INTEGER,0)]
+        if start_1 > pos_cible :
+            self.gen = self.gen[:pos_cible] + self.gen[start_1 : end_1] + self.gen[pos_cible+1 :start_1]+ nullElement+ self.gen[end_1 :]
+        else:
+            self.gen = self.gen[:start_1] +nullElement+ self.gen[end_1 :pos_cible] + self.gen[start_1 : end_1] + self.gen[pos_cible+1 :]
+
+        self.set_variables()
+
+#------------------------------------------------------------------------
+    def read_gene(self,str_line):
+        """
+        Lit un gène depuis une chaîne de caractères.
+        Args:
+            str_line (str): La ligne représentant le gène.
+        Returns:
+            list: Liste de valeurs représentant le gène.
+        """
+        self.gen=[]
+        items=str_line.split(';')
+        for item in items:
+            valeur,type_val=item.split(':')
+            elem=GeneGP.read_str(int(type_val),valeur)
+            self.gen.append(elem)
+
+
+
+    def write_gene(self):
+        """
+        Écrit un gène sous forme de chaîne de caractères.
+        Args:
+            gen (list): Le gène sous forme de liste.
+        Returns:
+            str: La chaîne de caractères représentant le gène.
+        """
+        strOut=""
+        for item in self.gen:
+           if strOut!="" : strOut+=";"
+           strOut+= item.write_str() 
+        return strOut
+#------------------------------------------------------------------------
+    def set_variables(self, depth=None):
+        """
+        Méthode auxiliaire pour calculer la profondeur.
+        La formule n'est reconstruite qu'au premier accès (cf formule).
+        Args:
+            depth (int): profondeur déjà connue (par exemple relue d'un fichier), None pour la calculer.
+        """        
+        self.depth   = self.__get_depth_aux()[0] - 1 if depth is None else depth
+        self._formule = None
+        self._structure = None
+
+    @property
+    def formule(self):
+        """
+        Équation de l'individu au format texte, reconstruite à la demande après une modification des gènes.
+        """
+        if self._formule is None:
+            self._formule = self.__formule_aux(0)[1]
+            if self.echelle is not None:
+                a, b = [('%.12g' if val >= 0 else '(%.12g)') % val for val in self.echelle]
+                self._formule = "(" + a + "+" + b + "*" + self._formule + ")"
+        return self._formule
+
+    @formule.setter
+    def formule(self, valeur):
+        self._formule = valeur
+    def trace(self):
+        strOut=""
+        for item in self.gen:
+           if strOut!="" : strOut+=" "
+           strOut+= item.name_gen 
+        print(strOut)
+#------------------------------------------------------------------------
+    def position_fin_branche(self,position):
+        """
+        parcourt le tableau de genes jusqu'a la fin de l'arbre.
+        Args:
+            position (int): position courante dans le tableau de gen.
+        Returns:
+             position de la fin de l'arbre.
+        """
+        if self.gen[position].is_terminal () :
+            return position + 1
+        elif self.gen[position].is_fonction_unaire ():
+            return self.position_fin_branche(position + 1)
+        else:
+            new_position = self.position_fin_branche(position + 1)
+            return self.position_fin_branche(new_position)
+#------------------------------------------------------------------------
+
+    def __get_depth_aux(self, position = 0):
+        """
+        Méthode auxiliaire pour calculer la profondeur.
+        Args:
+            position (int): position courante dans le tableau de gen.
+        Returns:
+            int: position courante.
+            int: profondeur.
+        """        
+        elem = self.gen[position]
+        
+        if elem.is_fonction_binaire():
+            left, position = self.__get_depth_aux(position + 1)
+            right, position = self.__get_depth_aux(position)
+
+            return 1 + max(left, right), position
+        elif elem.is_fonction_unaire():
+            left, position = self.__get_depth_aux(position + 1)
+            return left + 1, position
+        else:
+            return 1, position + 1
+#------------------------------------------------------------------------
+ 
+    def __formule_aux(self, position ):
+        """
+        Méthode auxiliaire pour générer la formule lisible.
+        Args:
+            position (int): position courante dans le tableau de gen.
+        Returns:
+           str: formules au format texte
+        """        
+        elem=self.gen[position]        
+        if elem.is_terminal(): 
+            return position,elem.writeStr()
+        elif elem.is_fonction_binaire():
+            position,str_next1=self.__formule_aux(position + 1)
+            position,str_next2=self.__formule_aux(position + 1)
+            return position,elem.writeStr(str_next1,str_next2)
+        elif elem.is_fonction_unaire():
+            position,str_next=self.__formule_aux(position + 1)
+            return position,elem.writeStr(str_next)
+
@@ -0,0 +1,112 @@
+import time
+
+"""
+La classe ChronometreGP mesure, génération par génération, le temps passé dans chaque phase de l'algorithme
+et les événements comptés par AlgoGP (évaluations, rejets, régénérations).
+
+Phases (temps exclusifs : une évaluation n'est comptée que dans evaluation)
+	selection    : choix des parents (sélection, tournois du moteur stationnaire).
+	croisement   : croisement des parents (choix des points de croisement compris).
+	mutation     : mutation des enfants.
+	evaluation   : calcul des fitness, où qu'il ait lieu ; avec plusieurs workers, temps cumulé des workers.
+	remplacement : remplacement de la population (ou du perdant d'un tournoi inversé).
+	constantes   : optimisation des constantes, hors évaluations.
+	interface    : rappels de l'interface graphique (jauge, graphe, résultats).
+	autres       : reste de la durée de la génération (historique, affichage, stagnation, points de reprise).
+
+Compteurs : les valeurs cumulées des compteurs d'AlgoGP sont relevées en fin de génération (cf termine) ;
+chaque génération conserve leur accroissement.
+
+Désactivé, le chronomètre ne lit pas l'horloge : top renvoie 0 et ajoute ne fait rien.
+La génération -1 correspond à la création de la population initiale.
+"""
+
+class ChronometreGP():
+
+    PHASES = ('selection', 'croisement', 'mutation', 'evaluation', 'remplacement', 'constantes', 'interface')
+
+    def __init__(self, actif=False):
+        """
+        Initialise le chronomètre.
+        Args:
+            actif (bool): Mesures activées.
+        """
+        self.actif = actif
+        self.durees = dict.fromkeys(ChronometreGP.PHASES, 0.0)   # Durées de la génération en cours
+        self.debut_generation = time.perf_counter()
+        self.releve = {}                                          # Compteurs cumulés à la fin de la génération précédente
+        self.generations = []                                     # Une mesure par génération terminée
+
+    def top(self):
+        """
+        Lit l'horloge.
+        Returns:
+            float: Instant courant (secondes), 0 si le chronomètre est désactivé.
+        """
+        return time.perf_counter() if self.actif else 0.0
+
+    def ajoute(self, phase, debut):
+        """
+        Ajoute à une phase la durée écoulée depuis debut.
+        Args:
+            phase (str): Nom de la phase.
+            debut (float): Instant renvoyé par top.
+        """
+        if self.actif:
+            self.durees[phase] += time.perf_counter() - debut
+
+    def termine(self, iteration, compteurs):
+        """
+        Termine la génération en cours.
+        Args:
+            iteration (int): Numéro de la génération (-1 : population initiale).
+            compteurs (dict): Valeurs cumulées des compteurs.
+        Returns:
+            dict: Mesure de la génération (None si le chronomètre est désactivé).
+        """
+        if not self.actif:
+            return None
+        fin = time.perf_counter()
+        mesure = {'generation': iteration, 'duree': fin - self.debut_generation}
+        mesure.update(self.durees)
+        mesure['autres'] = max(0.0, mesure['duree'] - sum(self.durees.values()))
+        for key, val in compteurs.items():
+            mesure[key] = val - self.releve.get(key, 0)
+        self.generations.append(mesure)
+        self.releve = dict(compteurs)
+        self.durees = dict.fromkeys(ChronometreGP.PHASES, 0.0)
+        self.debut_generation = fin
+        return mesure
+
+    def totaux(self):
+        """
+        Cumul des mesures de toutes les générations.
+        Returns:
+            dict: Durées et compteurs cumulés.
+        """
+        totaux = {}
+        for mesure in self.generations:
+            for key, val in mesure.items():
+                if key != 'generation':
+                    totaux[key] = totaux.get(key, 0) + val
+        return totaux
+
+#------------------------------------------------------------------------
+    def etat(self):
+        """
+        Copie de l'état pour les points de reprise.
+        Returns:
+            dict: Mesures des générations terminées et derniers compteurs relevés.
+        """
+        return {'generations': [dict(mesure) for mesure in self.generations], 'releve': dict(self.releve)}
+
+    def restaure(self, etat):
+        """
+        Restaure l'état produit par etat ; la génération en cours repart de zéro.
+        Args:
+            etat (dict): Mesures et compteurs relevés.
+        """
+        self.generations = [dict(mesure) for mesure in etat.get('generations', [])]
+        self.releve = dict(etat.get('releve', {}))
+        self.durees = dict.fromkeys(ChronometreGP.PHASES, 0.0)
+        self.debut_generation = time.perf_counter()
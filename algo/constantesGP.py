@@ -0,0 +1,133 @@
+import numpy as np
+
+from algo.chromosomeGP import ChromosomeGP
+from algo.geneGP import GenTerminalReelGP
+
+"""
+La classe ConstantesGP optimise les constantes d'un individu : les feuilles constantes de l'arbre
+(entières ou réelles) sont traitées comme des paramètres, ajustés par moindres carrés sur un
+sous-ensemble du jeu de données.
+
+Méthode : Levenberg-Marquardt
+	Les résidus (sortie de l'individu - valeur attendue) sont évalués en une fois sur tout le sous-ensemble.
+	La jacobienne est estimée par différences finies (une évaluation par constante), puis le pas
+	(J'J + lambda.diag(J'J)) delta = -J'r est résolu ; lambda diminue après un pas accepté et
+	augmente après un pas refusé.
+
+Les valeurs optimisées sont écrites dans de nouveaux gènes constants réels (GenTerminalReelGP) :
+les gènes existants, partagés entre individus, ne sont jamais modifiés.
+"""
+
+class ConstantesGP():
+
+    LAMBDA_INITIAL = 1e-3
+    LAMBDA_MAXIMUM = 1e10
+
+    def positions(chromosome):
+        """
+        Positions des gènes constants d'un individu.
+        Returns:
+            list: Positions dans chromosome.gen.
+        """
+        return [i for i, gene in enumerate(chromosome.gen) if gene.is_constante()]
+
+    def residus(modele, positions, valeurs, inputs, outputs):
+        """
+        Résidus de l'individu sur le sous-ensemble, pour des valeurs données des constantes.
+        Args:
+            modele (ChromosomeGP): Individu de travail (ses gènes constants sont remplacés).
+            positions (list): Positions des constantes.
+            valeurs (np.ndarray): Valeurs des constantes.
+            inputs, outputs (np.ndarray): Sous-ensemble du jeu de données (entrées transposées).
+        Returns:
+            np.ndarray: Résidus (None si l'évaluation échoue ou n'est pas finie).
+        """
+        for position, valeur in zip(positions, valeurs.tolist()):
+            modele.gen[position] = GenTerminalReelGP(valeur)
+        try:
+            with np.errstate(all='ignore'):
+                residus = np.broadcast_to(modele.evaluate(inputs) - outputs, outputs.shape).astype(np.float64)
+        except Exception:
+            return None
+        if not np.all(np.isfinite(residus)):
+            return None
+        return residus
+
+    def optimise(chromosome, inputs, outputs, nb_iterations=20):
+        """
+        Ajuste les constantes d'un individu par Levenberg-Marquardt.
+        Args:
+            chromosome (ChromosomeGP): Individu à optimiser (non modifié).
+            inputs, outputs (np.ndarray): Sous-ensemble du jeu de données (entrées transposées).
+            nb_iterations (int): Nombre maximal d'itérations.
+        Returns:
+            ChromosomeGP: Nouvel individu aux constantes optimisées (fitness non calculée), None si
+            l'individu n'a pas de constante ou si aucune amélioration n'a été trouvée.
+        """
+        positions = ConstantesGP.positions(chromosome)
+        if len(positions) == 0:
+            return None
+        modele = ChromosomeGP(chromosome.config, 'none')
+        modele.gen = list(chromosome.gen)
+        modele.echelle = chromosome.echelle
+        valeurs = np.array([float(chromosome.gen[i].name_gen) for i in positions])
+        residus = ConstantesGP.residus(modele, positions, valeurs, inputs, outputs)
+        if residus is None:
+            return None
+        cout_initial = cout = float(residus @ residus)
+        lam = ConstantesGP.LAMBDA_INITIAL
+
+        for iteration in range(nb_iterations):
+            # Jacobienne par différences finies
+            jacobienne = np.empty((len(residus), len(positions)))
+            for k in range(len(positions)):
+                pas = 1e-6 * max(1.0, abs(valeurs[k]))
+                decale = valeurs.copy()
+                decale[k] += pas
+                residus_k = ConstantesGP.residus(modele, positions, decale, inputs, outputs)
+                if residus_k is None:
+                    return ConstantesGP.resultat(chromosome, positions, valeurs, cout, cout_initial)
+                jacobienne[:, k] = (residus_k - residus) / pas
+            jtj = jacobienne.T @ jacobienne
+            gradient = jacobienne.T @ residus
+
+            # Recherche d'un pas qui diminue le coût
+            accepte = False
+            while lam < ConstantesGP.LAMBDA_MAXIMUM:
+                try:
+                    delta = np.linalg.solve(jtj + lam * np.diag(np.diag(jtj) + 1e-12), -gradient)
+                except np.linalg.LinAlgError:
+                    lam *= 10
+                    continue
+                nouveaux_residus = ConstantesGP.residus(modele, positions, valeurs + delta, inputs, outputs)
+                if nouveaux_residus is not None:
+                    nouveau_cout = float(nouveaux_residus @ nouveaux_residus)
+                    if nouveau_cout < cout:
+                        accepte = True
+                        break
+                lam *= 10
+            if not accepte:
+                break
+            valeurs = valeurs + delta
+            residus = nouveaux_residus
+            amelioration = cout - nouveau_cout
+            cout = nouveau_cout
+            lam = max(lam / 10, 1e-12)
+            if amelioration <= 1e-12 * cout:
+                break
+
+        return ConstantesGP.resultat(chromosome, positions, valeurs, cout, cout_initial)
+
+    def resultat(chromosome, positions, valeurs, cout, cout_initial):
+        """
+        Construit l'individu aux constantes optimisées, s'il améliore le coût initial.
+        """
+        if not cout < cout_initial:
+            return None
+        item = ChromosomeGP(chromosome.config, 'none')
+        item.gen = list(chromosome.gen)
+        for position, valeur in zip(positions, valeurs.tolist()):
+            item.gen[position] = GenTerminalReelGP(valeur)
+        item.set_variables(chromosome.depth)
+        item.generation = chromosome.generation
+        return item
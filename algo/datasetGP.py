@@ -0,0 +1,264 @@
+import os.path
+import hashlib
+import numpy as np
+
+"""
+La classe DatasetGP représente le jeu de données (entrées/sorties) utilisé pour le calcul de la fitness.
+
+Les données sont rangées dans deux tableaux NumPy :
+	inputs  : tableau de forme (n,) pour une seule variable ou (n, d) pour d variables.
+	outputs : tableau de forme (n,) des valeurs cibles.
+
+Le jeu de données peut être conservé en mémoire ou adossé à un fichier .npy lu via numpy.memmap.
+Dans ce second cas, le fichier contient une matrice (n, d+1) dont la dernière colonne est la sortie.
+Il est projeté en mémoire une seule fois, à la première lecture, et chaque bloc est une vue de cette
+projection (sans copie) : les pages lues sont celles du cache fichier du système, qui peut les libérer,
+et la mémoire allouée par l'évaluation reste bornée par la taille d'un bloc, quel que soit le nombre de lignes.
+
+Méthodes principales
+	create : Construit un jeu de données en mémoire à partir de listes ou de tableaux.
+	load : Ouvre un fichier .npy en lecture projetée (memmap).
+	save : Écrit le jeu de données dans un fichier .npy.
+	convertir_texte : Convertit un fichier texte "x;y" en fichier .npy sans le charger entièrement.
+	blocs : Parcourt le jeu de données par blocs de taille fixe (taille_bloc lignes).
+	empreinte : Calcule une empreinte (SHA-1) des données, pour savoir si des fitness mémorisées restent valables.
+	selectionne_cas : Choisit les cas (lignes) dont les erreurs individuelles sont conservées (sélection lexicase).
+	echantillon : Tire un sous-ensemble de lignes (optimisation des constantes).
+"""
+
+class DatasetGP():
+    TAILLE_BLOC_DEFAUT = 65536
+
+    def __init__(self, inputs=None, outputs=None, taille_bloc=TAILLE_BLOC_DEFAUT):
+        """
+        Initialise un jeu de données en mémoire.
+        Args:
+            inputs (np.ndarray): Données d'entrée, de forme (n,) ou (n, d).
+            outputs (np.ndarray): Valeurs cibles, de forme (n,).
+            taille_bloc (int): Nombre de lignes évaluées à la fois.
+        """
+        self._inputs = inputs
+        self._outputs = outputs
+        self.taille_bloc = max(1, int(taille_bloc))
+        self.fichier = None         # Fichier .npy (mode memmap) ou None (mode mémoire)
+        self.offset = 0             # Position des données dans le fichier .npy
+        self._projection = None     # Projection (n, d+1) du fichier .npy, ouverte à la première lecture
+        self.nb_lignes = 0 if outputs is None else len(outputs)
+        self.nb_colonnes = 0        # Nombre de variables d'entrée
+        self._empreinte = None      # Empreinte des données, calculée à la demande
+        self.cas = None             # Indices triés des cas dont les erreurs sont conservées (None : aucun)
+        if inputs is not None:
+            self.nb_colonnes = 1 if inputs.ndim == 1 else inputs.shape[1]
+
+    def create(inputs, outputs, taille_bloc=TAILLE_BLOC_DEFAUT):
+        """
+        Construit un jeu de données en mémoire.
+        Args:
+            inputs (list): Données d'entrée (scalaires ou listes de coordonnées).
+            outputs (list): Valeurs cibles.
+            taille_bloc (int): Nombre de lignes évaluées à la fois.
+        Returns:
+            DatasetGP: Le jeu de données.
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        outputs = np.asarray(outputs, dtype=float).reshape(-1)
+        if inputs.ndim == 2 and inputs.shape[1] == 1:
+            inputs = inputs[:, 0]
+        return DatasetGP(inputs, outputs, taille_bloc)
+
+    def load(fichier, taille_bloc=TAILLE_BLOC_DEFAUT):
+        """
+        Ouvre un fichier .npy de forme (n, d+1) en lecture projetée.
+        Args:
+            fichier (str): Chemin du fichier .npy.
+            taille_bloc (int): Nombre de lignes évaluées à la fois.
+        Returns:
+            DatasetGP: Le jeu de données adossé au fichier.
+        """
+        with open(fichier, 'rb') as file:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            offset = file.tell()
+        if fortran_order or len(shape) != 2 or shape[1] < 2 or dtype != np.float64:
+            raise ValueError("Le fichier "+fichier+" doit contenir une matrice float64 (n, d+1) au format C")
+
+        dataset = DatasetGP(None, None, taille_bloc)
+        dataset.fichier = fichier
+        dataset.offset = offset
+        dataset.nb_lignes = shape[0]
+        dataset.nb_colonnes = shape[1] - 1
+        return dataset
+
+    def save(self, fichier):
+        """
+        Écrit le jeu de données dans un fichier .npy de forme (n, d+1), bloc par bloc.
+        Args:
+            fichier (str): Chemin du fichier .npy.
+        """
+        data = np.lib.format.open_memmap(fichier, mode='w+', dtype=np.float64, shape=(self.nb_lignes, self.nb_colonnes+1))
+        debut = 0
+        for inputs, outputs in self.blocs():
+            fin = debut + len(outputs)
+            data[debut:fin, :-1] = inputs.T.reshape(len(outputs), self.nb_colonnes)
+            data[debut:fin, -1] = outputs
+            debut = fin
+        data.flush()
+        del data
+
+    def convertir_texte(fichier_texte, fichier_npy, taille_bloc=TAILLE_BLOC_DEFAUT):
+        """
+        Convertit un fichier texte (une ligne "x;y" ou "x0;...;xn;y" par point) en fichier .npy,
+        sans charger le fichier texte en mémoire.
+        Args:
+            fichier_texte (str): Fichier texte d'entrée.
+            fichier_npy (str): Fichier .npy à produire.
+            taille_bloc (int): Nombre de lignes évaluées à la fois.
+        Returns:
+            DatasetGP: Le jeu de données adossé au fichier .npy.
+        """
+        nb_lignes = 0
+        nb_colonnes = 0
+        with open(fichier_texte, 'r') as file:
+            for line in file:
+                line = line.strip()
+                if line == "": continue
+                if nb_colonnes == 0:
+                    nb_colonnes = len(line.split(';'))
+                nb_lignes += 1
+
+        data = np.lib.format.open_memmap(fichier_npy, mode='w+', dtype=np.float64, shape=(nb_lignes, nb_colonnes))
+        i = 0
+        with open(fichier_texte, 'r') as file:
+            for line in file:
+                line = line.strip()
+                if line == "": continue
+                data[i] = [float(val) for val in line.split(';')]
+                i += 1
+        data.flush()
+        del data
+        return DatasetGP.load(fichier_npy, taille_bloc)
+
+    def open_cache(fichier_texte, taille_bloc=TAILLE_BLOC_DEFAUT):
+        """
+        Retourne le jeu de données projeté associé à un fichier texte, en créant le fichier .npy
+        voisin s'il est absent ou plus ancien que le fichier texte.
+        Args:
+            fichier_texte (str): Fichier texte d'entrée.
+            taille_bloc (int): Nombre de lignes évaluées à la fois.
+        Returns:
+            DatasetGP: Le jeu de données adossé au fichier .npy.
+        """
+        fichier_npy = fichier_texte + ".npy"
+        if os.path.isfile(fichier_npy) and os.path.getmtime(fichier_npy) >= os.path.getmtime(fichier_texte):
+            return DatasetGP.load(fichier_npy, taille_bloc)
+        return DatasetGP.convertir_texte(fichier_texte, fichier_npy, taille_bloc)
+
+#------------------------------------------------------------------------
+    def __len__(self):
+        return self.nb_lignes
+
+    def is_memmap(self):
+        """
+        Indique si le jeu de données est adossé à un fichier.
+        """
+        return self.fichier is not None
+
+    def __memmap(self, debut=0, nb=None):
+        """
+        Vue des lignes [debut, debut+nb[ du fichier .npy, projeté une seule fois (à la première lecture).
+        """
+        if self._projection is None:
+            self._projection = np.memmap(self.fichier, dtype=np.float64, mode='r', offset=self.offset, shape=(self.nb_lignes, self.nb_colonnes+1))
+        if nb is None:
+            nb = self.nb_lignes - debut
+        return self._projection[debut:debut+nb]
+
+    def __colonnes(self, data):
+        """
+        Sépare une matrice (n, d+1) en entrées et sorties.
+        """
+        if self.nb_colonnes == 1:
+            return data[:, 0], data[:, -1]
+        return data[:, :-1], data[:, -1]
+
+    @property
+    def inputs(self):
+        """
+        Données d'entrée complètes (vue projetée en mode memmap).
+        """
+        if self.is_memmap():
+            return self.__colonnes(self.__memmap())[0]
+        return self._inputs
+
+    @property
+    def outputs(self):
+        """
+        Valeurs cibles complètes (vue projetée en mode memmap).
+        """
+        if self.is_memmap():
+            return self.__colonnes(self.__memmap())[1]
+        return self._outputs
+
+    def empreinte(self):
+        """
+        Calcule (une seule fois) l'empreinte SHA-1 des données, bloc par bloc.
+        Returns:
+            str: Empreinte hexadécimale.
+        """
+        if self._empreinte is None:
+            sha = hashlib.sha1(str((self.nb_lignes, self.nb_colonnes)).encode())
+            for inputs, outputs in self.blocs():
+                sha.update(np.ascontiguousarray(inputs, dtype=np.float64).tobytes())
+                sha.update(np.ascontiguousarray(outputs, dtype=np.float64).tobytes())
+            self._empreinte = sha.hexdigest()
+        return self._empreinte
+
+    def selectionne_cas(self, nombre):
+        """
+        Choisit au hasard, sans remise, les cas dont les erreurs individuelles sont conservées
+        lors du calcul de la fitness.
+        Args:
+            nombre (int): Nombre de cas (0 ou plus que le nombre de lignes : tous les cas).
+        """
+        if nombre <= 0 or nombre >= self.nb_lignes:
+            self.cas = np.arange(self.nb_lignes)
+        else:
+            self.cas = np.sort(np.random.choice(self.nb_lignes, nombre, replace=False))
+
+    def echantillon(self, nombre):
+        """
+        Tire au hasard, sans remise, un sous-ensemble de lignes du jeu de données.
+        Args:
+            nombre (int): Nombre de lignes (0 ou plus que le nombre de lignes : toutes les lignes).
+        Returns:
+            tuple: (inputs, outputs) du sous-ensemble, les entrées transposées comme pour blocs.
+        """
+        if nombre <= 0 or nombre >= self.nb_lignes:
+            lignes = np.arange(self.nb_lignes)
+        else:
+            lignes = np.sort(np.random.choice(self.nb_lignes, nombre, replace=False))
+        if self.is_memmap():
+            inputs, outputs = self.__colonnes(np.array(self.__memmap()[lignes]))
+        else:
+            inputs, outputs = self._inputs[lignes], self._outputs[lignes]
+        return inputs.T, outputs
+
+    def blocs(self):
+        """
+        Parcourt le jeu de données par blocs de taille_bloc lignes.
+        Les entrées sont renvoyées transposées (forme (n,) ou (d, n)) afin que inputs[k]
+        désigne la colonne de la variable k, comme pour un point isolé.
+        Yields:
+            tuple: (inputs, outputs) du bloc.
+        """
+        for debut in range(0, self.nb_lignes, self.taille_bloc):
+            nb = min(self.taille_bloc, self.nb_lignes - debut)
+            if self.is_memmap():
+                inputs, outputs = self.__colonnes(self.__memmap(debut, nb))     # Vues, sans copie
+            else:
+                inputs = self._inputs[debut:debut+nb]
+                outputs = self._outputs[debut:debut+nb]
+            yield inputs.T, outputs
@@ -0,0 +1,182 @@
+import numpy as np
+
+from algo.chromosomeGP import ChromosomeGP
+
+"""
+La classe HistoriqueGP conserve l'historique des meilleurs individus, génération après génération,
+sous une forme compacte et bornée.
+
+Chaque entrée ne contient que l'itération, la fitness, la génération, la longueur du génome,
+la mise à l'échelle linéaire éventuelle (cf ChromosomeGP.echelle) et le génome au format texte (cf ChromosomeGP.write_gene) : seul le dernier chromosome ajouté reste référencé.
+Les entrées sont rangées dans des tableaux NumPy préalloués.
+
+Politique de stockage
+	Dédoublonnage : un meilleur individu identique au précédent (même objet, ou même génome et même
+	                fitness) n'est pas enregistré une seconde fois. Le meilleur individu d'une itération
+	                est donc la dernière entrée enregistrée à cette itération ou avant (cf get).
+	Sous-échantillonnage : si une taille maximale est donnée, l'historique plein est décimé
+	                (une entrée sur deux est conservée, la première et la dernière toujours) ;
+	                sinon les tableaux sont agrandis par doublement.
+"""
+
+class HistoriqueGP():
+
+    CAPACITE_INITIALE = 1024
+    TABLEAUX = ('iterations', 'fitness', 'generations', 'longueurs', 'genomes', 'echelles')
+
+    def __init__(self, taille_maximum=0):
+        """
+        Initialise un historique vide.
+        Args:
+            taille_maximum (int): Nombre maximal d'entrées (0 : illimité).
+        """
+        self.taille_maximum = taille_maximum
+        capacite = HistoriqueGP.CAPACITE_INITIALE
+        if taille_maximum > 0:
+            capacite = min(capacite, taille_maximum)
+        self.iterations = np.empty(capacite, dtype=np.int64)
+        self.fitness = np.empty(capacite, dtype=np.float64)
+        self.generations = np.empty(capacite, dtype=np.int64)
+        self.longueurs = np.empty(capacite, dtype=np.int32)
+        self.genomes = np.empty(capacite, dtype=object)
+        self.echelles = np.empty((capacite, 2), dtype=np.float64)
+        self.nb = 0                     # Nombre d'entrées enregistrées
+        self.derniere_iteration = -1    # Dernière itération ajoutée (enregistrée ou dédoublonnée)
+        self.dernier = None             # Dernier chromosome ajouté (dédoublonnage sans conversion)
+
+    def __len__(self):
+        return self.nb
+
+    def ajoute(self, iteration, chromosome):
+        """
+        Ajoute le meilleur individu d'une itération.
+        Args:
+            iteration (int): Numéro de l'itération.
+            chromosome (ChromosomeGP): Meilleur individu de l'itération.
+        """
+        self.derniere_iteration = iteration
+        if chromosome is self.dernier:
+            return
+        self.dernier = chromosome
+        genome = chromosome.write_gene()
+        if self.nb > 0 and self.fitness[self.nb-1] == chromosome.fitness and self.genomes[self.nb-1] == genome:
+            return
+        if self.nb == len(self.iterations):
+            if self.taille_maximum > 0 and self.nb >= self.taille_maximum:
+                self.decime()
+            else:
+                self.agrandit()
+        self.iterations[self.nb] = iteration
+        self.fitness[self.nb] = chromosome.fitness
+        self.generations[self.nb] = chromosome.generation
+        self.longueurs[self.nb] = len(chromosome.gen)
+        self.genomes[self.nb] = genome
+        self.echelles[self.nb] = chromosome.echelle if chromosome.echelle is not None else np.nan
+        self.nb += 1
+
+    def agrandit(self):
+        """
+        Double la capacité des tableaux (dans la limite de la taille maximale).
+        """
+        capacite = 2 * len(self.iterations)
+        if self.taille_maximum > 0:
+            capacite = min(capacite, self.taille_maximum)
+        for nom in HistoriqueGP.TABLEAUX:
+            ancien = getattr(self, nom)
+            nouveau = np.empty((capacite,) + ancien.shape[1:], dtype=ancien.dtype)
+            nouveau[:self.nb] = ancien[:self.nb]
+            setattr(self, nom, nouveau)
+
+    def decime(self):
+        """
+        Sous-échantillonne l'historique : conserve une entrée sur deux, ainsi que la dernière.
+        """
+        garde = np.arange(0, self.nb, 2)
+        if garde[-1] != self.nb - 1:
+            garde = np.append(garde, self.nb - 1)
+        for nom in HistoriqueGP.TABLEAUX:
+            tableau = getattr(self, nom)
+            tableau[:len(garde)] = tableau[garde]
+        self.genomes[len(garde):self.nb] = None
+        self.nb = len(garde)
+
+    def position(self, iteration):
+        """
+        Position de l'entrée en vigueur à une itération donnée (dernière entrée enregistrée à cette itération ou avant).
+        Returns:
+            int: Position de l'entrée, -1 si aucune.
+        """
+        return int(np.searchsorted(self.iterations[:self.nb], iteration, side='right')) - 1
+
+    def get(self, iteration, config):
+        """
+        Reconstruit le meilleur individu d'une itération donnée.
+        Args:
+            iteration (int): Numéro de l'itération.
+            config (obj): Instance de la boite de config.
+        Returns:
+            ChromosomeGP: Le meilleur individu, None si l'itération n'a pas été atteinte.
+        """
+        if iteration < 0 or iteration > self.derniere_iteration:
+            return None
+        pos = self.position(iteration)
+        if pos < 0:
+            return None
+        item = ChromosomeGP(config, 'none')
+        item.read_gene(self.genomes[pos])
+        item.set_variables()
+        item.fitness = float(self.fitness[pos])
+        item.generation = int(self.generations[pos])
+        if not np.isnan(self.echelles[pos, 0]):
+            item.echelle = tuple(self.echelles[pos].tolist())
+        return item
+
+    def derniere_fitness(self):
+        """
+        Fitness du dernier meilleur individu enregistré (None si l'historique est vide).
+        """
+        if self.nb == 0:
+            return None
+        return float(self.fitness[self.nb-1])
+
+    def courbe(self):
+        """
+        Courbe de convergence : itérations et fitness des entrées enregistrées, complétée jusqu'à la dernière itération.
+        Returns:
+            np.ndarray: Itérations.
+            np.ndarray: Fitness.
+        """
+        iterations = self.iterations[:self.nb]
+        fitness = self.fitness[:self.nb]
+        if self.nb > 0 and iterations[-1] < self.derniere_iteration:
+            iterations = np.append(iterations, self.derniere_iteration)
+            fitness = np.append(fitness, fitness[-1])
+        return iterations, fitness
+
+#------------------------------------------------------------------------
+    def etat(self):
+        """
+        Copie de l'historique pour les points de reprise.
+        Returns:
+            dict: Tableaux de l'historique.
+        """
+        etat = {nom: getattr(self, nom)[:self.nb].copy() for nom in HistoriqueGP.TABLEAUX}
+        etat['derniere_iteration'] = self.derniere_iteration
+        return etat
+
+    def restaure(self, etat):
+        """
+        Restaure l'historique à partir d'une copie produite par etat.
+        Args:
+            etat (dict): Tableaux de l'historique.
+        """
+        nb = len(etat['iterations'])
+        capacite = max(nb, len(self.iterations))
+        for nom in HistoriqueGP.TABLEAUX:
+            ancien = getattr(self, nom)
+            tableau = np.empty((capacite,) + ancien.shape[1:], dtype=ancien.dtype)
+            tableau[:nb] = etat[nom] if nom in etat else np.nan
+            setattr(self, nom, tableau)
+        self.nb = nb
+        self.derniere_iteration = etat['derniere_iteration']
+        self.dernier = None
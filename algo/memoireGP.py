@@ -0,0 +1,194 @@
+import os
+import sys
+import importlib
+import tracemalloc
+import numpy as np
+
+"""
+La classe MemoireGP surveille l'empreinte mémoire d'une exécution, toutes les periode générations :
+	rss        : mémoire résidente du processus (psutil s'il est installé, sinon /proc/self/statm, sinon
+	             le pic de resource.getrusage).
+	allocations: mémoire allouée par Python et son pic (tracemalloc, si suivi_allocations), avec la ligne de
+	             code qui en alloue le plus (instantané tracemalloc).
+	estimation : octets par gène et par chromosome, mesurés (sys.getsizeof) sur au plus NB_ECHANTILLON
+	             individus pris à intervalles réguliers (sans tirage aléatoire : l'exécution reste reproductible).
+	             Un chromosome compte ses attributs (hors configuration), sa liste de gènes et ses gènes ; les
+	             gènes partagés entre individus (cf croisements) sont comptés pour chacun : c'est un majorant.
+	             partage_genes : nombre moyen de références à chaque gène distinct de l'échantillon.
+
+Plafond (plafond, en Mo, 0 : aucun) : la mémoire de référence est la mémoire résidente, ou à défaut la
+mémoire allouée. Au-delà de SEUIL_ALERTE x plafond, une alerte est émise ; au-delà du plafond, l'exécution
+s'arrête si l'action est arret (cf AlgoGP.execute), sinon une alerte est émise.
+"""
+
+class MemoireGP():
+
+    ACTION_ALERTE = "alerte"
+    ACTION_ARRET  = "arret"
+
+    SEUIL_ALERTE   = 0.9     # Part du plafond à partir de laquelle une alerte est émise
+    NB_ECHANTILLON = 100     # Nombre maximal d'individus mesurés pour l'estimation
+    MEGA_OCTET     = 1024 * 1024
+
+    def __init__(self, periode=0, plafond=0, action=ACTION_ALERTE, suivi_allocations=False):
+        """
+        Initialise la surveillance de la mémoire.
+        Args:
+            periode (int): Période des mesures en générations (0 : désactivé).
+            plafond (float): Plafond de mémoire en Mo (0 : aucun).
+            action (str): Action au-delà du plafond (alerte, arret).
+            suivi_allocations (bool): Suivi des allocations Python par tracemalloc.
+        """
+        self.periode = periode
+        self.plafond = plafond
+        self.action = action
+        self.suivi_allocations = suivi_allocations
+        self.demarre_ici = False      # tracemalloc démarré par la surveillance (et donc à arrêter)
+        self.mesures = []
+        self.derniere = None
+        self.rss_max = 0.0
+        self.alertes = 0
+        self.depasse = False          # Plafond dépassé avec l'action arret
+
+    def demarre(self):
+        """
+        Démarre le suivi des allocations, s'il est demandé et pas déjà actif.
+        """
+        if self.periode > 0 and self.suivi_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.demarre_ici = True
+
+    def arrete(self):
+        """
+        Arrête le suivi des allocations démarré par demarre.
+        """
+        if self.demarre_ici:
+            tracemalloc.stop()
+            self.demarre_ici = False
+
+    def echeance(self, iteration):
+        """
+        Indique si une mesure est due pour la génération donnée.
+        """
+        return self.periode > 0 and iteration % self.periode == 0
+
+    def rss():
+        """
+        Mémoire résidente du processus.
+        Returns:
+            float: Octets (None si elle ne peut pas être lue).
+        """
+        try:
+            return float(importlib.import_module("psutil").Process().memory_info().rss)
+        except Exception:
+            pass
+        try:
+            with open("/proc/self/statm", 'r') as file:
+                return float(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except Exception:
+            pass
+        try:
+            resource = importlib.import_module("resource")
+            return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * (1 if sys.platform == "darwin" else 1024)
+        except Exception:
+            return None
+
+    def taille(valeur):
+        """
+        Taille en octets d'une valeur et des conteneurs (tuple, liste, dictionnaire) qu'elle contient.
+        """
+        taille = sys.getsizeof(valeur)
+        if isinstance(valeur, (tuple, list)):
+            taille += sum(MemoireGP.taille(item) for item in valeur)
+        elif isinstance(valeur, dict):
+            taille += sum(MemoireGP.taille(item) for item in valeur.values())
+        return taille
+
+    def taille_gene(gene):
+        """
+        Taille en octets d'un gène (objet et attributs).
+        """
+        return sys.getsizeof(gene) + sys.getsizeof(vars(gene))
+
+    def estime(population):
+        """
+        Estime les octets par gène et par chromosome sur un échantillon régulier de la population.
+        Returns:
+            dict: octets_par_gene, octets_par_chromosome, partage_genes, genes (nombre total de gènes).
+        """
+        estimation = {'octets_par_gene': 0.0, 'octets_par_chromosome': 0.0, 'partage_genes': 0.0,
+                      'genes': sum(len(item.gen) for item in population)}
+        if len(population) == 0:
+            return estimation
+        echantillon = [population[i] for i in np.linspace(0, len(population) - 1, min(len(population), MemoireGP.NB_ECHANTILLON)).astype(int).tolist()]
+        tailles_genes = {}
+        references = 0
+        total = 0
+        for item in echantillon:
+            total += sys.getsizeof(item) + sys.getsizeof(vars(item)) + sys.getsizeof(item.gen)
+            total += sum(MemoireGP.taille(val) for key, val in vars(item).items() if key not in ('config', 'gen'))
+            for gene in item.gen:
+                if id(gene) not in tailles_genes:
+                    tailles_genes[id(gene)] = MemoireGP.taille_gene(gene)
+                total += tailles_genes[id(gene)]
+                references += 1
+        estimation['octets_par_chromosome'] = total / len(echantillon)
+        if len(tailles_genes) > 0:
+            estimation['octets_par_gene'] = sum(tailles_genes.values()) / len(tailles_genes)
+            estimation['partage_genes'] = references / len(tailles_genes)
+        return estimation
+
+    def mesure(self, iteration, population):
+        """
+        Mesure la mémoire et la compare au plafond.
+        Args:
+            iteration (int): Numéro de la génération.
+            population (list): Population courante.
+        Returns:
+            dict: Mesure (Mo pour les mémoires) ; etat vaut ok, alerte ou arret.
+        """
+        rss = MemoireGP.rss()
+        mesure = {'iteration': iteration,
+                  'rss_mo': round(rss / MemoireGP.MEGA_OCTET, 3) if rss is not None else None,
+                  'population': len(population)}
+        for key, val in MemoireGP.estime(population).items():
+            mesure[key] = round(val, 1) if isinstance(val, float) else val
+        mesure['estimation_population_mo'] = round(mesure['octets_par_chromosome'] * len(population) / MemoireGP.MEGA_OCTET, 3)
+        reference = rss
+        if tracemalloc.is_tracing():
+            courant, pic = tracemalloc.get_traced_memory()
+            mesure['allocations_mo'] = round(courant / MemoireGP.MEGA_OCTET, 3)
+            mesure['allocations_pic_mo'] = round(pic / MemoireGP.MEGA_OCTET, 3)
+            statistiques = tracemalloc.take_snapshot().statistics('lineno')
+            if len(statistiques) > 0:
+                mesure['allocation_principale'] = str(statistiques[0])
+            if reference is None:
+                reference = courant
+        if rss is not None:
+            self.rss_max = max(self.rss_max, mesure['rss_mo'])
+
+        mesure['etat'] = "ok"
+        if self.plafond > 0 and reference is not None:
+            charge = reference / MemoireGP.MEGA_OCTET / self.plafond
+            if charge >= 1 and self.action == MemoireGP.ACTION_ARRET:
+                mesure['etat'] = "arret"
+                self.depasse = True
+            elif charge >= MemoireGP.SEUIL_ALERTE:
+                mesure['etat'] = "alerte"
+                self.alertes += 1
+        self.mesures.append(mesure)
+        self.derniere = mesure
+        return mesure
+
+    def resume(self):
+        """
+        Résumé de la surveillance pour le fichier de résultats.
+        Returns:
+            dict: Pic de mémoire résidente observé, dernières estimations, nombre d'alertes, arrêt sur plafond.
+        """
+        derniere = self.derniere if self.derniere is not None else {}
+        return {'rss_max_mo': self.rss_max,
+                'octets_par_chromosome': derniere.get('octets_par_chromosome', 0.0),
+                'octets_par_gene': derniere.get('octets_par_gene', 0.0),
+                'alertes': self.alertes,
+                'arret': self.depasse}
@@ -0,0 +1,102 @@
+import numpy as np
+
+"""
+La classe OperateursGP choisit un opérateur génétique parmi plusieurs (croisements ou mutations)
+à la manière d'un bandit manchot : chaque opérateur est tiré avec une probabilité qui suit son
+taux de réussite récent.
+
+Méthode : appariement de probabilités (probability matching)
+	Récompense : 1 si l'enfant produit est valide et meilleur que le meilleur de ses parents, 0 sinon.
+	Qualité    : moyenne mobile exponentielle des récompenses de l'opérateur
+	             q <- q + taux_apprentissage * (récompense - q) : les résultats récents comptent davantage.
+	Probabilité: p = probabilite_minimum + (1 - K * probabilite_minimum) * q / somme(q), pour K opérateurs :
+	             chaque opérateur garde une probabilité minimale d'être essayé, et peut ainsi redevenir
+	             intéressant plus tard dans l'exécution.
+
+Les qualités initiales sont égales à 1 : tous les opérateurs sont essayés au début de l'exécution.
+Le nombre d'utilisations, d'enfants valides et d'améliorations de chaque opérateur est compté (cf statistiques).
+"""
+
+class OperateursGP():
+
+    def __init__(self, noms, taux_apprentissage=0.1, probabilite_minimum=0.05):
+        """
+        Initialise le choix adaptatif entre plusieurs opérateurs.
+        Args:
+            noms (list): Noms des opérateurs.
+            taux_apprentissage (float): Poids d'une nouvelle récompense dans la qualité d'un opérateur.
+            probabilite_minimum (float): Probabilité minimale de choisir chaque opérateur.
+        """
+        self.noms = list(noms)
+        self.taux_apprentissage = taux_apprentissage
+        self.probabilite_minimum = min(probabilite_minimum, 1.0 / len(self.noms))
+        self.qualites = np.ones(len(self.noms))
+        self.utilisations = np.zeros(len(self.noms), dtype=np.int64)
+        self.valides = np.zeros(len(self.noms), dtype=np.int64)
+        self.ameliorations = np.zeros(len(self.noms), dtype=np.int64)
+
+    def probabilites(self):
+        """
+        Probabilités de choix des opérateurs.
+        Returns:
+            np.ndarray: Une probabilité par opérateur.
+        """
+        total = self.qualites.sum()
+        if total <= 0:
+            return np.full(len(self.noms), 1.0 / len(self.noms))
+        return self.probabilite_minimum + (1 - len(self.noms) * self.probabilite_minimum) * self.qualites / total
+
+    def choisit(self):
+        """
+        Tire un opérateur selon les probabilités courantes.
+        Returns:
+            str: Nom de l'opérateur choisi.
+        """
+        cumul = np.cumsum(self.probabilites())
+        k = min(int(np.searchsorted(cumul, np.random.random_sample() * cumul[-1], side='right')), len(self.noms) - 1)
+        return self.noms[k]
+
+    def recompense(self, nom, valide, amelioration):
+        """
+        Enregistre le résultat d'une utilisation d'un opérateur et met à jour sa qualité.
+        Args:
+            nom (str): Nom de l'opérateur utilisé.
+            valide (bool): L'enfant produit est valide.
+            amelioration (bool): L'enfant est meilleur que le meilleur de ses parents.
+        """
+        k = self.noms.index(nom)
+        self.utilisations[k] += 1
+        self.valides[k] += bool(valide)
+        self.ameliorations[k] += bool(amelioration)
+        self.qualites[k] += self.taux_apprentissage * (float(amelioration) - self.qualites[k])
+
+    def statistiques(self):
+        """
+        Statistiques de chaque opérateur.
+        Returns:
+            list: Un dictionnaire par opérateur (nom, utilisations, valides, ameliorations, probabilite).
+        """
+        probabilites = self.probabilites()
+        return [{'nom': nom,
+                 'utilisations': int(self.utilisations[k]),
+                 'valides': int(self.valides[k]),
+                 'ameliorations': int(self.ameliorations[k]),
+                 'probabilite': round(float(probabilites[k]), 4)} for k, nom in enumerate(self.noms)]
+
+#------------------------------------------------------------------------
+    def etat(self):
+        """
+        Copie de l'état pour les points de reprise.
+        Returns:
+            dict: Qualités et compteurs des opérateurs.
+        """
+        return {nom: getattr(self, nom).copy() for nom in ('qualites', 'utilisations', 'valides', 'ameliorations')}
+
+    def restaure(self, etat):
+        """
+        Restaure l'état produit par etat.
+        Args:
+            etat (dict): Qualités et compteurs des opérateurs.
+        """
+        for nom, tableau in etat.items():
+            setattr(self, nom, tableau.copy())
@@ -0,0 +1,142 @@
+import numpy as np
+
+from algo.chromosomeGP import ChromosomeGP
+from algo.geneGP import GeneGP
+
+"""
+La classe PopulationCodecGP code une liste de chromosomes sous forme de tableaux NumPy compacts,
+et les relit. Elle sert au format binaire de population (.npz).
+
+Format des tableaux
+	vocabulaire : noms des symboles et des fonctions rencontrés (chaînes).
+	types       : type de chaque gène (int8, cf GeneGP.TYPE_GEN_*), tous chromosomes confondus.
+	codes       : indice du gène dans le vocabulaire (int16), -1 pour une constante.
+	valeurs     : valeur des constantes entières ou réelles (float64), dans l'ordre des gènes constants.
+	offsets     : début des gènes de chaque chromosome dans les tableaux précédents (n+1 valeurs).
+	fitness     : fitness de chaque chromosome (NaN si non calculée).
+	generation  : génération de chaque chromosome.
+	depth       : profondeur de chaque chromosome.
+	echelle     : coefficients (a, b) de la mise à l'échelle linéaire de chaque chromosome (NaN si aucune).
+	empreinte   : empreinte du jeu de données sur lequel les fitness ont été calculées.
+
+Les gènes n'étant jamais modifiés en place, un même objet gène est partagé par tous les
+chromosomes qui le contiennent lors de la lecture : le décodage ne crée qu'un objet par gène distinct.
+"""
+
+class PopulationCodecGP():
+
+    def encode(population):
+        """
+        Code une liste de chromosomes sous forme de tableaux.
+        Args:
+            population (list): Liste de ChromosomeGP.
+        Returns:
+            dict: Dictionnaire de tableaux NumPy (cf format).
+        """
+        vocabulaire = {}
+        memo = {}                       # id(gène) -> (type, code, valeur)
+        nb_genes = sum(len(item.gen) for item in population)
+        types = np.empty(nb_genes, dtype=np.int8)
+        codes = np.empty(nb_genes, dtype=np.int16)
+        valeurs = np.zeros(nb_genes, dtype=np.float64)
+        offsets = np.empty(len(population)+1, dtype=np.int64)
+
+        pos = 0
+        for i, item in enumerate(population):
+            offsets[i] = pos
+            for gene in item.gen:
+                code = memo.get(id(gene))
+                if code is None:
+                    if gene.is_constante():
+                        code = (gene.type_gen, -1, gene.name_gen)
+                    else:
+                        code = (gene.type_gen, vocabulaire.setdefault(gene.name_gen, len(vocabulaire)), 0)
+                    memo[id(gene)] = code
+                types[pos], codes[pos], valeurs[pos] = code
+                pos += 1
+        offsets[len(population)] = pos
+
+        return {
+                'vocabulaire': np.array(list(vocabulaire.keys()), dtype=str),
+                'types': types,
+                'codes': codes,
+                'valeurs': valeurs[codes < 0],
+                'offsets': offsets,
+                'fitness': np.array([item.fitness for item in population], dtype=np.float64),
+                'generation': np.array([item.generation for item in population], dtype=np.int32),
+                'depth': np.array([item.depth for item in population], dtype=np.int32),
+                'echelle': np.array([item.echelle if item.echelle is not None else (np.nan, np.nan) for item in population], dtype=np.float64).reshape(-1, 2),
+               }
+
+    def decode(tableaux, config):
+        """
+        Reconstruit les chromosomes à partir des tableaux produits par encode.
+        Les fitness mémorisées sont recopiées telles quelles.
+        Args:
+            tableaux (dict): Dictionnaire de tableaux NumPy.
+            config (obj): Instance de la boite de config.
+        Returns:
+            list: Liste de ChromosomeGP.
+        """
+        vocabulaire = [str(nom) for nom in tableaux['vocabulaire']]
+        types = tableaux['types'].astype(np.int64)
+        codes = tableaux['codes'].astype(np.int64)
+        constantes = codes < 0
+
+        # Clé entière de chaque gène : (type, indice du vocabulaire) ou -(type, indice de la valeur constante)
+        valeurs, indices = np.unique(tableaux['valeurs'], return_inverse=True)
+        cles = types * 65536 + codes
+        cles[constantes] = -1 - (indices.reshape(-1) * 16 + types[constantes])
+
+        # Un objet gène par gène distinct
+        distincts, inverse = np.unique(cles, return_inverse=True)
+        objets = []
+        for cle in distincts.tolist():
+            if cle >= 0:
+                objets.append(GeneGP.read_str(cle // 65536, vocabulaire[cle % 65536]))
+            else:
+                objets.append(GeneGP.read_str((-1 - cle) % 16, valeurs[(-1 - cle) // 16]))
+        tous = [objets[k] for k in inverse.reshape(-1).tolist()]
+
+        offsets = tableaux['offsets'].tolist()
+        fitness = tableaux['fitness'].tolist()
+        generation = tableaux['generation'].tolist()
+        depth = tableaux['depth'].tolist()
+        echelle = tableaux['echelle'].tolist() if 'echelle' in tableaux else [[np.nan, np.nan]] * len(fitness)
+        population = []
+        for i in range(len(offsets)-1):
+            item = ChromosomeGP(config, 'none')
+            item.gen = tous[offsets[i]:offsets[i+1]]
+            item.set_variables(depth[i])
+            item.fitness = fitness[i]
+            item.generation = generation[i]
+            if not np.isnan(echelle[i][0]):
+                item.echelle = tuple(echelle[i])
+            population.append(item)
+        return population
+
+#------------------------------------------------------------------------
+    def write(fichier, population, empreinte=""):
+        """
+        Écrit une population au format binaire .npz.
+        Args:
+            fichier (str): Chemin du fichier .npz.
+            population (list): Liste de ChromosomeGP.
+            empreinte (str): Empreinte du jeu de données associé aux fitness.
+        """
+        tableaux = PopulationCodecGP.encode(population)
+        with open(fichier, 'wb') as file:
+            np.savez(file, empreinte=np.array(empreinte), **tableaux)
+
+    def read(fichier):
+        """
+        Lit les tableaux d'une population au format binaire .npz.
+        Args:
+            fichier (str): Chemin du fichier .npz.
+        Returns:
+            dict: Dictionnaire de tableaux NumPy (cf format).
+        """
+        with np.load(fichier, allow_pickle=False) as data:
+            tableaux = {key: data[key] for key in data.files}
+        tableaux['empreinte'] = str(tableaux.get('empreinte', ""))
+        return tableaux
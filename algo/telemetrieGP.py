@@ -0,0 +1,66 @@
+import json
+import time
+
+"""
+La classe TelemetrieGP écrit la télémétrie d'une exécution : un enregistrement JSON par génération,
+une ligne par enregistrement (format JSON Lines), facile à relire avec pandas ou jq.
+
+Les enregistrements sont sérialisés en mémoire et écrits par paquets : le fichier n'est écrit que tous
+les taille_tampon enregistrements, ou lorsque periode secondes se sont écoulées depuis la dernière écriture,
+et à la fermeture. Le fichier est vidé au démarrage d'une nouvelle exécution ; une exécution reprise
+(cf CheckpointGP) le complète au contraire, à la suite de la télémétrie de l'exécution interrompue.
+Chaque exécution doit donc avoir son propre fichier (cf MainGP.fichier_telemetrie en mode iterate).
+
+Contenu d'un enregistrement : cf AlgoGP.enregistrement_telemetrie.
+"""
+
+class TelemetrieGP():
+
+    def __init__(self, fichier, reprise=False, taille_tampon=100, periode=5.0):
+        """
+        Initialise l'écriture de la télémétrie ; le fichier est vidé, sauf en reprise.
+        Args:
+            fichier (str): Fichier JSON Lines.
+            reprise (bool): Exécution reprise : les enregistrements sont ajoutés à ceux du fichier.
+            taille_tampon (int): Nombre d'enregistrements conservés en mémoire avant écriture.
+            periode (float): Délai maximal (secondes) entre deux écritures.
+        """
+        self.fichier = fichier
+        self.taille_tampon = taille_tampon
+        self.periode = periode
+        self.tampon = []
+        self.derniere_ecriture = time.time()
+        if not reprise:
+            open(self.fichier, 'w').close()
+
+    def ecrit(self, enregistrement):
+        """
+        Ajoute un enregistrement.
+        Args:
+            enregistrement (dict): Valeurs sérialisables en JSON.
+        """
+        self.tampon.append(json.dumps(enregistrement, separators=(',', ':')))
+        if len(self.tampon) >= self.taille_tampon or time.time() - self.derniere_ecriture >= self.periode:
+            self.vide()
+
+    def vide(self):
+        """
+        Écrit les enregistrements en attente.
+        """
+        self.derniere_ecriture = time.time()
+        if len(self.tampon) == 0:
+            return
+        with open(self.fichier, 'a') as file:
+            file.write("\n".join(self.tampon) + "\n")
+        self.tampon = []
+
+    def lit(fichier):
+        """
+        Relit un fichier de télémétrie.
+        Args:
+            fichier (str): Fichier JSON Lines.
+        Returns:
+            list: Enregistrements, dans l'ordre d'écriture.
+        """
+        with open(fichier, 'r') as file:
+            return [json.loads(ligne) for ligne in file if ligne.strip() != ""]
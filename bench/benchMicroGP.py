@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import numpy as np
+
+from algo.algoGP import AlgoGP
+from algo.chromosomeGP import ChromosomeGP
+from bench.benchPopulationGP import BenchPopulationGP
+from bench.benchMoteurGP import BenchMoteurGP
+from tools.argParseToolsGP import ArgParseToolsGP
+from tools.configToolsGP import ConfigToolsGP
+from tools.mathsToolsGP import MathsToolsGP
+
+"""
+La classe BenchMicroGP mesure les chemins critiques de l'algorithme, sur une grille de profondeurs
+maximales (max_depth) et de tailles de population, avec des graines fixes :
+	evaluate, calculate_fitness                          : évaluation d'un individu (un bloc / tout le jeu de données).
+	croisement_middle, croisement_absorption_partielle,
+	croisement_absorption_totale                         : un croisement (deux enfants).
+	mutate_remplace, mutate_swap, mutate_deplace         : une mutation.
+	position_fin_branche, set_variables                  : parcours du génome.
+	populate_generate                                    : création d'un individu valide (évaluations comprises).
+	populate_write, populate_read (texte et .npz)        : écriture et lecture d'un individu.
+Avec l'option -macro, les benchmarks de la gestion de la population (BenchPopulationGP) et des moteurs
+d'évolution (BenchMoteurGP) sont ajoutés.
+
+Chaque mesure est le temps par opération (secondes), le meilleur de plusieurs répétitions.
+Les résultats sont écrits au format JSON ; comparés à une référence (un fichier JSON produit de la même
+façon), toute mesure plus lente que la référence de plus du seuil est signalée comme une régression
+(code de sortie 1).
+
+Utilisation
+	python -m bench.benchMicroGP -d 3,5,7 -sp 100,1000 -out data/bench.json
+	python -m bench.benchMicroGP -d 3,5,7 -sp 100,1000 -out data/bench_new.json -reference data/bench.json -seuil 0.1
+"""
+
+class BenchMicroGP():
+
+    def cree_algo(profondeur, taille, points, seed, formule="x**2+x*sin(x)"):
+        """
+        Crée un algorithme sur un jeu de données de `points` points de la formule.
+        Returns:
+            AlgoGP: L'algorithme initialisé (population vide).
+        """
+        params = ArgParseToolsGP()
+        params.parse_arguments(['-mode', 'run', '-d', str(profondeur), '-sp', str(taille), '-s', str(seed), '-f', formule])
+        config = ConfigToolsGP(params)
+        inputs = np.linspace(config.xmin, config.xmax, points)
+        outputs, masque = MathsToolsGP.evaluate_formule_vect(config.formule, inputs, config.terminal_set)
+        algo = AlgoGP()
+        algo.initialise(config, inputs[masque], outputs[masque], None)
+        return algo
+
+    def copie(item):
+        """
+        Copie d'un individu (les gènes, jamais modifiés en place, sont partagés).
+        """
+        copie = ChromosomeGP(item.config, 'none')
+        copie.gen = list(item.gen)
+        copie.set_variables(item.depth)
+        return copie
+
+    def chronometre(operation, nombre, repetitions, preparation=None):
+        """
+        Mesure le temps par opération.
+        Args:
+            operation (callable): Fonction exécutant `nombre` opérations (reçoit le résultat de preparation).
+            nombre (int): Nombre d'opérations par exécution.
+            repetitions (int): Nombre d'exécutions ; la plus rapide est retenue.
+            preparation (callable): Fonction appelée avant chaque exécution, hors chronométrage.
+        Returns:
+            float: Secondes par opération.
+        """
+        meilleur = float('inf')
+        for i in range(repetitions):
+            donnees = preparation() if preparation is not None else None
+            debut = time.perf_counter()
+            operation(donnees)
+            meilleur = min(meilleur, time.perf_counter() - debut)
+        return meilleur / max(1, nombre)
+
+    def mesure(profondeur, taille, points=256, repetitions=5, seed=1):
+        """
+        Mesure toutes les opérations pour une profondeur maximale et une taille de population.
+        Returns:
+            dict: Secondes par opération, par nom d'opération.
+        """
+        random.seed(seed)
+        np.random.seed(seed)
+        algo = BenchMicroGP.cree_algo(profondeur, taille, points, seed)
+        resultats = {}
+
+        debut = time.perf_counter()
+        algo.populate_generate()
+        resultats['populate_generate'] = (time.perf_counter() - debut) / taille
+        population = algo.population
+        couples = list(zip(population[0::2], population[1::2]))
+        inputs = next(algo.dataset.blocs())[0]
+        chrono = BenchMicroGP.chronometre
+
+        resultats['evaluate'] = chrono(lambda d: [item.evaluate(inputs) for item in population], taille, repetitions)
+        resultats['calculate_fitness'] = chrono(lambda d: [item.calculate_fitness(algo.dataset) for item in population], taille, repetitions)
+        for nom in ('croisement_middle', 'croisement_absorption_partielle', 'croisement_absorption_totale'):
+            croisement = getattr(ChromosomeGP, nom)
+            random.seed(seed)
+            np.random.seed(seed)
+            resultats[nom] = chrono(lambda d: [croisement(mother, father) for mother, father in couples], len(couples), repetitions)
+        for nom in ('mutate_remplace', 'mutate_swap', 'mutate_deplace'):
+            random.seed(seed)
+            np.random.seed(seed)
+            resultats[nom] = chrono(lambda copies: [getattr(item, nom)() for item in copies], taille, repetitions,
+                                    lambda: [BenchMicroGP.copie(item) for item in population])
+        resultats['position_fin_branche'] = chrono(lambda d: [item.position_fin_branche(0) for item in population], taille, repetitions)
+        resultats['set_variables'] = chrono(lambda d: [item.set_variables() for item in population], taille, repetitions)
+
+        with tempfile.TemporaryDirectory() as dossier:
+            for extension in ('txt', 'npz'):
+                fichier = os.path.join(dossier, 'population.' + extension)
+                resultats['populate_write_' + extension] = chrono(lambda d: algo.populate_write(fichier), taille, repetitions)
+                algo.config.verbose = False
+                resultats['populate_read_' + extension] = chrono(lambda d: algo.populate_read(fichier), taille, repetitions)
+        return resultats
+
+    def execute(profondeurs=(3, 5, 7), tailles=(100, 1000), points=256, repetitions=5, seed=1, macro=False):
+        """
+        Mesure toutes les opérations sur la grille (profondeur maximale x taille de population).
+        Returns:
+            dict: Paramètres, environnement et résultats ("operation[d=profondeur,n=taille]" -> secondes par opération).
+        """
+        resultats = {}
+        for profondeur in profondeurs:
+            for taille in tailles:
+                for nom, duree in BenchMicroGP.mesure(profondeur, taille, points, repetitions, seed).items():
+                    resultats['%s[d=%d,n=%d]' % (nom, profondeur, taille)] = duree
+        if macro:
+            population = BenchPopulationGP.execute(taille=20000, echantillon=500, generations=10, seed=seed)
+            resultats['population_tri'] = population['tri']
+            resultats['population_index'] = population['index']
+            moteurs = BenchMoteurGP.execute(taille=2000, echantillon=200, iterations=10, points=64, seed=seed)
+            for moteur in (ConfigToolsGP.MOTEUR_GENERATIONNEL, ConfigToolsGP.MOTEUR_STATIONNAIRE):
+                resultats['evaluation_' + moteur] = 1.0 / moteurs['evaluations_seconde_' + moteur]
+        return {'parametres': {'profondeurs': list(profondeurs), 'tailles': list(tailles), 'points': points,
+                               'repetitions': repetitions, 'seed': seed, 'macro': macro},
+                'environnement': {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine()},
+                'resultats': resultats}
+
+    def compare(resultats, reference, seuil=0.1):
+        """
+        Compare des mesures à une référence.
+        Args:
+            resultats (dict): Mesures (cf execute).
+            reference (dict): Mesures de référence.
+            seuil (float): Ralentissement relatif toléré.
+        Returns:
+            list: Tuples (nom, référence, mesure, rapport, régression) des mesures présentes des deux côtés.
+        """
+        comparaison = []
+        for nom, duree in resultats['resultats'].items():
+            if nom in reference['resultats'] and reference['resultats'][nom] > 0:
+                rapport = duree / reference['resultats'][nom]
+                comparaison.append((nom, reference['resultats'][nom], duree, rapport, rapport > 1 + seuil))
+        return comparaison
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark des chemins critiques de l'algorithme")
+    parser.add_argument('-d', '--profondeurs', help='Profondeurs maximales, séparées par des virgules', required=False, default="3,5,7")
+    parser.add_argument('-sp', '--tailles', help='Tailles de population, séparées par des virgules', required=False, default="100,1000")
+    parser.add_argument('-points', '--points', help='Nombre de points du jeu de données', required=False, default=256, type=int)
+    parser.add_argument('-r', '--repetitions', help='Nombre de répétitions de chaque mesure', required=False, default=5, type=int)
+    parser.add_argument('-s', '--seed', help='Graine des générateurs aléatoires', required=False, default=1, type=int)
+    parser.add_argument('-macro', '--macro', help='Ajoute les benchmarks de la population et des moteurs', required=False, action="store_true")
+    parser.add_argument('-out', '--outputfile', help='Fichier JSON des résultats', required=False, default="")
+    parser.add_argument('-reference', '--reference', help='Fichier JSON de référence à comparer', required=False, default="")
+    parser.add_argument('-seuil', '--seuil', help='Ralentissement relatif toléré avant de signaler une régression', required=False, default=0.1, type=float)
+    args = parser.parse_args()
+
+    resultats = BenchMicroGP.execute([int(val) for val in args.profondeurs.split(',')], [int(val) for val in args.tailles.split(',')],
+                                     args.points, args.repetitions, args.seed, args.macro)
+    if args.outputfile != "":
+        with open(args.outputfile, 'w') as file:
+            json.dump(resultats, file, indent=2)
+    if args.reference == "":
+        for nom, duree in resultats['resultats'].items():
+            print("%-48s %.3e" % (nom, duree))
+    else:
+        with open(args.reference, 'r') as file:
+            reference = json.load(file)
+        regressions = 0
+        for nom, ancien, nouveau, rapport, regression in BenchMicroGP.compare(resultats, reference, args.seuil):
+            print("%-48s %.3e %.3e %6.2f %s" % (nom, ancien, nouveau, rapport, "REGRESSION" if regression else ""))
+            regressions += regression
+        print(regressions, "régression(s)")
+        sys.exit(1 if regressions > 0 else 0)
@@ -0,0 +1,121 @@
+import argparse
+import numpy as np
+
+from algo.algoGP import AlgoGP
+from tools.argParseToolsGP import ArgParseToolsGP
+from tools.configToolsGP import ConfigToolsGP
+from tools.mathsToolsGP import MathsToolsGP
+
+"""
+La classe BenchMoteurGP compare le nombre d'évaluations de fitness par seconde des deux moteurs d'évolution :
+	generationnel : générations complètes (AlgoGP.iterate puis remplacement).
+	stationnaire  : remplacement en continu du perdant d'un tournoi inversé (AlgoGP.iterate_stationnaire).
+
+Les deux moteurs partent de la même graine et du même jeu de données ; seules les évaluations faites
+pendant l'évolution sont comptées (pas celles de la population initiale). Un jeu de données de petite
+taille fait ressortir le coût de la gestion de la population par rapport à celui des évaluations.
+Chaque moteur est exécuté repetitions fois, en alternance, et la plus courte exécution est retenue
+(best-of-N) : une exécution dure quelques secondes avec les valeurs par défaut, ce qui rend le
+rapport stable d'une mesure à l'autre.
+
+Le moteur stationnaire n'est nettement plus rapide que lorsque size_echantillon est petit devant
+size_population : le moteur générationnel paie alors la fusion de toute la population à chaque
+génération pour peu d'enfants (-sp 50000 -e 100 : environ 2.8x, gestion 32 µs contre 122 µs par
+évaluation). Avec -sp 5000 -e 500 (valeurs par défaut), il reste plus lent (environ 0.8x à 0.85x,
+contre 0.75x avant que ses tournois ne portent sur des listes Python), y compris à longueur de génome
+égale (-max_genes 7) : sélection et remplacement lui coûtent encore environ 6 µs par évaluation contre
+3.5 µs pour la sélection et la fusion du moteur générationnel, et le reste de l'écart varie d'une
+exécution à l'autre. gestion_us_evaluation_* donne le temps hors croisement, mutation et évaluation,
+en µs par évaluation (contrôles de profondeur compris), et longueur_moyenne_* la longueur moyenne des
+génomes (le moteur stationnaire fait évoluer des génomes deux fois plus longs avec les valeurs par
+défaut). La fitness finale (fitness_*) est à comparer aussi : les deux moteurs ne convergent pas de la
+même façon, et le moteur stationnaire peut finir nettement moins bien (fitness 0.46 contre 0 à
+-sp 50000 -e 100, 0.40 contre 0 avec -nbrun 20).
+
+Utilisation
+	python -m bench.benchMoteurGP -sp 5000 -e 500 -nbrun 100 -r 5 -points 64
+	python -m bench.benchMoteurGP -sp 50000 -e 100 -nbrun 100 -r 5 -points 64
+	python -m bench.benchMoteurGP -sp 5000 -e 500 -nbrun 100 -r 5 -points 64 -max_genes 7
+"""
+
+class BenchMoteurGP():
+
+    def cree_algo(moteur, taille, echantillon, iterations, points, seed, max_genes=0, formule="x**2+x*sin(x)"):
+        """
+        Crée un algorithme sur un jeu de données de `points` points de la formule, pour le moteur donné.
+        Returns:
+            AlgoGP: L'algorithme initialisé.
+        """
+        params = ArgParseToolsGP()
+        params.parse_arguments(['-mode', 'run', '-moteur', moteur, '-sp', str(taille), '-e', str(echantillon),
+                                '-nbrun', str(iterations), '-s', str(seed), '-f', formule, '-sf', '0', '-chrono',
+                                '-max_genes', str(max_genes)])
+        config = ConfigToolsGP(params)
+        inputs = np.linspace(config.xmin, config.xmax, points)
+        outputs, masque = MathsToolsGP.evaluate_formule_vect(config.formule, inputs, config.terminal_set)
+        algo = AlgoGP()
+        algo.initialise(config, inputs[masque], outputs[masque], None)
+        return algo
+
+    def mesure(algo):
+        """
+        Exécute l'algorithme et mesure ses évaluations pendant l'évolution. La gestion est le temps des
+        générations (cf ChronometreGP) hors croisement, mutation et évaluation : sélection, remplacement et
+        boucle du moteur, par évaluation.
+        Returns:
+            dict: Évaluations, durée (secondes), évaluations par seconde, gestion par évaluation (microsecondes),
+                  longueur moyenne des génomes et meilleure fitness.
+        """
+        algo.execute()
+        evaluations = algo.nb_evaluations - algo.compteurs_initialisation['evaluations']
+        gestion = sum(mesure['duree'] - mesure['croisement'] - mesure['mutation'] - mesure['evaluation']
+                      for mesure in algo.get_phases()['generations'] if mesure['generation'] >= 0)
+        return {'evaluations': evaluations,
+                'duree': algo.elapsed_time,
+                'evaluations_seconde': evaluations / algo.elapsed_time if algo.elapsed_time > 0 else 0.0,
+                'gestion_us_evaluation': 1e6 * gestion / evaluations if evaluations > 0 else 0.0,
+                'longueur_moyenne': algo.longueur_moyenne(),
+                'fitness': algo.get_best().fitness}
+
+    def execute(taille=5000, echantillon=500, iterations=100, points=64, seed=1, repetitions=5, max_genes=0):
+        """
+        Mesure les deux moteurs, en alternance, et retient pour chacun la plus courte des exécutions.
+        Args:
+            taille (int): Taille de la population.
+            echantillon (int): Nombre d'enfants par itération.
+            iterations (int): Nombre d'itérations.
+            points (int): Nombre de points du jeu de données.
+            seed (int): Graine des générateurs aléatoires.
+            repetitions (int): Nombre d'exécutions de chaque moteur.
+            max_genes (int): Nombre maximal de gènes d'un enfant (0 : pas de limite).
+        Returns:
+            dict: Mesures de chaque moteur, et rapport des évaluations par seconde (stationnaire / generationnel).
+        """
+        resultats = {'taille': taille, 'echantillon': echantillon, 'iterations': iterations, 'points': points, 'repetitions': repetitions, 'max_genes': max_genes}
+        moteurs = (ConfigToolsGP.MOTEUR_GENERATIONNEL, ConfigToolsGP.MOTEUR_STATIONNAIRE)
+        meilleures = {}
+        for repetition in range(repetitions):
+            for moteur in moteurs:
+                mesures = BenchMoteurGP.mesure(BenchMoteurGP.cree_algo(moteur, taille, echantillon, iterations, points, seed, max_genes))
+                if moteur not in meilleures or mesures['duree'] < meilleures[moteur]['duree']:
+                    meilleures[moteur] = mesures
+        for moteur in moteurs:
+            for key, val in meilleures[moteur].items():
+                resultats[key+'_'+moteur] = val
+        resultats['acceleration'] = resultats['evaluations_seconde_'+ConfigToolsGP.MOTEUR_STATIONNAIRE] / resultats['evaluations_seconde_'+ConfigToolsGP.MOTEUR_GENERATIONNEL]
+        return resultats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark des moteurs d'évolution")
+    parser.add_argument('-sp', '--size_population', help='Taille de la population', required=False, default=5000, type=int)
+    parser.add_argument('-e', '--size_echantillon', help="Nombre d'enfants par itération", required=False, default=500, type=int)
+    parser.add_argument('-nbrun', '--nb_iterations', help="Nombre d'itérations", required=False, default=100, type=int)
+    parser.add_argument('-points', '--points', help='Nombre de points du jeu de données', required=False, default=64, type=int)
+    parser.add_argument('-s', '--seed', help='Graine des générateurs aléatoires', required=False, default=1, type=int)
+    parser.add_argument('-r', '--repetitions', help="Nombre d'exécutions de chaque moteur (la plus courte est retenue)", required=False, default=5, type=int)
+    parser.add_argument('-max_genes', '--max_genes', help="Nombre maximal de gènes d'un enfant (0 : pas de limite)", required=False, default=0, type=int)
+    args = parser.parse_args()
+    resultats = BenchMoteurGP.execute(args.size_population, args.size_echantillon, args.nb_iterations, args.points, args.seed, args.repetitions, args.max_genes)
+    for key, val in resultats.items():
+        print(key, val)
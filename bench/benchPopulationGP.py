@@ -0,0 +1,109 @@
+import time
+import random
+import argparse
+import numpy as np
+
+from algo.algoGP import AlgoGP
+from algo.chromosomeGP import ChromosomeGP
+from tools.argParseToolsGP import ArgParseToolsGP
+from tools.configToolsGP import ConfigToolsGP
+
+"""
+La classe BenchPopulationGP mesure le coût de la gestion de la population à chaque génération
+(sélection des size_echantillon meilleurs, remplacement mixt_best, récupération du meilleur individu),
+en comparant :
+	tri    : l'ancienne gestion par tris complets de la population (trois tris par génération).
+	index  : la gestion par index des fitness et sélection partielle (AlgoGP.meilleurs, np.argpartition).
+
+Les fitness sont tirées au hasard : seul le coût de la gestion de la population est mesuré,
+pas celui de l'évaluation des individus.
+
+Utilisation
+	python -m bench.benchPopulationGP -sp 100000 -e 1000 -g 20
+"""
+
+class BenchPopulationGP():
+
+    def cree_algo(taille, echantillon, seed):
+        """
+        Crée un algorithme dont la population contient `taille` individus de fitness aléatoire.
+        Returns:
+            AlgoGP: L'algorithme initialisé.
+        """
+        params = ArgParseToolsGP()
+        params.parse_arguments(['-mode', 'run', '-sp', str(taille), '-e', str(echantillon), '-s', str(seed)])
+        algo = AlgoGP()
+        algo.initialise(ConfigToolsGP(params), [0.0], [0.0], None)
+        algo.population = BenchPopulationGP.cree_individus(algo.config, taille)
+        algo.index_population()
+        return algo
+
+    def cree_individus(config, nombre):
+        """
+        Crée `nombre` individus vides de fitness aléatoire.
+        """
+        population = []
+        for fitness in np.random.random_sample(nombre).tolist():
+            item = ChromosomeGP(config, 'none')
+            item.fitness = fitness
+            population.append(item)
+        return population
+
+    def generation_tri(algo, enfants):
+        """
+        Une génération gérée par tris complets (ancienne implémentation).
+        """
+        algo.population.sort(reverse=False, key=lambda x: x.fitness)
+        selection = algo.population[0:algo.config.size_echantillon]
+        selection.sort(reverse=False, key=lambda x: x.fitness)
+        algo.population += enfants
+        algo.population.sort(reverse=False, key=lambda x: x.fitness)
+        algo.population = algo.population[0:algo.config.size_population]
+        algo.population.sort(reverse=False, key=lambda x: x.fitness)
+        return algo.population[0]
+
+    def generation_index(algo, enfants):
+        """
+        Une génération gérée par l'index des fitness et la sélection partielle.
+        """
+        algo.population_selection = algo.selection()
+        algo.new_population = enfants
+        algo.remplacement()
+        return algo.get_best()
+
+    def execute(taille=100000, echantillon=1000, generations=20, seed=1):
+        """
+        Mesure les deux gestions de la population sur les mêmes individus.
+        Args:
+            taille (int): Taille de la population.
+            echantillon (int): Taille de l'échantillon (nombre d'enfants par génération).
+            generations (int): Nombre de générations mesurées.
+            seed (int): Graine des générateurs aléatoires.
+        Returns:
+            dict: Temps moyen par génération (secondes) de chaque gestion, et accélération.
+        """
+        resultats = {'taille': taille, 'echantillon': echantillon, 'generations': generations}
+        for nom, generation in (('tri', BenchPopulationGP.generation_tri), ('index', BenchPopulationGP.generation_index)):
+            random.seed(seed)
+            np.random.seed(seed)
+            algo = BenchPopulationGP.cree_algo(taille, echantillon, seed)
+            lots = [BenchPopulationGP.cree_individus(algo.config, echantillon) for i in range(generations)]
+            debut = time.perf_counter()
+            for enfants in lots:
+                best = generation(algo, enfants)
+            resultats[nom] = (time.perf_counter() - debut) / generations
+            resultats['best_'+nom] = best.fitness
+        resultats['acceleration'] = resultats['tri'] / resultats['index']
+        return resultats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark de la gestion de la population')
+    parser.add_argument('-sp', '--size_population', help='Taille de la population', required=False, default=100000, type=int)
+    parser.add_argument('-e', '--size_echantillon', help="Dimension de l'échantillon", required=False, default=1000, type=int)
+    parser.add_argument('-g', '--generations', help='Nombre de générations mesurées', required=False, default=20, type=int)
+    parser.add_argument('-s', '--seed', help='Graine des générateurs aléatoires', required=False, default=1, type=int)
+    args = parser.parse_args()
+    resultats = BenchPopulationGP.execute(args.size_population, args.size_echantillon, args.generations, args.seed)
+    for key, val in resultats.items():
+        print(key, val)
@@ -0,0 +1,141 @@
+import json
+import shlex
+import argparse
+import platform
+import numpy as np
+
+from algo.algoGP import AlgoGP
+from tools.argParseToolsGP import ArgParseToolsGP
+from tools.configToolsGP import ConfigToolsGP
+from tools.problemesToolsGP import ProblemesToolsGP
+
+"""
+La classe BenchProblemesGP exécute les problèmes de référence (cf ProblemesToolsGP) avec des graines fixes
+et dresse un tableau de la qualité des solutions et de la vitesse de l'algorithme :
+	taux_succes            : part des exécutions ayant atteint le seuil de fitness (-sf).
+	temps_seuil            : durée médiane (secondes) des exécutions réussies pour atteindre le seuil.
+	evaluations_seuil      : nombre médian d'évaluations des exécutions réussies pour atteindre le seuil.
+	evaluations_seconde    : évaluations de fitness par seconde, sur toutes les exécutions du problème.
+	fitness_mediane        : fitness finale médiane.
+
+Une optimisation du moteur se juge ainsi à la fois sur la vitesse et sur la qualité des solutions : les
+options à comparer sont passées telles quelles à l'algorithme (-options), avec les mêmes graines.
+
+Utilisation
+	python -m bench.benchProblemesGP -problemes "koza-*,nguyen-*" -seeds 10 -sp 500 -e 150 -nbrun 100 -out data/scores.json
+	python -m bench.benchProblemesGP -problemes "keijzer-*" -seeds 10 -options="-echelle -selection tournoi"
+"""
+
+class BenchProblemesGP():
+
+    def cree_algo(nom, seed, options):
+        """
+        Crée un algorithme sur le jeu d'apprentissage d'un problème.
+        Args:
+            nom (str): Nom du problème.
+            seed (int): Graine des générateurs aléatoires.
+            options (list): Options supplémentaires de la ligne de commande (cf ArgParseToolsGP).
+        Returns:
+            AlgoGP: L'algorithme initialisé.
+        """
+        params = ArgParseToolsGP()
+        params.parse_arguments(['-mode', ProblemesToolsGP.probleme(nom)['mode'], '-s', str(seed), '-probleme', nom] + list(options))
+        config = ConfigToolsGP(params)
+        config.formule = ProblemesToolsGP.probleme(nom)['formule']
+        config.terminal_set = ProblemesToolsGP.variables(nom)
+        inputs, outputs = ProblemesToolsGP.echantillonne(nom)
+        algo = AlgoGP()
+        algo.initialise(config, inputs, outputs, None)
+        return algo
+
+    def execute_probleme(nom, graines, options):
+        """
+        Exécute un problème une fois par graine.
+        Returns:
+            list: Un dictionnaire par exécution (graine, succès, fitness, durée, évaluations, formule).
+        """
+        executions = []
+        for seed in graines:
+            algo = BenchProblemesGP.cree_algo(nom, seed, options)
+            algo.execute()
+            best = algo.get_best()
+            executions.append({'seed': seed,
+                               'succes': bool(best.fitness < algo.config.seuil_fitness),
+                               'fitness': float(best.fitness),
+                               'duree': algo.elapsed_time,
+                               'evaluations': algo.nb_evaluations,
+                               'formule': best.formule})
+        return executions
+
+    def score(nom, executions):
+        """
+        Ligne du tableau des scores d'un problème.
+        Returns:
+            dict: Taux de succès, temps et évaluations médians pour atteindre le seuil, évaluations par seconde, fitness médiane.
+        """
+        reussites = [execution for execution in executions if execution['succes']]
+        duree = sum(execution['duree'] for execution in executions)
+        return {'probleme': nom,
+                'executions': len(executions),
+                'taux_succes': len(reussites) / len(executions) if len(executions) > 0 else 0.0,
+                'temps_seuil': float(np.median([execution['duree'] for execution in reussites])) if len(reussites) > 0 else None,
+                'evaluations_seuil': float(np.median([execution['evaluations'] for execution in reussites])) if len(reussites) > 0 else None,
+                'evaluations_seconde': sum(execution['evaluations'] for execution in executions) / duree if duree > 0 else 0.0,
+                'fitness_mediane': float(np.median([execution['fitness'] for execution in executions])) if len(executions) > 0 else None}
+
+    def execute(problemes="*", nb_graines=10, graine=1, options=()):
+        """
+        Exécute les problèmes et dresse le tableau des scores.
+        Args:
+            problemes (str): Motifs des noms des problèmes (cf ProblemesToolsGP.noms).
+            nb_graines (int): Nombre d'exécutions par problème.
+            graine (int): Première graine (graines graine, graine+1, ...).
+            options (list): Options supplémentaires de l'algorithme.
+        Returns:
+            dict: Paramètres, environnement, exécutions par problème et tableau des scores.
+        """
+        graines = list(range(graine, graine + nb_graines))
+        executions = {}
+        tableau = []
+        for nom in ProblemesToolsGP.noms(problemes):
+            executions[nom] = BenchProblemesGP.execute_probleme(nom, graines, options)
+            tableau.append(BenchProblemesGP.score(nom, executions[nom]))
+        return {'parametres': {'problemes': problemes, 'graines': graines, 'options': list(options)},
+                'environnement': {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine()},
+                'executions': executions,
+                'tableau': tableau}
+
+    def affiche(tableau):
+        """
+        Affiche le tableau des scores.
+        """
+        print("%-16s %5s %7s %10s %12s %12s %12s" % ("probleme", "runs", "succes", "temps_seuil", "evals_seuil", "evals/s", "fitness_med"))
+        for ligne in tableau:
+            print("%-16s %5d %7.2f %10s %12s %12.0f %12.4g" % (
+                  ligne['probleme'], ligne['executions'], ligne['taux_succes'],
+                  "-" if ligne['temps_seuil'] is None else "%.3f" % ligne['temps_seuil'],
+                  "-" if ligne['evaluations_seuil'] is None else "%.0f" % ligne['evaluations_seuil'],
+                  ligne['evaluations_seconde'], ligne['fitness_mediane']))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tableau des scores sur les problèmes de référence")
+    parser.add_argument('-problemes', '--problemes', help='Problèmes, motifs séparés par des virgules ("*", "nguyen-*", "koza-1,keijzer-4")', required=False, default="*")
+    parser.add_argument('-seeds', '--nb_graines', help='Nombre d\'exécutions (graines) par problème', required=False, default=10, type=int)
+    parser.add_argument('-s', '--seed', help='Première graine', required=False, default=1, type=int)
+    parser.add_argument('-sp', '--size_population', help='Taille de la population', required=False, default=500, type=int)
+    parser.add_argument('-e', '--size_echantillon', help="Dimension de l'échantillon", required=False, default=150, type=int)
+    parser.add_argument('-nbrun', '--nb_iterations', help="Nombre maximal d'itérations par exécution", required=False, default=100, type=int)
+    parser.add_argument('-sf', '--seuil_fitness', help='Seuil de fitness du succès', required=False, default=0.01, type=float)
+    parser.add_argument('-duree', '--duree_maximum', help='Durée maximale (secondes) par exécution', required=False, default=60, type=int)
+    parser.add_argument('-options', '--options', help='Options supplémentaires de l\'algorithme, entre guillemets après un signe égal (-options=\"-echelle\")', required=False, default="")
+    parser.add_argument('-out', '--outputfile', help='Fichier JSON des résultats', required=False, default="")
+    args = parser.parse_args()
+
+    options = ['-sp', str(args.size_population), '-e', str(args.size_echantillon), '-nbrun', str(args.nb_iterations),
+               '-sf', str(args.seuil_fitness), '-duree', str(args.duree_maximum)] + shlex.split(args.options)
+    resultats = BenchProblemesGP.execute(args.problemes, args.nb_graines, args.seed, options)
+    BenchProblemesGP.affiche(resultats['tableau'])
+    if args.outputfile != "":
+        with open(args.outputfile, 'w') as file:
+            json.dump(resultats, file, indent=2)
@@ -1,252 +1,347 @@
-import sys
-import random
-import os.path
-import numpy as np
-from PyQt5.QtWidgets import QApplication # Module PyQt5 pour gérer les applications GUI.
-
-
-from dlg.dialogueGP import DialogueGP  
-from algo.algoGP import AlgoGP
-from algo.algoThreadGP import AlgoThreadGP
-from algo.chromosomeGP import ChromosomeGP
-from tools.mathsToolsGP import MathsToolsGP
-from tools.argParseToolsGP import ArgParseToolsGP
-from tools.configToolsGP import ConfigToolsGP
-from tools.drawToolsGP import DrawToolsGP
-
-"""
-La classe MainGP est un point d'entrée pour exécuter un algorithme génétique dans divers modes (par exemple, dialogue, exécution avec ou sans affichage, génération de population, etc.). 
-
-Elle contient des méthodes pour :
-	Initialiser et configurer l'algorithme en fonction des paramètres donnés.
-	Lancer l'algorithme en fonction du mode (par exemple, en mode dialogue ou en mode ligne de commande).
-	Afficher les résultats obtenus pendant l'exécution, soit sous forme de texte, soit sous forme graphique.
-	Gérer la population (générer, écrire dans un fichier).
-	Afficher une interface graphique pour interagir avec l'utilisateur.
-	Elle permet ainsi une flexibilité dans l'exécution d'un algorithme génétique, que ce soit en mode batch ou interactif.
-"""
-
-class MainGP():
-    # Définition des modes d'exécution possibles pour l'algorithme
-    MODE_DEFAULT         = "run"
-    MODE_DEUX_DIMENSION  = "2d"
-    MODE_MULTI_DIMENSION = "multi"
-    MODE_DIALOGUE        = "dialogue"
-    MODE_POPULATE        = "populate"
-    MODE_ITERATION       = "iterate"
-    MODE_DRAW            = "draw"
-    MODE_TEST            = "test"
-
-    def __init__(self,params):
-        """
-        Initialise la classe MainGP avec les paramètres donnés.
-
-        Args:
-            params (dict): Dictionnaire des paramètres de l'algorithme (souvent récupéré d'un fichier de configuration).
-        """
-        self.params=params.deepcopy()
-        self.config=ConfigToolsGP(self.params)
-
-        # Si le mode est 'dialogue', affiche l'interface graphique
-        if self.params.mode==self.MODE_DIALOGUE :
-            self.affiche_dialogue()
-        else:
-            self.initialise()
-
-    def run(self):
-        """
-        Lance l'algorithme en fonction du mode spécifié dans les paramètres.
-        """
-        # Si le mode est 'dialogue', on ne fait rien ici (l'interface graphique est déjà lancée).
-        if self.params.mode==self.MODE_DIALOGUE :
-            return
-        if  self.algo == None :
-            return
-        # En fonction du mode, on effectue différentes actions :
-        if self.params.mode==self.MODE_DRAW :
-            self.draw_resultats() # Affiche les résultats graphiques
-        elif self.params.mode==self.MODE_TEST :
-            self.test( )  
-        elif self.params.mode==self.MODE_POPULATE :
-            self.genere_population(self.params.population_file) # Génère et écrit une population
-        else:
-            # Si le mode est différent, on démarre ou exécute l'algorithme
-            if  self.params.bl_thread :
-                self.algo.start() # Lance l'algorithme dans un thread séparé
-            else:
-                self.algo.execute()  # Exécute l'algorithme normalement
-
-    def initialise(self):
-        """
-        Initialise les différents composants nécessaires à l'exécution de l'algorithme.
-        """
-        # Définit l'ensemble des terminaux en fonction du mode (2D ou non)
-        if self.params.mode==self.MODE_DEUX_DIMENSION :
-            self.config.terminal_set = ['x','y']
-        elif self.params.mode == self.MODE_MULTI_DIMENSION:
-            #################################################################################################################################
-            self.config.terminal_set = ["x"+str(k) for k in range(self.params.nombre_coordonees)]
-        else:
-            self.config.terminal_set = ['x']
-
-        self.init_input_output() # Initialise les entrées et sorties pour l'algorithme
-        
-        # Initialise l'algorithme avec ou sans thread
-        if  self.params.bl_thread :
-            self.algo = AlgoThreadGP() # Algorithme en mode thread
-        else:
-            self.algo = AlgoGP() # Algorithme sans thread
-
-        # Initialise l'algorithme avec la configuration, les entrées et les sorties
-        self.algo.initialise(self.config, self.inputs,self.outputs, self)
-
-
-
-    def init_input_output(self):
-        """
-        Initialise les entrées et les sorties en fonction du mode de l'algorithme (2D ou non).
-        """
-        # Si le mode est 2D, on génère une grille de points (x, y) pour les entrées et calcule les sorties correspondantes        
-        if self.params.mode==self.MODE_DEUX_DIMENSION:
-            self.inputs = [[x,y] for x in np.arange(self.params.xmin, self.params.xmax, 0.1) for y in np.arange(self.params.ymin, self.params.ymax, 0.1)]
-            self.outputs = [MathsToolsGP.evaluate_formule(self.config.formule,x=x1,y=y1) for [x1,y1] in self.inputs]
-        elif self.params.mode == self.MODE_MULTI_DIMENSION:###############################################################################################################################################################
-            mot=""
-            for k in range(self.params.nombre_coordonees):
-                exec("X%s = np.linspace(0,10,10)" % (str(k))) ################################################ 10
-                mot += "X0" if k==0 else ", X"+str(k)
-            exec("self.inputs = np.array(np.meshgrid(%s)).T.reshape(-1, self.params.nombre_coordonees)" % (mot))
-            self.outputs = [MathsToolsGP.evaluate_formule(self.config.formule,{"x"+str(k):x[k] for k in range(self.params.nombre_coordonees)}) for x in self.inputs]
-            #######################################################AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-        else:
-            # Si un fichier d'entrée est spécifié, on le lit pour initialiser les entrées et sorties
-            if self.params.inputfile!="" :
-                with open(self.params.inputfile, 'r') as file:
-                    line_list = file.readlines()
-                self.inputs=[]
-                self.outputs=[]
-                for line in line_list:
-                    vals = line.strip().split(';')
-                    self.inputs.append(float(vals[0]))
-                    self.outputs.append(float(vals[1]))
-            else:
-                # Sinon, on génère des points d'entrée entre xmin et xmax et on évalue la formule pour obtenir les sorties
-                self.inputs = [x for x in np.arange(self.config.xmin, self.config.xmax, 0.1)]
-                self.outputs = [MathsToolsGP.evaluate_formule(self.config.formule, x=xval) for xval in self.inputs]
-
-
-
-    def affiche_resultats(self):
-        """
-        Affiche les résultats de l'algorithme : la meilleure formule, la fitness, le nombre de générations, etc.
-        """
-        if  self.algo == None :
-            return
-
-        # Récupère le meilleur individu trouvé par l'algorithme
-        best = self.algo.get_best()
-        elapsed_time=self.algo.elapsed_time
-
-        # Affiche les résultats dans la console
-        print(best.fitness,best.generation, best.formule,elapsed_time)
-
-        # Si un fichier de sortie est spécifié, écrit les résultats dans ce fichier
-        if  self.params.outputfile != "" :
-            self.params.args['generation']=best.generation
-            self.params.args['time_exec']=elapsed_time
-            self.params.args['fitness']=best.fitness
-            self.params.args['newformule']=best.formule
-
-            str_ligne=""
-            if not os.path.isfile(self.params.outputfile):
-                arr_list=self.params.args.keys()
-                str_ligne = ";".join(arr_list)+"\n"
-
-            with open(self.params.outputfile, 'a') as file:
-                arr_list=self.params.args.values()
-                str_ligne += ";".join(str(item) for item in arr_list)
-                file.write(str_ligne+"\n")
-
-        # Si le mode est 2D, affiche la surface 2D des résultats
-        if self.params.mode==self.MODE_DEUX_DIMENSION :
-            X = [x for x in np.arange(self.params.xmin, self.params.xmax, 0.1)]
-            Y = [y for y in np.arange(self.params.ymin, self.params.ymax, 0.1)]
-            DrawToolsGP.draw_surface_2(X,Y,self.params.formule,best.formule)
-
-    def draw_resultats(self):
-        """
-        Dessine les résultats d'un fichier d'entrée contenant des données à afficher graphiquement.
-        """
-        valeurs=[]
-        with open(self.params.draw_file, 'r') as file:
-            head_list = file.readline().split(";");
-            pos_field_x=head_list.index(self.params.draw_field_x)
-            pos_field_y=head_list.index(self.params.draw_field_y)
-            line =file.readline()
-            while line !="":
-                item = line.split(";")
-                valeurs.append([float(item[pos_field_x]),float(item[pos_field_y])])
-                line =file.readline()
-
-        # Trie les valeurs par la première colonne
-        valeurs.sort(reverse=False,key=lambda x:x[0])
-        X = [row[0] for row in valeurs]
-        Y = [row[1] for row in valeurs]
-
-        # Affiche les résultats dans un graphique
-        titre="Affichage de '"+self.params.draw_field_y+"' en fonction de '"+self.params.draw_field_x+"'"
-        DrawToolsGP.draw_resultats(X,Y,self.params.draw_field_x,self.params.draw_field_y,titre)
-
-    def genere_population(self,fichier_population):
-        """
-        Génère une population et l'écrit dans un fichier.
-        
-        Args:
-            fichier_population (str): Chemin vers le fichier pour écrire la population.
-        """
-        self.algo.isRunning=True
-        self.algo.populate_generate() # Génère la population
-        self.algo.populate_write(fichier_population) # Écrit la population dans un fichier
-        #self.algo.populate_read(fichier_population)
-        #self.algo.populate_write(fichier_population+'.2.txt') # Écrit la population dans un fichier
-        self.algo.isRunning=False
-
-    def affiche_dialogue(self):
-        """
-        Affiche l'interface graphique pour le mode 'dialogue'.
-        """
-        app = QApplication(sys.argv)
-        dlg_App = DialogueGP(self.config) # Crée l'interface de dialogue
-        dlg_App.show()
-        dlg_App.resize(600, 650)
-        sys.exit(app.exec_()) # Lance l'interface graphique
-
-    def set_jauge_value(self, str_message, pos_value, max_value):
-        """
-        Affiche la progression d'un processus sous forme de message dans la console.
-        
-        Args:
-            str_message (str): Message à afficher.
-            pos_value (int): Valeur actuelle.
-            max_value (int): Valeur maximale.
-        """
-        if self.params.verbose :
-            print(str_message,":",pos_value,"/",max_value)  
-
-    def affiche_chromosome(self,iteration,chromosome):
-        """
-        Affiche la progression d'un processus sous forme de message dans la console.
-        
-        Args:
-            str_message (str): Message à afficher.
-            iteration (int): Valeur iteration.
-            chromosome (obj): Valeur chromosome.
-        """
-        if self.params.verbose :
-            print("* ",iteration,":",chromosome.fitness)  
-
-    def test(self):
-        self.algo.populate_read("data/populate_2000.txt")
- 
-
- 
+import sys
+import random
+import os.path
+import numpy as np
+from PyQt5.QtWidgets import QApplication # Module PyQt5 pour gérer les applications GUI.
+
+
+from dlg.dialogueGP import DialogueGP  
+from algo.algoGP import AlgoGP
+from algo.algoThreadGP import AlgoThreadGP
+from algo.chromosomeGP import ChromosomeGP
+from algo.datasetGP import DatasetGP
+from tools.mathsToolsGP import MathsToolsGP
+from tools.argParseToolsGP import ArgParseToolsGP
+from tools.configToolsGP import ConfigToolsGP
+from tools.drawToolsGP import DrawToolsGP
+from tools.samplerToolsGP import SamplerToolsGP
+from tools.problemesToolsGP import ProblemesToolsGP
+
+"""
+La classe MainGP est un point d'entrée pour exécuter un algorithme génétique dans divers modes (par exemple, dialogue, exécution avec ou sans affichage, génération de population, etc.). 
+
+Elle contient des méthodes pour :
+	Initialiser et configurer l'algorithme en fonction des paramètres donnés.
+	Lancer l'algorithme en fonction du mode (par exemple, en mode dialogue ou en mode ligne de commande).
+	Afficher les résultats obtenus pendant l'exécution, soit sous forme de texte, soit sous forme graphique.
+	Gérer la population (générer, écrire dans un fichier).
+	Afficher une interface graphique pour interagir avec l'utilisateur.
+	Elle permet ainsi une flexibilité dans l'exécution d'un algorithme génétique, que ce soit en mode batch ou interactif.
+"""
+
+class MainGP():
+    # Définition des modes d'exécution possibles pour l'algorithme
+    MODE_DEFAULT         = "run"
+    MODE_DEUX_DIMENSION  = "2d"
+    MODE_MULTI_DIMENSION = "multi"
+    MODE_DIALOGUE        = "dialogue"
+    MODE_POPULATE        = "populate"
+    MODE_ITERATION       = "iterate"
+    MODE_DRAW            = "draw"
+    MODE_TEST            = "test"
+
+    NB_AFFICHAGES_JAUGE  = 20   # Nombre maximal de messages de progression affichés par processus
+
+    def __init__(self,params):
+        """
+        Initialise la classe MainGP avec les paramètres donnés.
+
+        Args:
+            params (dict): Dictionnaire des paramètres de l'algorithme (souvent récupéré d'un fichier de configuration).
+        """
+        self.params=params.deepcopy()
+        self.config=ConfigToolsGP(self.params)
+
+        # Si le mode est 'dialogue', affiche l'interface graphique
+        if self.params.mode==self.MODE_DIALOGUE :
+            self.affiche_dialogue()
+        else:
+            self.initialise()
+
+    def run(self):
+        """
+        Lance l'algorithme en fonction du mode spécifié dans les paramètres.
+        """
+        # Si le mode est 'dialogue', on ne fait rien ici (l'interface graphique est déjà lancée).
+        if self.params.mode==self.MODE_DIALOGUE :
+            return
+        if  self.algo == None :
+            return
+        # En fonction du mode, on effectue différentes actions :
+        if self.params.mode==self.MODE_DRAW :
+            self.draw_resultats() # Affiche les résultats graphiques
+        elif self.params.mode==self.MODE_TEST :
+            self.test( )  
+        elif self.params.mode==self.MODE_POPULATE :
+            self.genere_population(self.params.population_file) # Génère et écrit une population
+        else:
+            # Si le mode est différent, on démarre ou exécute l'algorithme
+            if  self.params.bl_thread :
+                self.algo.start() # Lance l'algorithme dans un thread séparé
+            else:
+                self.algo.lance()  # Exécute l'algorithme normalement (profilé si demandé)
+
+    def initialise(self):
+        """
+        Initialise les différents composants nécessaires à l'exécution de l'algorithme.
+        """
+        # Définit l'ensemble des terminaux en fonction du mode (2D ou non)
+        if self.params.mode==self.MODE_DEUX_DIMENSION :
+            self.config.terminal_set = ['x','y']
+        elif self.params.mode == self.MODE_MULTI_DIMENSION:
+            self.config.terminal_set = ["x"+str(k) for k in range(self.params.nombre_coordonees)]
+        else:
+            self.config.terminal_set = ['x']
+
+        if self.params.probleme!="":
+            # Problème de référence : formule, variables et jeu d'apprentissage du catalogue (cf ProblemesToolsGP)
+            self.params.formule=self.config.formule=ProblemesToolsGP.probleme(self.params.probleme)['formule']
+            self.config.terminal_set=ProblemesToolsGP.variables(self.params.probleme)
+            self.inputs,self.outputs=ProblemesToolsGP.echantillonne(self.params.probleme)
+        else:
+            self.init_input_output() # Initialise les entrées et sorties pour l'algorithme
+        
+        # Initialise l'algorithme avec ou sans thread
+        if  self.params.bl_thread :
+            self.algo = AlgoThreadGP() # Algorithme en mode thread
+        else:
+            self.algo = AlgoGP() # Algorithme sans thread
+
+        self.config.fichier_profil=self.fichier_profil()
+        self.config.fichier_telemetrie=self.fichier_telemetrie()
+
+        # Initialise l'algorithme avec la configuration, les entrées et les sorties
+        self.algo.initialise(self.config, self.inputs,self.outputs, self)
+
+
+
+    def init_input_output(self):
+        """
+        Initialise les entrées et les sorties en fonction du mode de l'algorithme (2D ou non).
+        """
+        # Si le mode est 2D, on génère une grille de points (x, y) pour les entrées et calcule les sorties correspondantes        
+        if self.params.mode==self.MODE_DEUX_DIMENSION:
+            X,Y = np.meshgrid(np.arange(self.params.xmin, self.params.xmax, 0.1), np.arange(self.params.ymin, self.params.ymax, 0.1), indexing='ij')
+            self.inputs = np.column_stack((X.reshape(-1),Y.reshape(-1)))
+            self.init_outputs()
+        elif self.params.mode == self.MODE_MULTI_DIMENSION:
+            # Échantillonnage des entrées avec un budget de points fixe, quelle que soit la dimension
+            bornes=SamplerToolsGP.lit_bornes(self.config.bornes,self.params.nombre_coordonees,(self.config.xmin,self.config.xmax))
+            self.inputs = SamplerToolsGP.echantillonne(self.config.mode_echantillonnage,bornes,self.config.nb_points,self.config.points_par_axe,self.config.seed)
+            self.init_outputs()
+        else:
+            # Si un fichier d'entrée est spécifié, on le lit pour initialiser les entrées et sorties
+            if self.params.inputfile!="" and (self.params.bl_memmap or self.params.inputfile.endswith(".npy")):
+                # Fichier volumineux : lecture projetée (memmap), bloc par bloc
+                if self.params.inputfile.endswith(".npy"):
+                    self.inputs=DatasetGP.load(self.params.inputfile,self.config.taille_bloc)
+                else:
+                    self.inputs=DatasetGP.open_cache(self.params.inputfile,self.config.taille_bloc)
+                self.outputs=None
+            elif self.params.inputfile!="" :
+                with open(self.params.inputfile, 'r') as file:
+                    line_list = file.readlines()
+                self.inputs=[]
+                self.outputs=[]
+                for line in line_list:
+                    vals = line.strip().split(';')
+                    self.inputs.append(float(vals[0]))
+                    self.outputs.append(float(vals[1]))
+            else:
+                # Sinon, on génère des points d'entrée entre xmin et xmax et on évalue la formule pour obtenir les sorties
+                self.inputs = np.arange(self.config.xmin, self.config.xmax, 0.1)
+                self.init_outputs()
+
+    def init_outputs(self):
+        """
+        Calcule les sorties en évaluant la formule cible sur toutes les entrées à la fois.
+        Les points pour lesquels la formule n'est pas définie sont écartés.
+        """
+        self.outputs,masque = MathsToolsGP.evaluate_formule_vect(self.config.formule,self.inputs,self.config.terminal_set)
+        if not masque.all():
+            print(len(masque)-np.count_nonzero(masque),"point(s) écarté(s) : formule non définie")
+            self.inputs  = self.inputs[masque]
+            self.outputs = self.outputs[masque]
+
+
+    def affiche_resultats(self):
+        """
+        Affiche les résultats de l'algorithme : la meilleure formule, la fitness, le nombre de générations, etc.
+        """
+        if  self.algo == None :
+            return
+
+        # Récupère le meilleur individu trouvé par l'algorithme
+        best = self.algo.get_best()
+        elapsed_time=self.algo.elapsed_time
+
+        # Affiche les résultats dans la console
+        print(best.fitness,best.generation, best.formule,elapsed_time)
+
+        # Si un fichier de sortie est spécifié, écrit les résultats dans ce fichier
+        if  self.params.outputfile != "" :
+            self.params.args['generation']=best.generation
+            self.params.args['time_exec']=elapsed_time
+            self.params.args['fitness']=best.fitness
+            self.params.args['newformule']=best.formule
+            self.params.args['longueur_moyenne']=self.algo.longueur_moyenne()
+            self.params.args['taux_rejet']=self.algo.taux_rejet()
+            self.params.args['nb_evaluations']=self.algo.nb_evaluations
+            self.params.args['nb_evaluations_points']=self.algo.nb_evaluations_points
+            self.params.args['stagnations']=len(self.algo.evenements)
+            if self.config.mode_remplacement==self.config.REMPLACEMENT_PARETO:
+                self.params.args['pareto']="|".join(str(item.fitness)+":"+str(taille)+":"+item.formule for item,taille in self.algo.front_pareto())
+            self.params.args['phases']="|".join(key+":"+str(round(val,6)) for key,val in self.algo.get_phases()['totaux'].items())
+            self.params.args['empreinte_memoire']="|".join(key+":"+str(val) for key,val in self.algo.memoire.resume().items())
+            self.params.args['evenements_stagnation']="|".join(str(iteration)+":"+mode for iteration,mode in self.algo.evenements)
+
+            entete=";".join(self.params.args.keys())
+            fichier=self.fichier_resultats(entete)
+            str_ligne=""
+            if not os.path.isfile(fichier):
+                str_ligne = entete+"\n"
+
+            with open(fichier, 'a') as file:
+                arr_list=self.params.args.values()
+                str_ligne += ";".join(str(item) for item in arr_list)
+                file.write(str_ligne+"\n")
+
+        # Si le mode est 2D, affiche la surface 2D des résultats
+        if self.params.mode==self.MODE_DEUX_DIMENSION :
+            X = [x for x in np.arange(self.params.xmin, self.params.xmax, 0.1)]
+            Y = [y for y in np.arange(self.params.ymin, self.params.ymax, 0.1)]
+            DrawToolsGP.draw_surface_2(X,Y,self.params.formule,best.formule)
+
+    def draw_resultats(self):
+        """
+        Dessine les résultats d'un fichier d'entrée contenant des données à afficher graphiquement.
+        """
+        valeurs=[]
+        with open(self.params.draw_file, 'r') as file:
+            head_list = file.readline().split(";");
+            pos_field_x=head_list.index(self.params.draw_field_x)
+            pos_field_y=head_list.index(self.params.draw_field_y)
+            line =file.readline()
+            while line !="":
+                item = line.split(";")
+                valeurs.append([float(item[pos_field_x]),float(item[pos_field_y])])
+                line =file.readline()
+
+        # Trie les valeurs par la première colonne
+        valeurs.sort(reverse=False,key=lambda x:x[0])
+        X = [row[0] for row in valeurs]
+        Y = [row[1] for row in valeurs]
+
+        # Affiche les résultats dans un graphique
+        titre="Affichage de '"+self.params.draw_field_y+"' en fonction de '"+self.params.draw_field_x+"'"
+        DrawToolsGP.draw_resultats(X,Y,self.params.draw_field_x,self.params.draw_field_y,titre)
+
+    def genere_population(self,fichier_population):
+        """
+        Génère une population et l'écrit dans un fichier.
+        
+        Args:
+            fichier_population (str): Chemin vers le fichier pour écrire la population.
+        """
+        self.algo.isRunning=True
+        self.algo.populate_generate() # Génère la population
+        self.algo.populate_write(fichier_population) # Écrit la population dans un fichier
+        #self.algo.populate_read(fichier_population)
+        #self.algo.populate_write(fichier_population+'.2.txt') # Écrit la population dans un fichier
+        self.algo.isRunning=False
+
+    def fichier_resultats(self,entete):
+        """
+        Fichier de résultats où ajouter une ligne : le fichier de sortie s'il n'existe pas encore ou si son en-tête
+        est identique, sinon le premier fichier <base>_<n><extension> dans ce cas (les colonnes dépendent des options
+        et des versions : une ligne n'est jamais ajoutée sous un en-tête différent).
+        Args:
+            entete (str): En-tête des colonnes de la ligne à écrire.
+        Returns:
+            str: Nom du fichier.
+        """
+        base,extension=os.path.splitext(self.params.outputfile)
+        fichier=self.params.outputfile
+        numero=1
+        while os.path.isfile(fichier):
+            with open(fichier, 'r') as file:
+                if file.readline().rstrip("\n")==entete:
+                    break
+            fichier=base+"_"+str(numero)+extension
+            numero+=1
+        if fichier!=self.params.outputfile:
+            print("En-tête de",self.params.outputfile,"différent : résultats écrits dans",fichier)
+        return fichier
+
+    def fichier_profil(self):
+        """
+        Base des noms des fichiers de profilage : le fichier de sortie sans extension ("profil" à défaut),
+        suffixé en mode iterate par le champ balayé et sa valeur, pour un profil par point de balayage.
+        Returns:
+            str: Base des noms de fichiers.
+        """
+        base=os.path.splitext(self.params.outputfile)[0] if self.params.outputfile!="" else "profil"
+        return base+self.suffixe_iteration()
+
+    def fichier_telemetrie(self):
+        """
+        Fichier de télémétrie : celui des paramètres, suffixé en mode iterate par le champ balayé et sa valeur
+        (avant l'extension), pour une télémétrie par point de balayage.
+        Returns:
+            str: Nom du fichier (vide : pas de télémétrie).
+        """
+        if self.config.fichier_telemetrie=="":
+            return ""
+        base,extension=os.path.splitext(self.config.fichier_telemetrie)
+        return base+self.suffixe_iteration()+extension
+
+    def suffixe_iteration(self):
+        """
+        Suffixe des fichiers propres à un point de balayage du mode iterate : "_<champ>_<valeur>" ("" hors mode iterate).
+        """
+        if self.params.mode==self.MODE_ITERATION and self.params.iter_field!="":
+            return "_"+self.params.iter_field+"_"+str(self.params.args[self.params.iter_field])
+        return ""
+
+    def affiche_dialogue(self):
+        """
+        Affiche l'interface graphique pour le mode 'dialogue'.
+        """
+        app = QApplication(sys.argv)
+        dlg_App = DialogueGP(self.config) # Crée l'interface de dialogue
+        dlg_App.show()
+        dlg_App.resize(600, 650)
+        sys.exit(app.exec_()) # Lance l'interface graphique
+
+    def set_jauge_value(self, str_message, pos_value, max_value):
+        """
+        Affiche la progression d'un processus sous forme de message dans la console,
+        au plus NB_AFFICHAGES_JAUGE fois par processus (et pour la dernière valeur).
+        
+        Args:
+            str_message (str): Message à afficher.
+            pos_value (int): Valeur actuelle.
+            max_value (int): Valeur maximale.
+        """
+        if self.params.verbose :
+            pas=max(1,max_value//self.NB_AFFICHAGES_JAUGE)
+            if pos_value%pas==0 or pos_value==max_value-1:
+                print(str_message,":",pos_value,"/",max_value)  
+
+    def affiche_chromosome(self,iteration,chromosome):
+        """
+        Affiche la progression d'un processus sous forme de message dans la console.
+        
+        Args:
+            str_message (str): Message à afficher.
+            iteration (int): Valeur iteration.
+            chromosome (obj): Valeur chromosome.
+        """
+        if self.params.verbose :
+            print("* ",iteration,":",chromosome.fitness)  
+
+    def test(self):
+        self.algo.populate_read("data/populate_2000.txt")
+ 
+
+ 
@@ -1,84 +1,133 @@
-import argparse
-
-
-
-class  ArgParseToolsGP():
-    """
-    Classe pour la gestion des arguments passés en ligne de commande.
-    Cette classe permet de configurer l'algorithme de programmation génétique via divers paramètres.
-    """
-    def __init__(self):
-        self.args={}  # Dictionnaire pour stocker les arguments analysés.
-
-    def parse_arguments(self):
-        """
-        Méthode pour analyser les arguments passés en ligne de commande et les stocker dans un dictionnaire.
-        """
-        parser = argparse.ArgumentParser(description='Apprentissage de fonction par Genetic Programming',epilog="les paramètres doivent être en minuscule")
-        parser.add_argument('-mode','--mode', help='Mode de traitement', required=False, choices=('run', 'dialogue', '2d','multi','populate','iterate','draw','test'),default="dialogue")
-
-        # Ajout des différents arguments acceptés.
-        parser.add_argument('-nc','--nombre_coordonees', help='Nombre de coordonnées (Inutile en dehors du mode MULTI)',required=False,default=3,type=int)#######################################################
-        parser.add_argument('-sp','--size_population', help='Taille de la population', required=False,default=200,type=int)
-        parser.add_argument('-n','--max_N_valeur', help='Valeur maximale pour les constantes', required=False,default=10,type=int)
-        parser.add_argument('-e','--size_echantillon', help="Dimension de l'échantillon", required=False,default=75,type=int)
-        parser.add_argument('-d','--size_depth', help="Profondeur de l'arbre", required=False,default=5,type=int)
-        parser.add_argument('-nbrun','--nb_iterations', help="Nombre d'itérations", required=False,default=20,type=int)
-        parser.add_argument('-xmin','--xmin', help='Valeur minimum de x', required=False,default=0,type=int)
-        parser.add_argument('-xmax','--xmax', help='Valeur maximum de x', required=False,default=10,type=int)
-        parser.add_argument('-ymin','--ymin', help='Valeur minimum de y', required=False,default=0,type=int)
-        parser.add_argument('-ymax','--ymax', help='Valeur maximum de y', required=False,default=1,type=int)
-        parser.add_argument('-tl','--tolerance_gene_Length', help='Tolerance Longueur génétique', required=False,default=1,type=float)
-        parser.add_argument('-tm','--tolerance_gene_Mutate', help='Tolerance Mutation génétique', required=False,default=0.3,type=float)
-        parser.add_argument('-sf','--seuil_fitness', help='Seuil fitness arret', required=False,default=0.01,type=float)
-        parser.add_argument('-f','--formule', help='Equation de la formule', required=False,default="")
-        parser.add_argument('-s','--seed', help='Graine de la géneration aléatiore ', required=False,default=123456789,type=int)
-        parser.add_argument('-v','--verbose', help='verbose', required=False, action="store_true")
-        parser.add_argument('-duree','--duree_maximum', help="Duree maximum d'execution", required=False,default=60*60*24,type=int)
-
-        parser.add_argument('-t','--bl_thread', help='lance via un thread', required=False, action="store_true")
-        parser.add_argument('-out','--outputfile', help='Fichier de sortie', required=False,default="")
-        parser.add_argument('-in','--inputfile', help="Fichier d'entrée", required=False,default="")
-        parser.add_argument('-pf','--population_file', help="Fichier de populations", required=False,default="")
-
-        parser.add_argument('-iter_field','--iter_field', help='iter_field', required=False,default="")
-        parser.add_argument('-iter_min','--iter_min', help='iter_min', required=False,default=0,type=int)
-        parser.add_argument('-iter_max','--iter_max', help='iter_max', required=False,default=1,type=int)
-        parser.add_argument('-iter_step','--iter_step', help='iter_step', required=False,default=1,type=int)
-
-        parser.add_argument('-draw_file','--draw_file', help='draw_file', required=False,default="")
-        parser.add_argument('-draw_field_x','--draw_field_x', help='draw_field_x', required=False,default="")
-        parser.add_argument('-draw_field_y','--draw_field_y', help='draw_field_y', required=False,default="")
-
-        parser.add_argument('-selection','--selection', help="Mode de sélection", required=False, choices=("best", "worst", "rand"),default="best")
-        parser.add_argument('-mariage','--mariage', help='Mode de mariage', required=False, choices=("best", "extrem", "rand"),default="extrem")
-        parser.add_argument('-croisement','--croisement', help='Mode de croisement', required=False, choices=("swap-middle", "absorp-partielle", "absorp-totale"),default="swap-middle")
-        parser.add_argument('-mutation','--mutation', help='Mode de mutation', required=False, choices=("replace", "swap", "deplace"),default="replace")
-        parser.add_argument('-remplacement','--remplacement', help='Mode de remplacement', required=False, choices=("mixt_best", "child_only", "child_add","mixt_rand"),default="mixt_best")
- 
-
-
-        # Stockage des arguments dans un dictionnaire.
-        self.args = vars(parser.parse_args())
-        self.read_arguments()
-
-    def read_arguments(self):
-        """
-        Méthode pour lire les arguments stockés et les assigner à des attributs de la classe.
-        """
-
-        for key, val in self.args.items():
-            setattr(self, key, val)
-
-    def deepcopy(self):
-        """
-        Crée une copie profonde de l'objet courant.
-        Returns:
-            ArgParseToolsGP: Une nouvelle instance avec les mêmes arguments.
-        """
-        item=ArgParseToolsGP()
-        item.args=self.args.copy()
-        item.read_arguments()
-        return item
-
+import argparse
+
+
+
+class  ArgParseToolsGP():
+    """
+    Classe pour la gestion des arguments passés en ligne de commande.
+    Cette classe permet de configurer l'algorithme de programmation génétique via divers paramètres.
+    """
+    def __init__(self):
+        self.args={}  # Dictionnaire pour stocker les arguments analysés.
+
+    def parse_arguments(self, argv=None):
+        """
+        Méthode pour analyser les arguments passés en ligne de commande et les stocker dans un dictionnaire.
+        Args:
+            argv (list): Arguments à analyser (None : ligne de commande).
+        """
+        parser = argparse.ArgumentParser(description='Apprentissage de fonction par Genetic Programming',epilog="les paramètres doivent être en minuscule")
+        parser.add_argument('-mode','--mode', help='Mode de traitement', required=False, choices=('run', 'dialogue', '2d','multi','populate','iterate','draw','test'),default="dialogue")
+
+        # Ajout des différents arguments acceptés.
+        parser.add_argument('-nc','--nombre_coordonees', help='Nombre de coordonnées (Inutile en dehors du mode MULTI)',required=False,default=3,type=int)
+        parser.add_argument('-sampler','--sampler', help="Échantillonneur des entrées en mode MULTI", required=False, choices=("grid", "uniform", "lhs", "halton"),default="grid")
+        parser.add_argument('-nb_points','--nb_points', help="Budget de points d'entrée en mode MULTI", required=False,default=1000,type=int)
+        parser.add_argument('-bornes','--bornes', help='Bornes par axe en mode MULTI : "min:max,min:max,..." (défaut : xmin:xmax)', required=False,default="")
+        parser.add_argument('-points_axe','--points_par_axe', help='Nombre de points par axe pour la grille : "10,10,5" (défaut : déduit du budget)', required=False,default="")
+        parser.add_argument('-sp','--size_population', help='Taille de la population', required=False,default=200,type=int)
+        parser.add_argument('-n','--max_N_valeur', help='Valeur maximale pour les constantes', required=False,default=10,type=int)
+        parser.add_argument('-e','--size_echantillon', help="Dimension de l'échantillon", required=False,default=75,type=int)
+        parser.add_argument('-d','--size_depth', help="Profondeur de l'arbre", required=False,default=5,type=int)
+        parser.add_argument('-nbrun','--nb_iterations', help="Nombre d'itérations", required=False,default=20,type=int)
+        parser.add_argument('-xmin','--xmin', help='Valeur minimum de x', required=False,default=0,type=int)
+        parser.add_argument('-xmax','--xmax', help='Valeur maximum de x', required=False,default=10,type=int)
+        parser.add_argument('-ymin','--ymin', help='Valeur minimum de y', required=False,default=0,type=int)
+        parser.add_argument('-ymax','--ymax', help='Valeur maximum de y', required=False,default=1,type=int)
+        parser.add_argument('-tl','--tolerance_gene_Length', help='Tolerance Longueur génétique', required=False,default=1,type=float)
+        parser.add_argument('-tm','--tolerance_gene_Mutate', help='Tolerance Mutation génétique', required=False,default=0.3,type=float)
+        parser.add_argument('-sf','--seuil_fitness', help='Seuil fitness arret', required=False,default=0.01,type=float)
+        parser.add_argument('-f','--formule', help='Equation de la formule', required=False,default="")
+        parser.add_argument('-probleme','--probleme', help="Problème de référence (koza-1, nguyen-5, keijzer-4, ... cf ProblemesToolsGP) : formule, variables et jeu d'apprentissage", required=False,default="")
+        parser.add_argument('-s','--seed', help='Graine de la géneration aléatiore ', required=False,default=123456789,type=int)
+        parser.add_argument('-v','--verbose', help='verbose', required=False, action="store_true")
+        parser.add_argument('-telemetrie','--telemetrie', help="Fichier de télémétrie JSON Lines (un enregistrement par génération)", required=False,default="")
+        parser.add_argument('-profile','--profile', help="Profile l'exécution (cProfile ou tracemalloc) ; rapports écrits à côté du fichier de sortie", required=False, choices=("cpu", "alloc"),default="")
+        parser.add_argument('-memoire','--memoire', help="Mesure la mémoire toutes les N générations (0 : désactivé)", required=False,default=0,type=int)
+        parser.add_argument('-memoire_plafond','--memoire_plafond', help="Plafond de mémoire en Mo (0 : aucun)", required=False,default=0,type=float)
+        parser.add_argument('-memoire_action','--memoire_action', help="Action au-delà du plafond de mémoire", required=False, choices=("alerte", "arret"),default="alerte")
+        parser.add_argument('-memoire_allocations','--memoire_allocations', help="Suit les allocations Python (tracemalloc) lors des mesures de la mémoire", required=False, action="store_true")
+        parser.add_argument('-chrono','--chrono', help="Mesure le temps passé dans chaque phase et les compteurs à chaque génération", required=False, action="store_true")
+        parser.add_argument('-duree','--duree_maximum', help="Duree maximum d'execution", required=False,default=60*60*24,type=int)
+        parser.add_argument('-max_evaluations','--max_evaluations', help="Nombre maximal d'évaluations de fitness (0 : pas de limite)", required=False,default=0,type=int)
+        parser.add_argument('-max_evaluations_points','--max_evaluations_points', help="Nombre maximal de points évalués, évaluations x taille du jeu de données (0 : pas de limite)", required=False,default=0,type=int)
+        parser.add_argument('-duree_generation','--duree_generation', help="Durée maximale (secondes) de production des enfants d'une génération (0 : pas de limite)", required=False,default=0,type=float)
+
+        parser.add_argument('-t','--bl_thread', help='lance via un thread', required=False, action="store_true")
+        parser.add_argument('-out','--outputfile', help='Fichier de sortie', required=False,default="")
+        parser.add_argument('-in','--inputfile', help="Fichier d'entrée", required=False,default="")
+        parser.add_argument('-pf','--population_file', help="Fichier de populations (texte, ou binaire si l'extension est .npz)", required=False,default="")
+        parser.add_argument('-pf_limit','--populate_limite', help="Arrête la lecture du fichier de populations à size_population individus valides", required=False, action="store_true")
+        parser.add_argument('-workers','--workers', help="Nombre de workers pour l'évaluation en parallèle", required=False,default=1,type=int)
+        parser.add_argument('-chunk','--taille_bloc', help="Nombre de points évalués par bloc pour la fitness", required=False,default=65536,type=int)
+        parser.add_argument('-historique','--historique', help="Nombre maximal d'entrées de l'historique des meilleurs individus, sous-échantillonné au-delà (0 : illimité)", required=False,default=10000,type=int)
+        parser.add_argument('-checkpoint','--checkpoint', help="Fichier des points de reprise", required=False,default="")
+        parser.add_argument('-checkpoint_every','--checkpoint_every', help="Point de reprise toutes les N itérations (0 : désactivé)", required=False,default=0,type=int)
+        parser.add_argument('-checkpoint_seconds','--checkpoint_seconds', help="Point de reprise toutes les T secondes (0 : désactivé)", required=False,default=0,type=float)
+        parser.add_argument('-resume','--resume', help="Reprend l'exécution à partir d'un point de reprise", required=False,default="")
+        parser.add_argument('-memmap','--bl_memmap', help="Projette le fichier d'entrée en mémoire (memmap) au lieu de le charger", required=False, action="store_true")
+
+        parser.add_argument('-iter_field','--iter_field', help='iter_field', required=False,default="")
+        parser.add_argument('-iter_min','--iter_min', help='iter_min', required=False,default=0,type=int)
+        parser.add_argument('-iter_max','--iter_max', help='iter_max', required=False,default=1,type=int)
+        parser.add_argument('-iter_step','--iter_step', help='iter_step', required=False,default=1,type=int)
+
+        parser.add_argument('-draw_file','--draw_file', help='draw_file', required=False,default="")
+        parser.add_argument('-draw_field_x','--draw_field_x', help='draw_field_x', required=False,default="")
+        parser.add_argument('-draw_field_y','--draw_field_y', help='draw_field_y', required=False,default="")
+
+        parser.add_argument('-moteur','--moteur', help="Moteur d'évolution : générations complètes ou remplacement en continu (steady-state)", required=False, choices=("generationnel", "stationnaire"),default="generationnel")
+        parser.add_argument('-selection','--selection', help="Mode de sélection", required=False, choices=("best", "worst", "rand", "tournoi", "lexicase"),default="best")
+        parser.add_argument('-tournoi','--tournoi', help="Nombre d'individus par tournoi (sélection tournoi)", required=False,default=7,type=int)
+        parser.add_argument('-lexicase_cas','--lexicase_cas', help="Nombre de cas du jeu de données utilisés par la sélection lexicase (0 : tous)", required=False,default=100,type=int)
+        parser.add_argument('-init','--init', help="Initialisation de la population : full ou grow au hasard (rand), ou ramped half-and-half sans doublons (ramped)", required=False, choices=("rand", "ramped"),default="rand")
+        parser.add_argument('-init_profondeur_min','--init_profondeur_min', help="Profondeur minimale des arbres initiaux (ramped half-and-half)", required=False,default=2,type=int)
+        parser.add_argument('-max_genes','--max_genes', help="Nombre maximal de gènes d'un enfant (0 : pas de limite)", required=False,default=0,type=int)
+        parser.add_argument('-croisement_profondeur','--croisement_profondeur', help="Choisit des points de croisement compatibles avec la profondeur et la longueur maximales", required=False, action="store_true")
+        parser.add_argument('-constantes','--constantes', help="Nombre de meilleurs individus dont les constantes sont optimisées à chaque itération (0 : désactivé)", required=False,default=0,type=int)
+        parser.add_argument('-constantes_points','--constantes_points', help="Nombre de points utilisés pour optimiser les constantes (0 : tous)", required=False,default=256,type=int)
+        parser.add_argument('-constantes_iterations','--constantes_iterations', help="Nombre maximal d'itérations de Levenberg-Marquardt par individu", required=False,default=20,type=int)
+        parser.add_argument('-constantes_duree','--constantes_duree', help="Budget de temps (secondes) de l'optimisation des constantes par itération", required=False,default=1.0,type=float)
+        parser.add_argument('-parcimonie','--parcimonie', help="Pression de parcimonie en sélection et remplacement", required=False, choices=("aucune", "lexico", "lineaire"),default="aucune")
+        parser.add_argument('-coef_parcimonie','--coef_parcimonie', help="Pénalité par gène (parcimonie linéaire)", required=False,default=0.001,type=float)
+        parser.add_argument('-echelle','--echelle', help="Calcule la fitness après mise à l'échelle linéaire a + b*f(x) de la sortie (a et b optimaux)", required=False, action="store_true")
+        parser.add_argument('-stagnation','--stagnation', help="Nombre d'itérations sans amélioration avant de déclarer une stagnation (0 : désactivé)", required=False,default=0,type=int)
+        parser.add_argument('-stagnation_epsilon','--stagnation_epsilon', help="Amélioration minimale de la meilleure fitness pour relancer la fenêtre de stagnation", required=False,default=0.0,type=float)
+        parser.add_argument('-stagnation_mode','--stagnation_mode', help="Stratégie en cas de stagnation", required=False, choices=("reinjection", "mutation", "redemarrage"),default="reinjection")
+        parser.add_argument('-reinjection','--reinjection', help="Part de la population remplacée par de nouveaux individus (stratégie reinjection)", required=False,default=0.5,type=float)
+        parser.add_argument('-stagnation_mutation','--stagnation_mutation', help="Tolérance de mutation pendant une stagnation (stratégie mutation)", required=False,default=0.1,type=float)
+        parser.add_argument('-temple','--temple', help="Nombre de meilleurs individus conservés lors d'un redémarrage (stratégie redemarrage)", required=False,default=10,type=int)
+        parser.add_argument('-mariage','--mariage', help='Mode de mariage', required=False, choices=("best", "extrem", "rand"),default="extrem")
+        parser.add_argument('-croisement','--croisement', help='Mode de croisement', required=False, choices=("swap-middle", "absorp-partielle", "absorp-totale", "adaptatif"),default="swap-middle")
+        parser.add_argument('-mutation','--mutation', help='Mode de mutation', required=False, choices=("replace", "swap", "deplace", "adaptatif"),default="replace")
+        parser.add_argument('-adaptation','--adaptation', help="Poids d'une nouvelle récompense dans la qualité d'un opérateur (modes adaptatifs)", required=False,default=0.1,type=float)
+        parser.add_argument('-adaptation_min','--adaptation_min', help="Probabilité minimale de choisir chaque opérateur (modes adaptatifs)", required=False,default=0.05,type=float)
+        parser.add_argument('-remplacement','--remplacement', help='Mode de remplacement', required=False, choices=("mixt_best", "child_only", "child_add","mixt_rand","pareto"),default="mixt_best")
+        parser.add_argument('-pareto_objectif','--pareto_objectif', help="Second objectif du remplacement pareto : longueur du génome ou coût d'évaluation estimé", required=False, choices=("longueur", "cout"),default="longueur")
+ 
+
+
+        # Stockage des arguments dans un dictionnaire.
+        self.args = vars(parser.parse_args(argv))
+        self.read_arguments()
+
+    def read_arguments(self):
+        """
+        Méthode pour lire les arguments stockés et les assigner à des attributs de la classe.
+        """
+
+        for key, val in self.args.items():
+            setattr(self, key, val)
+
+    def deepcopy(self):
+        """
+        Crée une copie profonde de l'objet courant.
+        Returns:
+            ArgParseToolsGP: Une nouvelle instance avec les mêmes arguments.
+        """
+        item=ArgParseToolsGP()
+        item.args=self.args.copy()
+        item.read_arguments()
+        return item
+
 		
\ No newline at end of file
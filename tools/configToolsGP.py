@@ -1,152 +1,271 @@
-import logging
-import math
-import operator
-import numpy as np
-
-class ConfigToolsGP():
-
-    SELECTION_BEST                = "best"
-    SELECTION_WORST               = "worst"
-    SELECTION_RAND                = "rand"
-
-    MARIAGE_BEST                  = "best"
-    MARIAGE_EXTREME               = "extrem"
-    MARIAGE_RAND                  = "rand"
-
-    CROISEMENT_MIDDLE               = "swap-middle"
-    CROISEMENT_ABSORPTION_PARTIELLE = "absorp-partielle"
-    CROISEMENT_ABSORPTION_TOTALE    = "absorp-totale"
-
-    MUTATION_REPLACE                = "replace"
-    MUTATION_SWAP                   = "swap"
-    MUTATION_DEPLACE                = "deplace"
-
-    REMPLACEMENT_MIXT_BEST          = "mixt_best"
-    REMPLACEMENT_CHILD_ONLY         = "child_only"
-    REMPLACEMENT_CHILD_ADD          = "child_add"
-    REMPLACEMENT_MIXT_RAND          = "mixt_rand"
-
-
- 
-    """
-    Classe de configuration pour l'algorithme de programmation génétique.
-    Elle initialise les paramètres par défaut et permet leur modification via une instance d'ArgParseToolsGP.
-    """
-    def __init__(self,params):
-        """
-        Initialise l'instance de configuration avec des valeurs par défaut.
-        Args:
-            params (ArgParseToolsGP): Instance contenant les paramètres personnalisés.
-        """
-        self.funct_binaire = ['+', '-', '*', '**', '/'] # Fonctions binaires disponibles.
-        self.funct_unaire  = ['sin','cos','ln','sqrt','tan','ctg','e','tanh','abs'] # Fonctions unaires disponibles.
-        self.functions     = {'+':operator.add,
-                              '-':operator.sub,
-                              '*':operator.mul,
-                              '**':np.power,
-                              '/':np.divide,
-                              'sin':np.sin,
-                              'cos':np.cos,
-                              'ln':np.log,
-                              'sqrt':np.sqrt,
-                              'tan':np.tan,
-                              'ctg':lambda x:1/np.tan(x),
-                              'e':np.exp,
-                              'tanh':np.tanh,
-                              'abs':np.abs
-                              }
-        self.terminal_set  = ['x']
-
-        self.modes_selection    = ( ( "Sélectionner l'échantillon avec les meilleurs ",self.SELECTION_BEST),
-                                    ( "Sélectionner l'échantillon  avec les pires ",self.SELECTION_WORST),
-                                    ( "Sélectionner l'échantillon  de façon aléatoire",self.SELECTION_RAND)
-                                   )
-        self.modes_mariage      = ( ("Mariage des meilleures successif",self.MARIAGE_BEST),
-                                      ("Mariage des meilleures avec les pires",self.MARIAGE_EXTREME),
-                                      ("Mariage aléatoire",self.MARIAGE_RAND)
-                                   )
-        self.modes_croisement   = ( ("Croisement avec échange d'un bloc génétique",self.CROISEMENT_MIDDLE),
-                                    ("Croisement avec absorption partielle",self.CROISEMENT_ABSORPTION_PARTIELLE),
-                                    ("Croisement avec absorption totale ",self.CROISEMENT_ABSORPTION_TOTALE)
-                                  )
-        self.modes_remplacement = ( ( "Mélanger parents et enfants pour choisir les meilleurs",self.REMPLACEMENT_MIXT_BEST),
-                                    ( "Les enfants seulement",self.REMPLACEMENT_CHILD_ONLY),
-                                    ( "Ajouter les enfants aux parents",self.REMPLACEMENT_CHILD_ADD),
-                                    ( "Mélanger parents et enfants pour choisir de façon aléatoire",self.REMPLACEMENT_MIXT_RAND)
-                                   )
-        self.modes_mutation     = ( ( "Remplacer un gène ",self.MUTATION_REPLACE),
-                                    ( "Intervertir deux gènes",self.MUTATION_SWAP),
-                                    ( "Déplacer un gène ",self.MUTATION_DEPLACE)
-                                  )
-        self.config=False
-        self.formule="x**2+x*sin(x)"     # Formule initiale.
-        self.xmin=0                      # Valeur minimale de x.
-        self.xmax=10                     # Valeur maximale de x.
-       
-        self.seuil_fitness=0.01          # Seuil de fitness pour arrêter l'algorithme.
-        self.tolerance_gene_Length=0.5   # Tolérance pour la longueur génétique.
-        self.tolerance_gene_Mutate=0.5   # Tolérance pour la mutation génétique.
-
-        self.mode_selection   =self.SELECTION_BEST          # mode de sélection.
-        self.mode_mariage     =self.MARIAGE_EXTREME         # mode de mariage.
-        self.mode_croisement  =self.CROISEMENT_MIDDLE       # mode de croisement.
-        self.mode_remplacement=self.REMPLACEMENT_MIXT_BEST  # mode de remplacement.
-        self.mode_mutation    =self.MUTATION_REPLACE        # mode de mutation.
-
-        self.size_echantillon = 100      # Taille de l'échantillon.
-        self.max_depth = 5               # Profondeur maximale de l'arbre génétique.
-        self.size_population = 1000      # Taille de la population.
-        self.max_iterations=1000         # Nombre maximal d'itérations.
-        self.max_N_valeur=10             # Valeur maximale des constantes.
-        self.duree_maximum=60*60*24      # Durée maximale d'exécution (en secondes).
-        self.verbose=False               # Mode verbeux désactivé par défaut.
-        self.dlg2d=False                 # Mode 2d désactivé par défaut.
-        self.seed=123456789              # Graine pour l'initialisation aléatoire.
-        self.fichier_populate=""         # Fichier de population (vide par défaut).
-        if params!=None :
-            self.initialise(params)
-
-    def initialise(self,params):
-        """
-        Initialise les paramètres avec les valeurs fournies par une instance d'ArgParseToolsGP.
-        Args:
-            params (ArgParseToolsGP): Instance contenant les paramètres personnalisés.
-        """
-
-        self.size_population=params.size_population
-        self.max_depth=params.size_depth
-        self.size_echantillon=params.size_echantillon 
-        self.max_N_valeur=params.max_N_valeur
-        self.max_iterations=params.nb_iterations
-        self.duree_maximum=params.duree_maximum
-        self.xmin=params.xmin
-        self.xmax=params.xmax
-
-
-
-        self.mode_mariage=params.mariage
-        self.mode_croisement=params.croisement
-        self.mode_selection=params.selection
-        self.mode_remplacement=params.remplacement
-        self.mode_mutation=params.mutation
-
-        self.seed=params.seed
-        if params.formule!="" :
-            self.formule=params.formule
-        self.verbose=params.verbose
-        self.bl_thread=params.bl_thread
-
-        self.seuil_fitness=params.seuil_fitness
-        self.tolerance_gene_Length=params.tolerance_gene_Length
-        self.tolerance_gene_Mutate=params.tolerance_gene_Mutate
-
-        self.fichier_populate=params.population_file
-
-        # Manage logging
-        logging.basicConfig(format='%(levelname)s: %(message)s', level=logging.DEBUG if self.verbose else logging.INFO)
-
-    def info(self,message):
-        logging.info(message)
-
-    def error(self,message):
-        logging.error(message)
+import logging
+import math
+import operator
+import numpy as np
+
+class ConfigToolsGP():
+
+    SELECTION_BEST                = "best"
+    SELECTION_WORST               = "worst"
+    SELECTION_RAND                = "rand"
+    SELECTION_TOURNOI             = "tournoi"
+    SELECTION_LEXICASE            = "lexicase"
+
+    MARIAGE_BEST                  = "best"
+    MARIAGE_EXTREME               = "extrem"
+    MARIAGE_RAND                  = "rand"
+
+    CROISEMENT_MIDDLE               = "swap-middle"
+    CROISEMENT_ABSORPTION_PARTIELLE = "absorp-partielle"
+    CROISEMENT_ABSORPTION_TOTALE    = "absorp-totale"
+    CROISEMENT_ADAPTATIF            = "adaptatif"
+
+    MUTATION_REPLACE                = "replace"
+    MUTATION_SWAP                   = "swap"
+    MUTATION_DEPLACE                = "deplace"
+    MUTATION_ADAPTATIVE             = "adaptatif"
+
+    REMPLACEMENT_MIXT_BEST          = "mixt_best"
+    REMPLACEMENT_CHILD_ONLY         = "child_only"
+    REMPLACEMENT_CHILD_ADD          = "child_add"
+    REMPLACEMENT_MIXT_RAND          = "mixt_rand"
+    REMPLACEMENT_PARETO             = "pareto"
+
+    MOTEUR_GENERATIONNEL            = "generationnel"
+    MOTEUR_STATIONNAIRE             = "stationnaire"
+
+    INITIALISATION_RAND             = "rand"
+    INITIALISATION_RAMPED           = "ramped"
+
+    OBJECTIF_LONGUEUR               = "longueur"
+    OBJECTIF_COUT                   = "cout"
+
+    PARCIMONIE_AUCUNE               = "aucune"
+    PARCIMONIE_LEXICO               = "lexico"
+    PARCIMONIE_LINEAIRE             = "lineaire"
+
+    STAGNATION_REINJECTION          = "reinjection"
+    STAGNATION_MUTATION             = "mutation"
+    STAGNATION_REDEMARRAGE          = "redemarrage"
+
+
+ 
+    """
+    Classe de configuration pour l'algorithme de programmation génétique.
+    Elle initialise les paramètres par défaut et permet leur modification via une instance d'ArgParseToolsGP.
+    """
+    def __init__(self,params):
+        """
+        Initialise l'instance de configuration avec des valeurs par défaut.
+        Args:
+            params (ArgParseToolsGP): Instance contenant les paramètres personnalisés.
+        """
+        self.funct_binaire = ['+', '-', '*', '**', '/'] # Fonctions binaires disponibles.
+        self.funct_unaire  = ['sin','cos','ln','sqrt','tan','ctg','e','tanh','abs'] # Fonctions unaires disponibles.
+        self.functions     = {'+':operator.add,
+                              '-':operator.sub,
+                              '*':operator.mul,
+                              '**':np.power,
+                              '/':np.divide,
+                              'sin':np.sin,
+                              'cos':np.cos,
+                              'ln':np.log,
+                              'sqrt':np.sqrt,
+                              'tan':np.tan,
+                              'ctg':lambda x:1/np.tan(x),
+                              'e':np.exp,
+                              'tanh':np.tanh,
+                              'abs':np.abs
+                              }
+        self.terminal_set  = ['x']
+
+        self.modes_selection    = ( ( "Sélectionner l'échantillon avec les meilleurs ",self.SELECTION_BEST),
+                                    ( "Sélectionner l'échantillon  avec les pires ",self.SELECTION_WORST),
+                                    ( "Sélectionner l'échantillon  de façon aléatoire",self.SELECTION_RAND),
+                                    ( "Sélectionner l'échantillon par tournois",self.SELECTION_TOURNOI),
+                                    ( "Sélectionner l'échantillon par epsilon-lexicase",self.SELECTION_LEXICASE)
+                                   )
+        self.modes_mariage      = ( ("Mariage des meilleures successif",self.MARIAGE_BEST),
+                                      ("Mariage des meilleures avec les pires",self.MARIAGE_EXTREME),
+                                      ("Mariage aléatoire",self.MARIAGE_RAND)
+                                   )
+        self.modes_croisement   = ( ("Croisement avec échange d'un bloc génétique",self.CROISEMENT_MIDDLE),
+                                    ("Croisement avec absorption partielle",self.CROISEMENT_ABSORPTION_PARTIELLE),
+                                    ("Croisement avec absorption totale ",self.CROISEMENT_ABSORPTION_TOTALE),
+                                    ("Choix adaptatif du croisement selon les réussites",self.CROISEMENT_ADAPTATIF)
+                                  )
+        self.modes_remplacement = ( ( "Mélanger parents et enfants pour choisir les meilleurs",self.REMPLACEMENT_MIXT_BEST),
+                                    ( "Les enfants seulement",self.REMPLACEMENT_CHILD_ONLY),
+                                    ( "Ajouter les enfants aux parents",self.REMPLACEMENT_CHILD_ADD),
+                                    ( "Mélanger parents et enfants pour choisir de façon aléatoire",self.REMPLACEMENT_MIXT_RAND),
+                                    ( "Mélanger parents et enfants pour choisir les fronts de Pareto (erreur, taille)",self.REMPLACEMENT_PARETO)
+                                   )
+        self.modes_mutation     = ( ( "Remplacer un gène ",self.MUTATION_REPLACE),
+                                    ( "Intervertir deux gènes",self.MUTATION_SWAP),
+                                    ( "Déplacer un gène ",self.MUTATION_DEPLACE),
+                                    ( "Choix adaptatif de la mutation selon les réussites",self.MUTATION_ADAPTATIVE)
+                                  )
+        self.config=False
+        self.formule="x**2+x*sin(x)"     # Formule initiale.
+        self.xmin=0                      # Valeur minimale de x.
+        self.xmax=10                     # Valeur maximale de x.
+       
+        self.seuil_fitness=0.01          # Seuil de fitness pour arrêter l'algorithme.
+        self.tolerance_gene_Length=0.5   # Tolérance pour la longueur génétique.
+        self.tolerance_gene_Mutate=0.5   # Tolérance pour la mutation génétique.
+
+        self.moteur           =self.MOTEUR_GENERATIONNEL    # moteur d'évolution : générations complètes ou remplacement en continu.
+        self.mode_selection   =self.SELECTION_BEST          # mode de sélection.
+        self.mode_mariage     =self.MARIAGE_EXTREME         # mode de mariage.
+        self.mode_croisement  =self.CROISEMENT_MIDDLE       # mode de croisement.
+        self.mode_remplacement=self.REMPLACEMENT_MIXT_BEST  # mode de remplacement.
+        self.mode_mutation    =self.MUTATION_REPLACE        # mode de mutation.
+
+        self.size_echantillon = 100      # Taille de l'échantillon.
+        self.taille_tournoi = 7          # Nombre d'individus par tournoi (sélection par tournois).
+        self.nb_cas_lexicase = 100       # Nombre de cas du jeu de données utilisés par la sélection lexicase.
+        self.max_depth = 5               # Profondeur maximale de l'arbre génétique.
+        self.mode_initialisation=self.INITIALISATION_RAND # Initialisation de la population : full ou grow au hasard, ou ramped half-and-half.
+        self.profondeur_min_initialisation=2 # Profondeur minimale des arbres initiaux (ramped half-and-half).
+        self.max_genes = 0               # Nombre maximal de gènes d'un enfant (0 : pas de limite).
+        self.croisement_profondeur=False # Choix des points de croisement compatibles avec max_depth et max_genes.
+        self.nb_elites_constantes=0      # Nombre de meilleurs individus dont les constantes sont optimisées à chaque itération (0 : désactivé).
+        self.nb_points_constantes=256    # Nombre de points du sous-ensemble utilisé pour optimiser les constantes (0 : tous).
+        self.iterations_constantes=20    # Nombre maximal d'itérations de Levenberg-Marquardt par individu.
+        self.duree_constantes=1.0        # Budget de temps (secondes) de l'optimisation des constantes par itération.
+        self.mode_parcimonie = self.PARCIMONIE_AUCUNE # Pression de parcimonie en sélection et remplacement.
+        self.coef_parcimonie = 0.001     # Pénalité par gène (parcimonie linéaire).
+        self.objectif_taille=self.OBJECTIF_LONGUEUR # Second objectif du remplacement pareto : longueur du génome ou coût d'évaluation.
+        self.echelle_lineaire=False      # Fitness calculée après mise à l'échelle linéaire a + b*f(x) de la sortie.
+        self.taux_apprentissage=0.1      # Poids d'une nouvelle récompense dans la qualité d'un opérateur (modes adaptatifs).
+        self.probabilite_minimum=0.05    # Probabilité minimale de choisir chaque opérateur (modes adaptatifs).
+        self.stagnation_fenetre=0        # Nombre d'itérations sans amélioration avant de déclarer une stagnation (0 : désactivé).
+        self.stagnation_epsilon=0.0      # Amélioration minimale de la meilleure fitness pour relancer la fenêtre de stagnation.
+        self.mode_stagnation=self.STAGNATION_REINJECTION # Stratégie appliquée en cas de stagnation.
+        self.taux_reinjection=0.5        # Part de la population (les moins bons) remplacée par de nouveaux individus (réinjection).
+        self.tolerance_stagnation=0.1    # Tolérance de mutation pendant une stagnation (mutation plus fréquente que tolerance_gene_Mutate).
+        self.taille_temple=10            # Nombre de meilleurs individus conservés lors d'un redémarrage complet (temple de la renommée).
+        self.size_population = 1000      # Taille de la population.
+        self.max_iterations=1000         # Nombre maximal d'itérations.
+        self.max_N_valeur=10             # Valeur maximale des constantes.
+        self.duree_maximum=60*60*24      # Durée maximale d'exécution (en secondes).
+        self.max_evaluations=0           # Nombre maximal d'évaluations de fitness (0 : pas de limite).
+        self.max_evaluations_points=0    # Nombre maximal de points évalués, évaluations x taille du jeu de données (0 : pas de limite).
+        self.duree_generation=0          # Durée maximale (en secondes) de production des enfants d'une génération (0 : pas de limite).
+        self.verbose=False               # Mode verbeux désactivé par défaut.
+        self.chronometrage=False         # Mesure du temps par phase et des compteurs à chaque génération (cf ChronometreGP).
+        self.fichier_telemetrie=""       # Fichier de télémétrie JSON Lines, un enregistrement par génération (vide : désactivé).
+        self.mode_profil=""              # Profilage de l'exécution : cpu, alloc (vide : désactivé, cf ProfilToolsGP).
+        self.fichier_profil="profil"     # Base des noms des fichiers de profilage.
+        self.memoire_periode=0           # Période (en générations) des mesures de la mémoire (0 : désactivé, cf MemoireGP).
+        self.memoire_plafond=0           # Plafond de mémoire en Mo (0 : aucun).
+        self.memoire_action="alerte"     # Action au-delà du plafond de mémoire : alerte ou arret.
+        self.memoire_allocations=False   # Suivi des allocations Python (tracemalloc) lors des mesures de la mémoire.
+        self.dlg2d=False                 # Mode 2d désactivé par défaut.
+        self.seed=123456789              # Graine pour l'initialisation aléatoire.
+        self.fichier_populate=""         # Fichier de population (vide par défaut).
+        self.taille_bloc=65536           # Nombre de points évalués par bloc lors du calcul de la fitness.
+        self.checkpoint_fichier=""       # Fichier des points de reprise (vide : pas de point de reprise).
+        self.checkpoint_iterations=0     # Période des points de reprise en itérations (0 : désactivé).
+        self.checkpoint_duree=0          # Période des points de reprise en secondes (0 : désactivé).
+        self.fichier_reprise=""          # Point de reprise à partir duquel reprendre l'exécution.
+        self.mode_echantillonnage="grid" # Échantillonneur des entrées en plusieurs dimensions (cf SamplerToolsGP).
+        self.nb_points=1000              # Budget de points d'entrée en plusieurs dimensions.
+        self.bornes=""                   # Bornes par axe "min:max,min:max,..." (vide : [xmin, xmax] sur chaque axe).
+        self.points_par_axe=[]           # Nombre de points par axe pour la grille (vide : déduit du budget).
+        self.nb_workers=1                # Nombre de workers (threads) pour l'évaluation en parallèle.
+        self.taille_lot_lecture=1000     # Nombre de lignes par lot lors de la lecture d'un fichier de population.
+        self.populate_limite=False       # Arrête la lecture du fichier de population à size_population individus valides.
+        self.historique_taille=10000     # Nombre maximal d'entrées de l'historique des meilleurs individus (0 : illimité).
+        if params!=None :
+            self.initialise(params)
+
+    def initialise(self,params):
+        """
+        Initialise les paramètres avec les valeurs fournies par une instance d'ArgParseToolsGP.
+        Args:
+            params (ArgParseToolsGP): Instance contenant les paramètres personnalisés.
+        """
+
+        self.size_population=params.size_population
+        self.max_depth=params.size_depth
+        self.max_genes=params.max_genes
+        self.croisement_profondeur=params.croisement_profondeur
+        self.nb_elites_constantes=params.constantes
+        self.nb_points_constantes=params.constantes_points
+        self.iterations_constantes=params.constantes_iterations
+        self.duree_constantes=params.constantes_duree
+        self.mode_parcimonie=params.parcimonie
+        self.coef_parcimonie=params.coef_parcimonie
+        self.echelle_lineaire=params.echelle
+        self.objectif_taille=params.pareto_objectif
+        self.mode_initialisation=params.init
+        self.profondeur_min_initialisation=params.init_profondeur_min
+        self.taux_apprentissage=params.adaptation
+        self.probabilite_minimum=params.adaptation_min
+        self.stagnation_fenetre=params.stagnation
+        self.stagnation_epsilon=params.stagnation_epsilon
+        self.mode_stagnation=params.stagnation_mode
+        self.taux_reinjection=params.reinjection
+        self.tolerance_stagnation=params.stagnation_mutation
+        self.taille_temple=params.temple
+        self.size_echantillon=params.size_echantillon 
+        self.taille_tournoi=params.tournoi
+        self.nb_cas_lexicase=params.lexicase_cas
+        self.max_N_valeur=params.max_N_valeur
+        self.max_iterations=params.nb_iterations
+        self.duree_maximum=params.duree_maximum
+        self.max_evaluations=params.max_evaluations
+        self.max_evaluations_points=params.max_evaluations_points
+        self.duree_generation=params.duree_generation
+        self.xmin=params.xmin
+        self.xmax=params.xmax
+
+
+
+        self.moteur=params.moteur
+        self.mode_mariage=params.mariage
+        self.mode_croisement=params.croisement
+        self.mode_selection=params.selection
+        self.mode_remplacement=params.remplacement
+        self.mode_mutation=params.mutation
+
+        self.seed=params.seed
+        if params.formule!="" :
+            self.formule=params.formule
+        self.verbose=params.verbose
+        self.chronometrage=params.chrono
+        self.fichier_telemetrie=params.telemetrie
+        self.mode_profil=params.profile
+        self.memoire_periode=params.memoire
+        self.memoire_plafond=params.memoire_plafond
+        self.memoire_action=params.memoire_action
+        self.memoire_allocations=params.memoire_allocations
+        self.bl_thread=params.bl_thread
+
+        self.seuil_fitness=params.seuil_fitness
+        self.tolerance_gene_Length=params.tolerance_gene_Length
+        self.tolerance_gene_Mutate=params.tolerance_gene_Mutate
+
+        self.fichier_populate=params.population_file
+        self.taille_bloc=params.taille_bloc
+        self.checkpoint_fichier=params.checkpoint
+        self.checkpoint_iterations=params.checkpoint_every
+        self.checkpoint_duree=params.checkpoint_seconds
+        self.fichier_reprise=params.resume
+        self.mode_echantillonnage=params.sampler
+        self.nb_points=params.nb_points
+        self.bornes=params.bornes
+        self.points_par_axe=[int(val) for val in params.points_par_axe.split(',') if val.strip()!=""]
+        self.nb_workers=params.workers
+        self.populate_limite=params.populate_limite
+        self.historique_taille=params.historique
+
+        # Manage logging
+        logging.basicConfig(format='%(levelname)s: %(message)s', level=logging.DEBUG if self.verbose else logging.INFO)
+
+    def info(self,message):
+        logging.info(message)
+
+    def error(self,message):
+        logging.error(message)
@@ -0,0 +1,136 @@
+import bisect
+import numpy as np
+
+"""
+La classe ParetoToolsGP implémente le classement multi-objectif de NSGA-II, vectorisé avec NumPy.
+Tous les objectifs sont à minimiser (par exemple l'erreur et la longueur du génome).
+
+Méthodes
+	rangs        : tri rapide par non-domination.
+	               Deux objectifs : les points distincts sont parcourus par ordre lexicographique ; un point
+	               n'est dominé que par des points qui le précèdent, et son front est le premier dont le plus
+	               petit second objectif lui est strictement supérieur (recherche dichotomique) : O(n log n).
+	               Au-delà : le nombre de dominants de chaque individu est compté par blocs de lignes
+	               (matrices de domination de taille bloc x n), puis les fronts sont retirés un à un en
+	               décomptant les individus qu'ils dominent. Mémoire en O(bloc x n).
+	encombrement : distance d'encombrement (crowding distance) de chaque individu dans son front,
+	               calculée pour tous les fronts à la fois (un tri par objectif).
+	selection    : indices des individus conservés, par rang puis par distance d'encombrement décroissante.
+	               Les doublons (mêmes objectifs qu'un individu déjà retenu) passent après tous les individus
+	               distincts : sans cela, les copies d'un petit individu envahissent les premiers fronts.
+"""
+
+class ParetoToolsGP():
+
+    TAILLE_BLOC = 512
+
+    def domine(objectifs_a, objectifs_b):
+        """
+        Matrice de domination : domine[i, j] est vrai si l'individu i de objectifs_a domine l'individu j de objectifs_b
+        (meilleur ou égal sur tous les objectifs, strictement meilleur sur au moins un).
+        Args:
+            objectifs_a (np.ndarray): Objectifs (na, m).
+            objectifs_b (np.ndarray): Objectifs (nb, m).
+        Returns:
+            np.ndarray: Matrice booléenne (na, nb).
+        """
+        a = objectifs_a[:, None, :]
+        b = objectifs_b[None, :, :]
+        return np.all(a <= b, axis=2) & np.any(a < b, axis=2)
+
+    def rangs(objectifs):
+        """
+        Tri rapide par non-domination.
+        Args:
+            objectifs (np.ndarray): Objectifs (n, m), à minimiser.
+        Returns:
+            np.ndarray: Rang (numéro de front, 0 pour le front de Pareto) de chaque individu.
+        """
+        objectifs = np.asarray(objectifs, dtype=np.float64)
+        if objectifs.shape[1] == 2:
+            return ParetoToolsGP.rangs_2d(objectifs)
+        n = len(objectifs)
+        dominants = np.zeros(n, dtype=np.int64)           # Nombre d'individus qui dominent chaque individu
+        for debut in range(0, n, ParetoToolsGP.TAILLE_BLOC):
+            dominants += ParetoToolsGP.domine(objectifs[debut:debut+ParetoToolsGP.TAILLE_BLOC], objectifs).sum(axis=0)
+
+        rangs = np.full(n, -1, dtype=np.int64)
+        front = np.flatnonzero(dominants == 0)
+        rang = 0
+        while len(front) > 0:
+            rangs[front] = rang
+            for debut in range(0, len(front), ParetoToolsGP.TAILLE_BLOC):
+                dominants -= ParetoToolsGP.domine(objectifs[front[debut:debut+ParetoToolsGP.TAILLE_BLOC]], objectifs).sum(axis=0)
+            dominants[front] = -1                          # Individus déjà classés
+            front = np.flatnonzero(dominants == 0)
+            rang += 1
+        return rangs
+
+    def rangs_2d(objectifs):
+        """
+        Tri par non-domination pour deux objectifs, en O(n log n).
+        Args:
+            objectifs (np.ndarray): Objectifs (n, 2), à minimiser.
+        Returns:
+            np.ndarray: Rang de chaque individu.
+        """
+        distincts, inverse = np.unique(objectifs, axis=0, return_inverse=True)   # Tri lexicographique des points distincts
+        rangs_distincts = np.empty(len(distincts), dtype=np.int64)
+        minimums = []                                  # Plus petit second objectif de chaque front
+        for i, valeur in enumerate(distincts[:, 1].tolist()):
+            rang = bisect.bisect_right(minimums, valeur)
+            if rang == len(minimums):
+                minimums.append(valeur)
+            else:
+                minimums[rang] = valeur
+            rangs_distincts[i] = rang
+        return rangs_distincts[inverse.reshape(-1)]
+
+    def encombrement(objectifs, rangs):
+        """
+        Distance d'encombrement de chaque individu dans son front : somme, sur les objectifs, de l'écart
+        entre ses deux voisins rapporté à l'étendue du front. Les extrémités de chaque front ont une distance infinie.
+        Args:
+            objectifs (np.ndarray): Objectifs (n, m).
+            rangs (np.ndarray): Rang de chaque individu (cf rangs).
+        Returns:
+            np.ndarray: Distance d'encombrement de chaque individu.
+        """
+        objectifs = np.asarray(objectifs, dtype=np.float64)
+        n = len(objectifs)
+        distances = np.zeros(n)
+        if n == 0:
+            return distances
+        for k in range(objectifs.shape[1]):
+            ordre = np.lexsort((objectifs[:, k], rangs))      # Tri par front, puis par valeur de l'objectif
+            valeurs = objectifs[ordre, k]
+            rangs_tries = rangs[ordre]
+            debuts = np.flatnonzero(np.r_[True, rangs_tries[1:] != rangs_tries[:-1]])
+            fins = np.r_[debuts[1:], n] - 1
+            tailles = fins - debuts + 1
+            etendues = np.repeat(valeurs[fins] - valeurs[debuts], tailles)
+
+            ecarts = np.zeros(n)
+            ecarts[1:-1] = valeurs[2:] - valeurs[:-2]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ecarts = np.where(etendues > 0, ecarts / etendues, 0.0)
+            ecarts[debuts] = np.inf
+            ecarts[fins] = np.inf
+            distances[ordre] += ecarts
+        return distances
+
+    def selection(objectifs, nombre):
+        """
+        Sélection NSGA-II : les fronts sont retenus dans l'ordre, et le dernier front retenu est départagé
+        par distance d'encombrement décroissante. Les doublons d'objectifs ne sont retenus qu'en dernier.
+        Args:
+            objectifs (np.ndarray): Objectifs (n, m).
+            nombre (int): Nombre d'individus à conserver.
+        Returns:
+            np.ndarray: Indices des individus conservés.
+        """
+        rangs = ParetoToolsGP.rangs(objectifs)
+        distances = ParetoToolsGP.encombrement(objectifs, rangs)
+        doublons = np.ones(len(rangs), dtype=bool)
+        doublons[np.unique(np.asarray(objectifs), axis=0, return_index=True)[1]] = False
+        return np.lexsort((-distances, rangs, doublons))[:nombre]
@@ -0,0 +1,123 @@
+import fnmatch
+import numpy as np
+
+from tools.mathsToolsGP import MathsToolsGP
+from tools.samplerToolsGP import SamplerToolsGP
+
+"""
+La classe ProblemesToolsGP regroupe des problèmes de régression symbolique de référence, avec leur
+jeu d'apprentissage : formule cible, variables, bornes et échantillonnage.
+
+Familles
+	koza      : Koza-1 à Koza-3 (polynômes d'une variable).
+	nguyen    : Nguyen-1 à Nguyen-12 (Nguyen-9 à Nguyen-12 : deux variables x, y).
+	keijzer   : Keijzer-1, 4, 7, 8 (une variable), 10 à 15 (deux variables x, y).
+	pagie     : Pagie-1 (deux variables x, y).
+	multi     : Vladislavleva-4, Korns-1, Korns-2, Friedman-1 (cinq variables x0 à x4).
+
+Échantillonnage
+	U[a, b, n] : n points tirés uniformément dans [a, b] sur chaque axe (uniform).
+	E[a, b, h] : grille régulière de pas h sur chaque axe, extrémités comprises (grid).
+Le jeu d'apprentissage est tiré avec une graine fixe : il est le même pour toutes les exécutions.
+
+Les formules utilisent les fonctions de MathsToolsGP (e : exponentielle, ln : logarithme népérien).
+Le mode indique celui de MainGP qui correspond au nombre de variables : run (x), 2d (x, y), multi (x0, x1, ...).
+"""
+
+class ProblemesToolsGP():
+
+    GRAINE_ECHANTILLON = 1    # Graine du tirage des jeux d'apprentissage
+
+    PROBLEMES = {
+        'koza-1':          {'formule': "x**4+x**3+x**2+x",                   'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'koza-2':          {'formule': "x**5-2*x**3+x",                      'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'koza-3':          {'formule': "x**6-2*x**4+x**2",                   'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-1':        {'formule': "x**3+x**2+x",                        'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-2':        {'formule': "x**4+x**3+x**2+x",                   'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-3':        {'formule': "x**5+x**4+x**3+x**2+x",              'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-4':        {'formule': "x**6+x**5+x**4+x**3+x**2+x",         'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-5':        {'formule': "sin(x**2)*cos(x)-1",                 'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-6':        {'formule': "sin(x)+sin(x+x**2)",                 'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-7':        {'formule': "ln(x+1)+ln(x**2+1)",                 'mode': "run",   'bornes': [(0, 2)],  'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-8':        {'formule': "sqrt(x)",                            'mode': "run",   'bornes': [(0, 4)],  'echantillonnage': "uniform", 'nb_points': 20},
+        'nguyen-9':        {'formule': "sin(x)+sin(y**2)",                   'mode': "2d",    'bornes': [(0, 1)],  'echantillonnage': "uniform", 'nb_points': 100},
+        'nguyen-10':       {'formule': "2*sin(x)*cos(y)",                    'mode': "2d",    'bornes': [(0, 1)],  'echantillonnage': "uniform", 'nb_points': 100},
+        'nguyen-11':       {'formule': "x**y",                               'mode': "2d",    'bornes': [(0, 1)],  'echantillonnage': "uniform", 'nb_points': 100},
+        'nguyen-12':       {'formule': "x**4-x**3+y**2/2-y",                 'mode': "2d",    'bornes': [(0, 1)],  'echantillonnage': "uniform", 'nb_points': 100},
+        'keijzer-1':       {'formule': "0.3*x*sin(2*3.141592653589793*x)",   'mode': "run",   'bornes': [(-1, 1)], 'echantillonnage': "grid",    'pas': 0.1},
+        'keijzer-4':       {'formule': "x**3*e(-x)*cos(x)*sin(x)*(sin(x)**2*cos(x)-1)", 'mode': "run", 'bornes': [(0, 10)], 'echantillonnage': "grid", 'pas': 0.05},
+        'keijzer-7':       {'formule': "ln(x)",                              'mode': "run",   'bornes': [(1, 100)], 'echantillonnage': "grid",   'pas': 1},
+        'keijzer-8':       {'formule': "sqrt(x)",                            'mode': "run",   'bornes': [(0, 100)], 'echantillonnage': "grid",   'pas': 1},
+        'keijzer-10':      {'formule': "x**y",                               'mode': "2d",    'bornes': [(0, 1)],  'echantillonnage': "uniform", 'nb_points': 100},
+        'keijzer-11':      {'formule': "x*y+sin((x-1)*(y-1))",               'mode': "2d",    'bornes': [(-3, 3)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'keijzer-12':      {'formule': "x**4-x**3+y**2/2-y",                 'mode': "2d",    'bornes': [(-3, 3)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'keijzer-13':      {'formule': "6*sin(x)*cos(y)",                    'mode': "2d",    'bornes': [(-3, 3)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'keijzer-14':      {'formule': "8/(2+x**2+y**2)",                    'mode': "2d",    'bornes': [(-3, 3)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'keijzer-15':      {'formule': "x**3/5+y**3/2-y-x",                  'mode': "2d",    'bornes': [(-3, 3)], 'echantillonnage': "uniform", 'nb_points': 20},
+        'pagie-1':         {'formule': "1/(1+x**-4)+1/(1+y**-4)",            'mode': "2d",    'bornes': [(-5, 5)], 'echantillonnage': "grid",    'pas': 0.4},
+        'vladislavleva-4': {'formule': "10/(5+(x0-3)**2+(x1-3)**2+(x2-3)**2+(x3-3)**2+(x4-3)**2)", 'mode': "multi", 'nb_variables': 5,
+                            'bornes': [(0.05, 6.05)], 'echantillonnage': "uniform", 'nb_points': 1024},
+        'korns-1':         {'formule': "1.57+24.3*x3",                       'mode': "multi", 'nb_variables': 5, 'bornes': [(-50, 50)], 'echantillonnage': "uniform", 'nb_points': 10000},
+        'korns-2':         {'formule': "0.23+14.2*(x3+x1)/(3*x4)",           'mode': "multi", 'nb_variables': 5, 'bornes': [(-50, 50)], 'echantillonnage': "uniform", 'nb_points': 10000},
+        'friedman-1':      {'formule': "10*sin(3.141592653589793*x0*x1)+20*(x2-0.5)**2+10*x3+5*x4", 'mode': "multi", 'nb_variables': 5,
+                            'bornes': [(0, 1)], 'echantillonnage': "uniform", 'nb_points': 500},
+    }
+
+    def noms(motifs="*"):
+        """
+        Noms des problèmes correspondant à des motifs.
+        Args:
+            motifs (str): Motifs séparés par des virgules ("*" : tous, "nguyen-*", "koza-1,keijzer-4", ...).
+        Returns:
+            list: Noms des problèmes, dans l'ordre du catalogue.
+        """
+        motifs = [motif.strip().lower() for motif in motifs.split(',') if motif.strip() != ""]
+        return [nom for nom in ProblemesToolsGP.PROBLEMES if any(fnmatch.fnmatch(nom, motif) for motif in motifs)]
+
+    def probleme(nom):
+        """
+        Description d'un problème.
+        Args:
+            nom (str): Nom du problème (cf PROBLEMES).
+        Returns:
+            dict: Formule, mode, bornes et échantillonnage.
+        """
+        if nom.lower() not in ProblemesToolsGP.PROBLEMES:
+            raise ValueError("Problème inconnu : "+str(nom))
+        return ProblemesToolsGP.PROBLEMES[nom.lower()]
+
+    def variables(nom):
+        """
+        Noms des variables d'un problème, dans l'ordre des colonnes des entrées.
+        Returns:
+            list: ['x'], ['x', 'y'] ou ['x0', 'x1', ...].
+        """
+        probleme = ProblemesToolsGP.probleme(nom)
+        if probleme['mode'] == "2d":
+            return ['x', 'y']
+        elif probleme['mode'] == "multi":
+            return ["x"+str(k) for k in range(probleme['nb_variables'])]
+        return ['x']
+
+    def echantillonne(nom):
+        """
+        Jeu d'apprentissage d'un problème (graine fixe). Les points où la formule n'est pas définie sont écartés.
+        Args:
+            nom (str): Nom du problème.
+        Returns:
+            np.ndarray: Entrées (n,) pour une variable, (n, d) sinon.
+            np.ndarray: Sorties (n,).
+        """
+        probleme = ProblemesToolsGP.probleme(nom)
+        variables = ProblemesToolsGP.variables(nom)
+        bornes = (list(probleme['bornes']) * len(variables))[:len(variables)]
+        if probleme['echantillonnage'] == SamplerToolsGP.SAMPLER_GRID:
+            points_par_axe = [int(round((fin - debut) / probleme['pas'])) + 1 for debut, fin in bornes]
+            inputs = SamplerToolsGP.grille(np.asarray(bornes, dtype=float), 0, points_par_axe)
+        else:
+            inputs = SamplerToolsGP.echantillonne(probleme['echantillonnage'], bornes, probleme['nb_points'],
+                                                  seed=ProblemesToolsGP.GRAINE_ECHANTILLON)
+        if len(variables) == 1:
+            inputs = inputs.reshape(-1)
+        outputs, masque = MathsToolsGP.evaluate_formule_vect(probleme['formule'], inputs, variables)
+        return inputs[masque], outputs[masque]
@@ -0,0 +1,94 @@
+import io
+import cProfile
+import pstats
+import tracemalloc
+
+"""
+La classe ProfilToolsGP exécute une fonction sous profilage et écrit, à partir d'une base de nom de fichier,
+un rapport trié lisible et les mesures brutes.
+
+Modes
+	cpu   : cProfile (profilage déterministe de chaque appel de fonction).
+	        <base>_cpu.txt  : fonctions triées par temps cumulé, puis par temps propre (NB_LIGNES premières).
+	        <base>_cpu.prof : statistiques brutes (pstats, snakeviz, gprof2dot).
+	alloc : tracemalloc (allocations mémoire Python, NB_CADRES niveaux de pile par allocation).
+	        <base>_alloc.txt      : mémoire courante et pic, puis lignes de code et piles d'appels triées par
+	                                taille allouée encore en mémoire en fin d'exécution.
+	        <base>_alloc.snapshot : instantané brut (tracemalloc.Snapshot.load).
+
+Seule la fonction passée est profilée : l'analyse des arguments, les imports (PyQt5 compris) et la
+préparation des données restent en dehors des mesures. cProfile ne mesure que le thread appelant :
+la fonction doit donc être exécutée dans le thread à profiler.
+"""
+
+class ProfilToolsGP():
+
+    PROFIL_CPU   = "cpu"
+    PROFIL_ALLOC = "alloc"
+
+    NB_LIGNES = 50    # Nombre d'entrées des rapports
+    NB_CADRES = 10    # Niveaux de pile conservés par allocation (tracemalloc)
+
+    def execute(mode, fonction, base):
+        """
+        Exécute une fonction, sous profilage si un mode est donné.
+        Args:
+            mode (str): Mode de profilage (cpu, alloc, "" : aucun).
+            fonction (callable): Fonction à exécuter, sans argument.
+            base (str): Base des noms des fichiers produits.
+        Returns:
+            Résultat de la fonction.
+        """
+        if mode == ProfilToolsGP.PROFIL_CPU:
+            return ProfilToolsGP.profile_cpu(fonction, base)
+        elif mode == ProfilToolsGP.PROFIL_ALLOC:
+            return ProfilToolsGP.profile_alloc(fonction, base)
+        return fonction()
+
+    def profile_cpu(fonction, base):
+        """
+        Exécute une fonction sous cProfile, puis écrit le rapport et les statistiques brutes
+        (y compris si la fonction lève une exception).
+        """
+        profil = cProfile.Profile()
+        profil.enable()
+        try:
+            return fonction()
+        finally:
+            profil.disable()
+            profil.dump_stats(base + "_cpu.prof")
+            rapport = io.StringIO()
+            stats = pstats.Stats(profil, stream=rapport)
+            stats.sort_stats('cumulative').print_stats(ProfilToolsGP.NB_LIGNES)
+            stats.sort_stats('tottime').print_stats(ProfilToolsGP.NB_LIGNES)
+            with open(base + "_cpu.txt", 'w') as file:
+                file.write(rapport.getvalue())
+
+    def profile_alloc(fonction, base):
+        """
+        Exécute une fonction sous tracemalloc, puis écrit le rapport et l'instantané brut
+        (y compris si la fonction lève une exception). Un suivi tracemalloc déjà actif est conservé.
+        """
+        deja_actif = tracemalloc.is_tracing()
+        if not deja_actif:
+            tracemalloc.start(ProfilToolsGP.NB_CADRES)
+        tracemalloc.reset_peak()
+        try:
+            return fonction()
+        finally:
+            instantane = tracemalloc.take_snapshot()
+            courant, pic = tracemalloc.get_traced_memory()
+            if not deja_actif:
+                tracemalloc.stop()
+            instantane.dump(base + "_alloc.snapshot")
+            instantane = instantane.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+            with open(base + "_alloc.txt", 'w') as file:
+                file.write("Mémoire courante : %.1f Kio, pic : %.1f Kio\n" % (courant / 1024, pic / 1024))
+                file.write("\nPar ligne de code\n")
+                for stat in instantane.statistics('lineno')[:ProfilToolsGP.NB_LIGNES]:
+                    file.write(str(stat) + "\n")
+                file.write("\nPar pile d'appels\n")
+                for stat in instantane.statistics('traceback')[:ProfilToolsGP.NB_LIGNES // 5]:
+                    file.write("%.1f Kio en %d blocs\n" % (stat.size / 1024, stat.count))
+                    for ligne in stat.traceback.format():
+                        file.write("    " + ligne + "\n")
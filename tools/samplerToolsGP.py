@@ -0,0 +1,117 @@
+import numpy as np
+
+"""
+La classe SamplerToolsGP génère les points d'entrée en plusieurs dimensions, avec un budget
+de points fixe qui ne croît pas exponentiellement avec la dimension.
+
+Échantillonneurs disponibles
+	grid    : grille régulière ; le nombre de points par axe est soit donné axe par axe, soit déduit
+	          du budget (partie entière de nb_points^(1/d)).
+	uniform : tirage uniforme indépendant dans le pavé défini par les bornes.
+	lhs     : hypercube latin : chaque axe est découpé en nb_points intervalles, chacun contenant un point.
+	halton  : suite à faible discrépance de Halton (bases premières), couvrant l'espace plus
+	          régulièrement qu'un tirage uniforme.
+
+Les bornes sont données axe par axe sous forme de couples (min, max).
+"""
+
+class SamplerToolsGP():
+
+    SAMPLER_GRID    = "grid"
+    SAMPLER_UNIFORM = "uniform"
+    SAMPLER_LHS     = "lhs"
+    SAMPLER_HALTON  = "halton"
+
+    PREMIERS = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+    def echantillonne(mode, bornes, nb_points, points_par_axe=None, seed=0):
+        """
+        Génère les points d'entrée.
+        Args:
+            mode (str): Échantillonneur (grid, uniform, lhs, halton).
+            bornes (list): Liste de couples (min, max), un par axe.
+            nb_points (int): Budget de points.
+            points_par_axe (list): Nombre de points par axe pour la grille (None : déduit du budget).
+            seed (int): Graine du générateur aléatoire (0 : non déterministe).
+        Returns:
+            np.ndarray: Points d'entrée de forme (n, d).
+        """
+        bornes = np.asarray(bornes, dtype=float).reshape(-1, 2)
+        dimension = len(bornes)
+        rng = np.random.RandomState(seed if seed != 0 else None)
+
+        if mode == SamplerToolsGP.SAMPLER_GRID:
+            return SamplerToolsGP.grille(bornes, nb_points, points_par_axe)
+        elif mode == SamplerToolsGP.SAMPLER_UNIFORM:
+            unitaire = rng.random_sample((nb_points, dimension))
+        elif mode == SamplerToolsGP.SAMPLER_LHS:
+            unitaire = SamplerToolsGP.hypercube_latin(nb_points, dimension, rng)
+        elif mode == SamplerToolsGP.SAMPLER_HALTON:
+            unitaire = SamplerToolsGP.halton(nb_points, dimension)
+        else:
+            raise ValueError("Échantillonneur inconnu : "+str(mode))
+        return bornes[:, 0] + unitaire * (bornes[:, 1] - bornes[:, 0])
+
+    def grille(bornes, nb_points, points_par_axe=None):
+        """
+        Grille régulière (extrémités comprises).
+        Args:
+            bornes (np.ndarray): Bornes (d, 2).
+            nb_points (int): Budget de points, utilisé si points_par_axe n'est pas donné.
+            points_par_axe (list): Nombre de points par axe.
+        Returns:
+            np.ndarray: Points (n, d).
+        """
+        dimension = len(bornes)
+        if not points_par_axe:
+            k = max(2, int(np.floor(nb_points ** (1.0/dimension) + 1e-9)))
+            points_par_axe = [k] * dimension
+        elif len(points_par_axe) < dimension:
+            points_par_axe = list(points_par_axe) + [points_par_axe[-1]] * (dimension - len(points_par_axe))
+        axes = [np.linspace(bornes[k, 0], bornes[k, 1], points_par_axe[k]) for k in range(dimension)]
+        return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, dimension)
+
+    def hypercube_latin(nb_points, dimension, rng):
+        """
+        Hypercube latin dans [0, 1[^d.
+        Returns:
+            np.ndarray: Points (n, d).
+        """
+        strates = np.argsort(rng.random_sample((dimension, nb_points)), axis=1).T
+        return (strates + rng.random_sample((nb_points, dimension))) / nb_points
+
+    def halton(nb_points, dimension):
+        """
+        Suite de Halton dans [0, 1[^d (le point d'indice 0, à l'origine, est omis).
+        Returns:
+            np.ndarray: Points (n, d).
+        """
+        if dimension > len(SamplerToolsGP.PREMIERS):
+            raise ValueError("Suite de Halton limitée à "+str(len(SamplerToolsGP.PREMIERS))+" dimensions")
+        indices = np.arange(1, nb_points+1)
+        points = np.zeros((nb_points, dimension))
+        for k in range(dimension):
+            base = SamplerToolsGP.PREMIERS[k]
+            reste = indices.copy()
+            facteur = 1.0 / base
+            while np.any(reste > 0):
+                points[:, k] += (reste % base) * facteur
+                reste //= base
+                facteur /= base
+        return points
+
+    def lit_bornes(texte, dimension, defaut):
+        """
+        Lit des bornes au format "min:max,min:max,...". Une seule borne s'applique à tous les axes ;
+        s'il y a moins de bornes que d'axes, la dernière est répétée.
+        Args:
+            texte (str): Bornes au format texte ("" : bornes par défaut).
+            dimension (int): Nombre d'axes.
+            defaut (tuple): Borne (min, max) utilisée si texte est vide.
+        Returns:
+            list: Liste de couples (min, max), un par axe.
+        """
+        bornes = [tuple(float(val) for val in item.split(':')) for item in texte.split(',') if item.strip() != ""]
+        if len(bornes) == 0:
+            bornes = [defaut]
+        return (bornes + [bornes[-1]] * dimension)[:dimension]